@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the Excel quote exporters
+Measures export time and peak memory at 10, 100 and 1,000 line items
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+from exporters import ExcelExporter, StreamingExcelExporter
+from file_parsers import ExcelParser
+
+ITEM_COUNTS = [10, 100, 1000]
+RUNS = 3
+
+SAMPLE_XLSX = 'ehOnline-Shop_2061348427.xlsx'
+
+def build_line_items(item_count):
+    """item_count E+H line items cycled from the sample export.
+
+    Each copy gets its own order code, as in a real basket, so the rows do
+    not all share the two sample items' cached descriptions and row heights.
+    """
+    sample = ExcelParser().parse(SAMPLE_XLSX)
+    return [
+        dict(sample[i % len(sample)], item_number=str(i + 1),
+             order_code=f"{sample[i % len(sample)]['order_code']} #{i + 1}")
+        for i in range(item_count)
+    ]
+
+def build_quote_data(item_count):
+    """Quote data with item_count line items from the sample export"""
+    return {
+        'quote_number': 'ENETK-BENCH',
+        'quote_date': '2025-01-15',
+        'project_name': 'Exporter Benchmark',
+        'customer_company': 'Kinder Morgan',
+        'contact_person': 'Benchmark Contact',
+        'phone': '(713) 369-9000',
+        'email': 'bench@kindermorgan.com',
+        'customer_ref': 'KM-BENCH',
+        'bill_to': '1001 Louisiana St\nHouston, TX 77002',
+        'ship_to': 'Site Warehouse\nPasadena, TX 77506',
+        'markup_percentage': 20.0,
+        'lead_time_value': 4,
+        'lead_time_unit': 'Weeks',
+        'quote_expiration_date': '02/15/2025',
+        'line_items': build_line_items(item_count)
+    }
+
+def measure(exporter_class, quote_data, output_path):
+    """Return (best export seconds, peak traced memory bytes) for one exporter"""
+    best = None
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        exporter_class().export_quote(quote_data, output_path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        exporter_class().export_quote(quote_data, output_path)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+def main():
+    """Run the benchmark"""
+    print("📊 Excel exporter benchmark")
+    print("=" * 60)
+    print(f"{'Exporter':<24}{'Items':>8}{'Time':>12}{'Peak memory':>16}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, 'quote.xlsx')
+        for exporter_class in (ExcelExporter, StreamingExcelExporter):
+            for item_count in ITEM_COUNTS:
+                quote_data = build_quote_data(item_count)
+                seconds, peak = measure(exporter_class, quote_data, output_path)
+                print(f"{exporter_class.__name__:<24}{item_count:>8}{seconds * 1000:>10.0f}ms{peak / 1024 / 1024:>14.1f}MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark for RTF text extraction
+Compares the previous full-document re.sub passes with the streaming rtf_reader
+on the E+H sample quote scaled up 100x
+"""
+
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+
+from rtf_reader import read_rtf_lines
+
+SAMPLE_RTF = 'ehOnline-Shop_2061348427.rtf'
+COPIES = 100
+RUNS = 3
+
+def build_large_rtf(path, copies):
+    """Write an RTF document holding `copies` copies of the sample quote"""
+    with open(SAMPLE_RTF, 'r', encoding='latin-1') as file:
+        content = file.read()
+    with open(path, 'w', encoding='latin-1', newline='') as file:
+        file.write('{\\rtf1 \\ansi ')
+        for _ in range(copies):
+            file.write(content)
+        file.write('}')
+
+def legacy_lines(path):
+    """The previous quote_generator extraction: whole file, three re.sub passes"""
+    with open(path, 'r', encoding='latin-1') as file:
+        content = file.read()
+    text_content = re.sub(r'\\[a-z]+\d*', '', content)
+    text_content = re.sub(r'[{}]', '', text_content)
+    text_content = re.sub(r'\\[^a-z]', '', text_content)
+    return [line.strip() for line in text_content.split('\n') if line.strip()]
+
+def streaming_lines(path):
+    """Plain text lines from the streaming reader"""
+    return [line.strip() for line in read_rtf_lines(path) if line.strip()]
+
+def measure(extract, path):
+    """Return (best seconds, peak traced memory bytes, lines) for one extractor"""
+    best = None
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        lines = extract(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        extract(path)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak, lines
+
+def main():
+    """Run the benchmark"""
+    print("📊 RTF text extraction benchmark")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'large.rtf')
+        build_large_rtf(path, COPIES)
+        size = os.path.getsize(path)
+        print(f"Document: {SAMPLE_RTF} x{COPIES} ({size / 1024 / 1024:.1f}MB)")
+        print(f"{'Extractor':<12}{'Time':>12}{'Peak memory':>16}{'Lines':>10}{'Leftover codes':>18}")
+
+        for name, extract in (('re.sub', legacy_lines), ('streaming', streaming_lines)):
+            seconds, peak, lines = measure(extract, path)
+            leftovers = sum(1 for line in lines if re.search(r"\\|\b[0-9a-f]{32,}\b|\b3f", line))
+            print(f"{name:<12}{seconds * 1000:>10.0f}ms{peak / 1024 / 1024:>14.1f}MB{len(lines):>10}{leftovers:>18}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark for exporter text cleanup
+Compares the previous replace()-per-character loops with the shared cleanup tables
+"""
+
+import re
+import timeit
+
+from exporters import ExcelExporter, PDFExporter, PDF_REPLACEMENTS, describe_item
+from file_parsers import ExcelParser, RTFParser
+
+SAMPLE_FILES = [
+    (ExcelParser, 'ehOnline-Shop_2061348427.xlsx'),
+    (RTFParser, 'ehOnline-Shop_2061348427.rtf'),
+]
+NUMBER = 2000
+
+def legacy_soft_breaks(s):
+    """ExcelExporter._soft_breaks before SOFT_BREAKS"""
+    if not s:
+        return s
+    for ch in ['/', '-', '_', ':', '(', ')', '+', '=']:
+        s = s.replace(ch, ch + '\u200b')
+    return s
+
+def legacy_sanitize_for_pdf(s):
+    """PDFExporter._sanitize_for_pdf before the ASCII encode"""
+    if not s:
+        return s
+    for k, v in PDF_REPLACEMENTS.items():
+        s = s.replace(k, v)
+    return re.sub(r'[^\x20-\x7E\n\r\t]', '', s)
+
+def load_texts():
+    """Configuration strings and description parts from the sample exports"""
+    configs, parts = [], []
+    for parser_class, path in SAMPLE_FILES:
+        for item in parser_class().parse(path):
+            if item.get('config'):
+                configs.append(item['config'])
+            parts.extend(describe_item(item))
+    return configs, parts
+
+def bench(func, texts):
+    """Best microseconds per string over three runs"""
+    best = min(timeit.repeat(lambda: [func(t) for t in texts], number=NUMBER, repeat=3))
+    return best / NUMBER / len(texts) * 1e6
+
+def main():
+    """Run the benchmark"""
+    configs, parts = load_texts()
+    soft_breaks = ExcelExporter()._soft_breaks
+    sanitize = PDFExporter()._sanitize_for_pdf
+
+    for texts in (configs, parts):
+        assert [soft_breaks(t) for t in texts] == [legacy_soft_breaks(t) for t in texts]
+        assert [sanitize(t) for t in texts] == [legacy_sanitize_for_pdf(t) for t in texts]
+
+    print("📊 Text cleanup benchmark")
+    print("=" * 60)
+    print(f"{len(configs)} configuration strings, average {sum(map(len, configs)) // len(configs)} chars")
+    print(f"{len(parts)} description parts, average {sum(map(len, parts)) // len(parts)} chars")
+    print(f"{'Function':<22}{'Texts':<14}{'Before':>10}{'After':>10}{'Speedup':>10}")
+    for name, legacy, current in (
+        ('_soft_breaks', legacy_soft_breaks, soft_breaks),
+        ('_sanitize_for_pdf', legacy_sanitize_for_pdf, sanitize),
+    ):
+        for label, texts in (('config', configs), ('parts', parts)):
+            before = bench(legacy, texts)
+            after = bench(current, texts)
+            print(f"{name:<22}{label:<14}{before:>8.2f}us{after:>8.2f}us{before / after:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark for XML basket line item extraction
+Compares the previous find()-per-field lookups with the compiled ExtractionPlan
+"""
+
+import timeit
+import xml.etree.ElementTree as ET
+
+from quote_generator import XMLParser, ExtractionPlan
+
+SAMPLE_XML = 'ehOnline-Shop_20250905-160419.xml'
+NS = XMLParser.NAMESPACES
+
+# The find() calls the old XMLParser made for every bas:item, in order:
+# (element the lookup ran on, path)
+LEGACY_LOOKUPS = [
+    ('item', 'bas:itemNo'),
+    ('item', 'bas:product'),
+    ('product', 'bas:materialNo'),
+    ('product', 'bas:orderCode'),
+    ('product', 'bas:texts'),
+    ('texts', 'bas:shortDescription[@language="en"]'),
+    ('texts', 'bas:longDescription[@language="en"]'),
+    ('product', 'bas:quantity'),
+    ('item', 'bas:itemPricing'),
+    ('pricing', 'bas:unitSalesPrice'),
+    ('pricing', 'bas:itemSalesPrice'),
+]
+
+class CountingPlan(ExtractionPlan):
+    """ExtractionPlan that counts child elements inspected"""
+
+    def __init__(self, paths, namespaces):
+        super().__init__(paths, namespaces)
+        self.inspected = 0
+
+    def _walk(self, element, node, found):
+        self.inspected += len(element)
+        super()._walk(element, node, found)
+
+def legacy_parse_item(item):
+    """The previous per-field find() extraction for one bas:item"""
+    line_item = {}
+    item_no = item.find('bas:itemNo', NS)
+    if item_no is not None:
+        line_item['item_number'] = item_no.text
+    product = item.find('bas:product', NS)
+    if product is not None:
+        material_no = product.find('bas:materialNo', NS)
+        if material_no is not None:
+            line_item['material_number'] = material_no.text
+        order_code = product.find('bas:orderCode', NS)
+        if order_code is not None:
+            line_item['order_code'] = order_code.text
+        texts = product.find('bas:texts', NS)
+        if texts is not None:
+            short_desc = texts.find('bas:shortDescription[@language="en"]', NS)
+            if short_desc is not None:
+                line_item['description'] = short_desc.text
+            long_desc = texts.find('bas:longDescription[@language="en"]', NS)
+            if long_desc is not None:
+                line_item['long_description'] = long_desc.text
+        quantity = product.find('bas:quantity', NS)
+        if quantity is not None:
+            line_item['quantity'] = int(quantity.text)
+            line_item['unit'] = quantity.get('unit', 'PC')
+    item_pricing = item.find('bas:itemPricing', NS)
+    if item_pricing is not None:
+        unit_price = item_pricing.find('bas:unitSalesPrice', NS)
+        if unit_price is not None:
+            line_item['unit_price'] = float(unit_price.text)
+        item_price = item_pricing.find('bas:itemSalesPrice', NS)
+        if item_price is not None:
+            line_item['total_price'] = float(item_price.text)
+    return line_item
+
+def legacy_inspected(item):
+    """Count child elements find() scans for one item (first match stops the scan)"""
+    parents = {
+        'item': item,
+        'product': item.find('bas:product', NS),
+        'texts': item.find('bas:product/bas:texts', NS),
+        'pricing': item.find('bas:itemPricing', NS),
+    }
+    inspected = 0
+    for parent_name, path in LEGACY_LOOKUPS:
+        parent = parents[parent_name]
+        target = parent.find(path, NS)
+        for child in parent:
+            inspected += 1
+            if child is target:
+                break
+    return inspected
+
+def main():
+    """Run the benchmark"""
+    print("📊 XML line item extraction benchmark")
+    print("=" * 60)
+
+    root = ET.parse(SAMPLE_XML).getroot()
+    items = root.findall('bas:item', NS)
+
+    plan = CountingPlan([path for path, _, _ in XMLParser.ITEM_FIELDS], NS)
+    for item in items:
+        plan.extract(item)
+
+    legacy_lookups = sum(legacy_inspected(item) for item in items) / len(items)
+    plan_lookups = plan.inspected / len(items)
+
+    print(f"Items in sample basket:        {len(items)}")
+    print(f"Path resolutions per item:     {len(LEGACY_LOOKUPS)} (find) vs 0 (plan)")
+    print(f"Elements inspected per item:   {legacy_lookups:.0f} (find) vs {plan_lookups:.0f} (plan)")
+
+    for item in items:
+        assert legacy_parse_item(item) == XMLParser._parse_item(item)
+
+    runs = 2000
+    legacy_time = timeit.timeit(lambda: [legacy_parse_item(item) for item in items], number=runs)
+    plan_time = timeit.timeit(lambda: [XMLParser._parse_item(item) for item in items], number=runs)
+    per_item = runs * len(items)
+
+    print(f"Time per item (find):          {legacy_time / per_item * 1e6:.1f} us")
+    print(f"Time per item (plan):          {plan_time / per_item * 1e6:.1f} us")
+
+if __name__ == "__main__":
+    main()
@@ -68,7 +68,18 @@ a = Analysis(
         'os',
         'file_parsers',
         'exporters',
-        'dialogs'
+        'dialogs',
+        'pricing',
+        'line_item',
+        'line_item_model',
+        'import_worker',
+        'export_worker',
+        'rtf_reader',
+        'parse_cache',
+        'queue',
+        'threading',
+        'multiprocessing',
+        'concurrent.futures'
     ],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,27 @@
+"""
+Pytest configuration for the Desktop Quote Generator tests
+Keeps the shared parse cache out of the user's home directory
+"""
+
+import os
+
+import pytest
+
+import parse_cache
+
+@pytest.fixture(autouse=True, scope='session')
+def isolated_parse_cache(tmp_path_factory):
+    """Point the shared parse cache and any new ParseCache at a temporary directory"""
+    directory = str(tmp_path_factory.mktemp('parse_cache'))
+    previous_env = os.environ.get('EH_QUOTE_PARSE_CACHE')
+    previous_directory = parse_cache.parse_cache.directory
+    
+    os.environ['EH_QUOTE_PARSE_CACHE'] = directory
+    parse_cache.parse_cache.directory = directory
+    yield directory
+    
+    parse_cache.parse_cache.directory = previous_directory
+    if previous_env is None:
+        del os.environ['EH_QUOTE_PARSE_CACHE']
+    else:
+        os.environ['EH_QUOTE_PARSE_CACHE'] = previous_env
@@ -20,8 +20,18 @@ from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 import base64
 from io import BytesIO
+import difflib
+import multiprocessing
+from line_item_model import LineItemModel
+from line_item import LineItem
 
 class DesktopQuoteGenerator:
+    # How often the Tk loop checks the import worker for new batches
+    IMPORT_POLL_MS = 50
+    
+    # How often the Tk loop checks the export worker for finished files
+    EXPORT_POLL_MS = 100
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("ENETK & EH Systems - Quote Generator")
@@ -55,6 +65,18 @@ class DesktopQuoteGenerator:
             'quote_expiration_date': ''
         }
         
+        # Line items with running totals and cached display rows
+        self.items_model = LineItemModel(self.quote_data['line_items'], self.quote_data['markup_percentage'])
+        self.preview_lines = []
+        
+        # Background file import in progress, if any, and the items it
+        # has parsed so far; they replace the quote only once it succeeds
+        self.import_worker = None
+        self.import_pending = []
+        
+        # Background Excel + PDF export in progress, if any
+        self.export_worker = None
+        
         self.create_gui()
     
     def setup_styling(self):
@@ -347,6 +369,8 @@ class DesktopQuoteGenerator:
                   command=self.generate_excel_quote, style='Success.TButton').pack(side='left', padx=(0, 10))
         ttk.Button(export_frame, text="Generate PDF Quote", 
                   command=self.generate_pdf_quote, style='Success.TButton').pack(side='left', padx=(0, 10))
+        ttk.Button(export_frame, text="Generate Excel + PDF", 
+                  command=self.generate_all_quotes, style='Success.TButton').pack(side='left', padx=(0, 10))
         ttk.Button(export_frame, text="Update Preview", 
                   command=self.update_preview, style='Primary.TButton').pack(side='left', padx=(0, 10))
     
@@ -388,6 +412,11 @@ class DesktopQuoteGenerator:
         # Item count
         self.item_count_label = ttk.Label(self.status_frame, text="Items: 0", style='Info.TLabel')
         self.item_count_label.pack(side='right')
+        
+        # Import progress (shown only while an import is running)
+        self.import_cancel_button = ttk.Button(self.status_frame, text="Cancel",
+                                               command=self.cancel_import, style='Danger.TButton')
+        self.import_progress = ttk.Progressbar(self.status_frame, mode='determinate', length=200)
     
     def update_status(self, message, style='Info.TLabel'):
         """Update status message"""
@@ -426,7 +455,7 @@ class DesktopQuoteGenerator:
             self.quote_data['quote_expiration_date'] = expiration_date_str
             
             self.update_status(f"Expiration date calculated: {expiration_date_str}", 'Success.TLabel')
-            
+        
         except ValueError as e:
             self.update_status(f"Error calculating expiration date: {str(e)}", 'Error.TLabel')
             messagebox.showerror("Error", f"Invalid date format or expiration days. Please check your inputs.\nError: {str(e)}")
@@ -472,8 +501,7 @@ class DesktopQuoteGenerator:
             }
         ]
         
-        for item in sample_items:
-            self.add_item_to_tree(item)
+        self.add_items_to_tree(sample_items)
         
         self.update_item_count()
         self.update_preview()
@@ -515,70 +543,105 @@ class DesktopQuoteGenerator:
             self.import_file(file_path, 'csv')
     
     def import_file(self, file_path, file_type):
-        """Import file and parse data"""
+        """Import file and parse data on a background thread"""
+        if self.import_worker:
+            messagebox.showwarning("Import Running", "Please wait for the current import to finish or cancel it.")
+            return
+        
         try:
-            from file_parsers import get_parser
+            from import_worker import ImportWorker
             
-            parser = get_parser(file_path)
-            items = parser.parse(file_path)
-            
-            if not items:
-                messagebox.showwarning("Import Warning", "No items found in the file.")
+            worker = ImportWorker(file_path)
+        except Exception as e:
+            messagebox.showerror("Import Error", f"Error importing file: {str(e)}")
+            self.update_status("Import failed", 'Error.TLabel')
+            return
+        
+        self.import_worker = worker
+        self.import_pending = []
+        self.import_file_type = file_type
+        self.import_progress.config(value=0, maximum=1)
+        self.import_progress.pack(side='right', padx=(0, 10))
+        self.import_cancel_button.pack(side='right', padx=(0, 10))
+        self.update_status(f"Importing {file_type.upper()} file...")
+        
+        worker.start()
+        self.root.after(self.IMPORT_POLL_MS, self.poll_import)
+    
+    def poll_import(self):
+        """Apply messages from the import worker; runs on the Tk thread"""
+        worker = self.import_worker
+        if worker is None:
+            return
+        
+        for message in worker.poll():
+            kind = message[0]
+            if kind == 'batch':
+                _, items, done, total = message
+                self.import_pending.extend(items)
+                self.import_progress.config(value=done, maximum=max(total, 1))
+                self.update_status(f"Importing {self.import_file_type.upper()} file... {done}/{total} rows")
+            else:
+                self.finish_import(kind, message[1])
                 return
-            
+        
+        self.root.after(self.IMPORT_POLL_MS, self.poll_import)
+    
+    def finish_import(self, outcome, detail):
+        """Hide import progress and report how the import ended"""
+        self.import_worker = None
+        self.import_progress.pack_forget()
+        self.import_cancel_button.pack_forget()
+        file_type = self.import_file_type.upper()
+        items, self.import_pending = self.import_pending, []
+        
+        if outcome == 'done' and detail:
             # Clear existing items
             self.clear_all_items()
             
             # Add imported items
-            for item in items:
-                self.add_item_to_tree(item)
-            
-            self.update_status(f"Imported {len(items)} items from {file_type.upper()} file", 'Success.TLabel')
-            self.update_item_count()
-            self.update_preview()
+            self.add_items_to_tree(items)
             
-        except Exception as e:
-            messagebox.showerror("Import Error", f"Error importing file: {str(e)}")
+            self.update_status(f"Imported {detail} items from {file_type} file", 'Success.TLabel')
+        elif outcome == 'done':
+            messagebox.showwarning("Import Warning", "No items found in the file.")
+            self.update_status("Ready")
+        elif outcome == 'cancelled':
+            self.update_status(f"Import cancelled after reading {detail} items; quote unchanged", 'Info.TLabel')
+        else:
+            messagebox.showerror("Import Error", f"Error importing file: {detail}")
             self.update_status("Import failed", 'Error.TLabel')
+        
+        self.update_item_count()
+        self.update_preview()
+    
+    def cancel_import(self):
+        """Stop the running import after its current batch"""
+        if self.import_worker:
+            self.import_worker.cancel()
+            self.update_status("Cancelling import...")
     
     def add_item_to_tree(self, item):
         """Add item to the tree view"""
-        markup = self.markup_var.get() / 100
-        TAX_RATE = 0.08
-        unit_price = float(item.get('unit_price', 0))
-        quantity = int(item.get('quantity', 1))
-        price_with_tax = unit_price * (1 + TAX_RATE)
-        quoted_price = price_with_tax * (1 + markup)
-        total_price = quoted_price * quantity
-        
-        # Create description with model and order code
-        description = item.get('description', '')
-        if item.get('model'):
-            description += f" | Model: {item['model']}"
-        if item.get('order_code'):
-            description += f" | Code: {item['order_code']}"
-        
-        values = (
-            len(self.quote_data['line_items']) + 1,
-            description,
-            quantity,
-            item.get('unit', 'EA'),
-            f"${quoted_price:.2f}",
-            f"${total_price:.2f}"
-        )
-        
-        self.items_tree.insert('', 'end', values=values)
-        
-        # Add to quote data
-        self.quote_data['line_items'].append({
-            'description': item.get('description', ''),
-            'model': item.get('model', ''),
-            'order_code': item.get('order_code', ''),
-            'quantity': quantity,
-            'unit': item.get('unit', 'EA'),
-            'unit_price': unit_price,
-            'config': item.get('config', '')
-        })
+        self.add_items_to_tree([item])
+    
+    def add_items_to_tree(self, items):
+        """Add items to the quote and the tree view, pricing them together"""
+        new_items = []
+        for item in items:
+            new_items.append(LineItem(
+                description=item.get('description', ''),
+                model=item.get('model', ''),
+                order_code=item.get('order_code', ''),
+                quantity=item.get('quantity', 1),
+                unit=item.get('unit', 'EA'),
+                unit_price=item.get('unit_price', 0),
+                config=item.get('config', '')
+            ))
+        
+        start = self.items_model.extend(new_items)
+        for index in range(start, len(self.items_model)):
+            self.items_tree.insert('', 'end', values=self.items_model.tree_values(index))
     
     def add_item_dialog(self):
         """Show add item dialog"""
@@ -600,8 +663,7 @@ class DesktopQuoteGenerator:
             return
         
         # Get selected item data
-        item = self.items_tree.item(selection[0])
-        item_index = int(item['values'][0]) - 1
+        item_index = self.items_tree.index(selection[0])
         
         if item_index < len(self.quote_data['line_items']):
             item_data = self.quote_data['line_items'][item_index]
@@ -611,9 +673,9 @@ class DesktopQuoteGenerator:
             self.root.wait_window(dialog.dialog)
             
             if dialog.result:
-                # Update the item
-                self.quote_data['line_items'][item_index] = dialog.result
-                self.refresh_items_tree()
+                # Update the item and its row only
+                self.items_model.replace(item_index, dialog.result)
+                self.items_tree.item(selection[0], values=self.items_model.tree_values(item_index))
                 self.update_preview()
     
     def remove_item(self):
@@ -624,57 +686,42 @@ class DesktopQuoteGenerator:
             return
         
         if messagebox.askyesno("Confirm Removal", "Are you sure you want to remove this item?"):
-            item = self.items_tree.item(selection[0])
-            item_index = int(item['values'][0]) - 1
+            item_index = self.items_tree.index(selection[0])
             
             if item_index < len(self.quote_data['line_items']):
-                del self.quote_data['line_items'][item_index]
-                self.refresh_items_tree()
+                self.items_model.remove(item_index)
+                self.items_tree.delete(selection[0])
+                
+                # Renumber the rows after the removed one
+                rows = self.items_tree.get_children()
+                for index in range(item_index, len(rows)):
+                    self.items_tree.set(rows[index], 'Item', index + 1)
+                
                 self.update_item_count()
                 self.update_preview()
     
     def clear_all_items(self):
         """Clear all items"""
         if messagebox.askyesno("Confirm Clear", "Are you sure you want to clear all items?"):
-            for item in self.items_tree.get_children():
-                self.items_tree.delete(item)
-            self.quote_data['line_items'] = []
+            self.items_tree.delete(*self.items_tree.get_children())
+            self.items_model.clear()
             self.update_item_count()
             self.update_preview()
     
     def refresh_items_tree(self):
         """Refresh the items tree view"""
         # Clear existing items
-        for item in self.items_tree.get_children():
-            self.items_tree.delete(item)
-        
-        # Re-add all items
-        for i, item in enumerate(self.quote_data['line_items'], 1):
-            markup = self.markup_var.get() / 100
-            TAX_RATE = 0.08
-            unit_price = float(item.get('unit_price', 0))
-            quantity = int(item.get('quantity', 1))
-            price_with_tax = unit_price * (1 + TAX_RATE)
-            quoted_price = price_with_tax * (1 + markup)
-            total_price = quoted_price * quantity
-            
-            # Create description
-            description = item.get('description', '')
-            if item.get('model'):
-                description += f" | Model: {item['model']}"
-            if item.get('order_code'):
-                description += f" | Code: {item['order_code']}"
-            
-            values = (
-                i,
-                description,
-                quantity,
-                item.get('unit', 'EA'),
-                f"${quoted_price:.2f}",
-                f"${total_price:.2f}"
-            )
-            
-            self.items_tree.insert('', 'end', values=values)
+        self.items_tree.delete(*self.items_tree.get_children())
+        
+        # Re-add all items from the cached rows
+        for index in range(len(self.items_model)):
+            self.items_tree.insert('', 'end', values=self.items_model.tree_values(index))
+    
+    def update_tree_rows(self, indexes):
+        """Update the tree view rows at the given item indexes"""
+        rows = self.items_tree.get_children()
+        for index in indexes:
+            self.items_tree.item(rows[index], values=self.items_model.tree_values(index))
     
     def safe_update_preview(self):
         """Safely update preview with error handling"""
@@ -705,34 +752,47 @@ class DesktopQuoteGenerator:
             self.quote_data['markup_percentage'] = float(self.markup_var.get()) if self.markup_var.get() else 20.0
         except (ValueError, TypeError):
             self.quote_data['markup_percentage'] = 20.0
-            
+        
         try:
             self.quote_data['tax_percentage'] = float(self.tax_var.get()) if self.tax_var.get() else 8.0
         except (ValueError, TypeError):
             self.quote_data['tax_percentage'] = 8.0
         
+        # Reprice for the current markup, updating only rows whose prices changed
+        self.update_tree_rows(self.items_model.set_markup(self.quote_data['markup_percentage']))
+        
         # Generate preview text
         preview_text = self.generate_preview_text()
         
         # Update preview
-        self.preview_text.delete('1.0', 'end')
-        self.preview_text.insert('1.0', preview_text)
+        self.render_preview(preview_text)
+    
+    def render_preview(self, preview_text):
+        """Rewrite only the preview lines that changed since the last render"""
+        lines = preview_text.split('\n')
+        
+        # Fall back to a full rewrite on first render or if the text was edited by hand
+        rendered = self.preview_text.get('1.0', 'end-1c')
+        if not self.preview_lines or lines[-1] != '' or rendered != '\n'.join(self.preview_lines):
+            self.preview_text.delete('1.0', 'end')
+            self.preview_text.insert('1.0', preview_text)
+        else:
+            # Every line but the last ends with a newline; apply changes bottom-up
+            # so the line numbers of earlier changes stay valid
+            matcher = difflib.SequenceMatcher(None, self.preview_lines[:-1], lines[:-1], autojunk=False)
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+                if tag == 'equal':
+                    continue
+                self.preview_text.delete(f'{i1 + 1}.0', f'{i2 + 1}.0')
+                self.preview_text.insert(f'{i1 + 1}.0', ''.join(line + '\n' for line in lines[j1:j2]))
+        
+        self.preview_lines = lines
     
     def generate_preview_text(self):
         """Generate preview text for the quote"""
-        markup = self.quote_data['markup_percentage'] / 100
-        TAX_RATE = 0.08
-        
-        # Calculate totals
-        subtotal = 0
-        for item in self.quote_data['line_items']:
-            unit_price = float(item.get('unit_price', 0))
-            quantity = float(item.get('quantity', 1))
-            price_with_tax = unit_price * (1 + TAX_RATE)
-            quoted_price = price_with_tax * (1 + markup)
-            subtotal += quoted_price * quantity
-        
-        total = subtotal
+        # Running totals from the line item model
+        subtotal = self.items_model.subtotal
+        total = self.items_model.total
         
         preview = f"""
 ENETK & EH SYSTEMS - QUOTE PREVIEW
@@ -757,16 +817,8 @@ LINE ITEMS:
 {'-'*80}
 """
         
-        for i, item in enumerate(self.quote_data['line_items'], 1):
-            unit_price = float(item.get('unit_price', 0))
-            quantity = float(item.get('quantity', 1))
-            price_with_tax = unit_price * (1 + TAX_RATE)
-            quoted_price = price_with_tax * (1 + markup)
-            total_price = quoted_price * quantity
-            
-            description = item.get('description', '')[:35] + '...' if len(item.get('description', '')) > 35 else item.get('description', '')
-            
-            preview += f"{i:<5} {description:<40} {int(quantity):<5} {item.get('unit', 'EA'):<5} ${quoted_price:<11.2f} ${total_price:<11.2f}\n"
+        # Cached item lines
+        preview += ''.join(line + '\n' for line in self.items_model.preview_lines())
         
         preview += f"""
 {'-'*80}
@@ -803,7 +855,7 @@ Quote Valid Until: {self.quote_data.get('quote_expiration_date', 'TBD')}
                 
                 messagebox.showinfo("Success", f"Excel quote generated successfully!\nSaved as: {file_path}")
                 self.update_status("Excel quote generated", 'Success.TLabel')
-                
+            
             except Exception as e:
                 messagebox.showerror("Export Error", f"Error generating Excel quote: {str(e)}")
                 self.update_status("Excel export failed", 'Error.TLabel')
@@ -829,16 +881,74 @@ Quote Valid Until: {self.quote_data.get('quote_expiration_date', 'TBD')}
                 
                 messagebox.showinfo("Success", f"PDF quote generated successfully!\nSaved as: {file_path}")
                 self.update_status("PDF quote generated", 'Success.TLabel')
-                
+            
             except Exception as e:
                 messagebox.showerror("Export Error", f"Error generating PDF quote: {str(e)}")
                 self.update_status("PDF export failed", 'Error.TLabel')
     
+    def generate_all_quotes(self):
+        """Generate the Excel and PDF quotes together in background processes"""
+        if self.export_worker:
+            messagebox.showwarning("Export Running", "Please wait for the current export to finish.")
+            return
+        
+        if not self.quote_data['line_items']:
+            messagebox.showwarning("No Items", "Please add some line items before generating a quote.")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            title="Save Excel and PDF Quotes",
+            defaultextension=".xlsx",
+            filetypes=[("Excel Files", "*.xlsx"), ("All Files", "*.*")]
+        )
+        
+        if file_path:
+            from export_worker import ExportWorker
+            
+            base_path = os.path.splitext(file_path)[0]
+            targets = [('excel', base_path + '.xlsx'), ('pdf', base_path + '.pdf')]
+            
+            self.export_worker = ExportWorker(self.quote_data, targets).start()
+            self.export_results = []
+            self.update_status("Generating Excel and PDF quotes...")
+            self.root.after(self.EXPORT_POLL_MS, self.poll_export)
+    
+    def poll_export(self):
+        """Collect results from the export worker; runs on the Tk thread"""
+        worker = self.export_worker
+        if worker is None:
+            return
+        
+        for message in worker.poll():
+            if message[0] == 'done':
+                self.finish_export()
+                return
+            self.export_results.append(message)
+            if message[0] == 'exported':
+                self.update_status(f"{message[1].upper()} quote generated, waiting for the rest...")
+        
+        self.root.after(self.EXPORT_POLL_MS, self.poll_export)
+    
+    def finish_export(self):
+        """Report how the combined export ended"""
+        self.export_worker = None
+        saved = [file_path for kind, _, file_path in self.export_results if kind == 'exported']
+        errors = [f"{(name or 'export').upper()}: {detail}" for kind, name, detail in self.export_results if kind == 'error']
+        
+        if errors:
+            messagebox.showerror("Export Error", "Error generating quotes:\n" + "\n".join(errors))
+            self.update_status("Export failed", 'Error.TLabel')
+        else:
+            messagebox.showinfo("Success", "Excel and PDF quotes generated successfully!\nSaved as:\n" + "\n".join(saved))
+            self.update_status("Excel and PDF quotes generated", 'Success.TLabel')
+    
     def run(self):
         """Run the application"""
         self.update_preview()
         self.root.mainloop()
 
 if __name__ == "__main__":
+    # Export worker processes re-enter this script in frozen builds
+    multiprocessing.freeze_support()
     app = DesktopQuoteGenerator()
     app.run()
@@ -7,6 +7,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
 
+from line_item import LineItem
+
 class ItemDialog:
     """Dialog for adding/editing line items"""
     
@@ -123,15 +125,15 @@ class ItemDialog:
             messagebox.showerror("Error", "Quantity and Unit Price must be valid numbers!")
             return
         
-        self.result = {
-            'description': self.desc_var.get().strip(),
-            'model': self.model_var.get().strip(),
-            'order_code': self.order_code_var.get().strip(),
-            'quantity': quantity,
-            'unit': self.unit_var.get().strip(),
-            'unit_price': unit_price,
-            'config': self.config_text.get('1.0', 'end-1c').strip()
-        }
+        self.result = LineItem(
+            description=self.desc_var.get().strip(),
+            model=self.model_var.get().strip(),
+            order_code=self.order_code_var.get().strip(),
+            quantity=quantity,
+            unit=self.unit_var.get().strip(),
+            unit_price=unit_price,
+            config=self.config_text.get('1.0', 'end-1c').strip()
+        )
         
         self.dialog.destroy()
     
@@ -0,0 +1,82 @@
+"""
+Background quote export for the Desktop Quote Generator
+Writes the Excel and PDF quotes at the same time in worker processes
+"""
+
+import copy
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+def export_excel(quote_data, file_path):
+    """Write the Excel quote; runs in a worker process"""
+    from exporters import ExcelExporter
+    ExcelExporter().export_quote(quote_data, file_path)
+    return file_path
+
+def export_pdf(quote_data, file_path):
+    """Write the PDF quote; runs in a worker process"""
+    from exporters import PDFExporter
+    PDFExporter().export_quote(quote_data, file_path)
+    return file_path
+
+EXPORTERS = {
+    'excel': export_excel,
+    'pdf': export_pdf,
+}
+
+class ExportWorker:
+    """Export one quote to several formats in parallel processes.
+    
+    quote_data is deep-copied when the worker is created, so edits made in
+    the UI while files are being written do not leak into them. Each target
+    is exported in its own process (reportlab and openpyxl are CPU bound
+    and would otherwise share one GIL). A coordinating thread puts messages
+    on `messages` for the UI thread to poll with root.after():
+        
+        ('exported', kind, file_path)
+        ('error', kind, message)
+        ('done', exported_count)
+    
+    'done' is always sent last.
+    """
+    
+    def __init__(self, quote_data, targets):
+        self.snapshot = copy.deepcopy(quote_data)
+        self.targets = list(targets)
+        self.messages = queue.Queue()
+        self.thread = threading.Thread(target=self.run, name='quote-export', daemon=True)
+    
+    def start(self):
+        """Start exporting in the background"""
+        self.thread.start()
+        return self
+    
+    def run(self):
+        """Coordinating thread body"""
+        count = 0
+        try:
+            with ProcessPoolExecutor(max_workers=len(self.targets)) as executor:
+                futures = {
+                    executor.submit(EXPORTERS[kind], self.snapshot, file_path): kind
+                    for kind, file_path in self.targets
+                }
+                for future in as_completed(futures):
+                    kind = futures[future]
+                    try:
+                        self.messages.put(('exported', kind, future.result()))
+                        count += 1
+                    except Exception as e:
+                        self.messages.put(('error', kind, str(e)))
+        except Exception as e:
+            self.messages.put(('error', None, str(e)))
+        self.messages.put(('done', count))
+    
+    def poll(self):
+        """Return all messages queued so far without blocking"""
+        messages = []
+        while True:
+            try:
+                messages.append(self.messages.get_nowait())
+            except queue.Empty:
+                return messages
@@ -6,19 +6,218 @@ Handles Excel and PDF quote generation
 import openpyxl
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import coordinate_from_string, column_index_from_string, range_boundaries
+from openpyxl.cell import WriteOnlyCell
 from reportlab.lib.pagesizes import letter, A4
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+from reportlab.platypus import SimpleDocTemplate, BaseDocTemplate, PageTemplate, Frame, Table, TableStyle, Paragraph, Spacer, Image
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from datetime import datetime
+from functools import lru_cache
+from collections import OrderedDict
+from copy import deepcopy
+from xml.sax.saxutils import escape
+from operator import attrgetter
 import os
+import re
+import codecs
 import base64
+from pricing import price_line_items
+from line_item import LineItem
+
+# Line item fields that make up the rendered description
+DESCRIPTION_FIELDS = (
+    'description', 'model', 'sales_text', 'delivery_time',
+    'order_code', 'config', 'country_origin', 'country_dispatch'
+)
+_description_fields = attrgetter(*DESCRIPTION_FIELDS)
+
+# Text cleanup tables, built once and shared by the exporters
+
+# Excel: zero-width space after common separators so long codes can wrap
+SOFT_BREAKS = tuple((ch, ch + '\u200b') for ch in '/-_:()+=')
+
+# PDF: characters that render as black squares in the built-in fonts
+PDF_REPLACEMENTS = {
+    '\u200b': '',      # zero-width space
+    '\ufeff': '',      # BOM
+    '\u00a0': ' ',     # NBSP -> space
+    '\u25a0': '',      # ■ black square -> remove
+    '\u2022': '* ',    # • bullet -> ASCII bullet
+    '\u2018': "'", '\u2019': "'",  # curly quotes -> straight
+    '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '-', '\u2212': '-',  # dashes -> hyphen
+    '\u2026': '...',    # ellipsis
+    '\u2122': ' TM', '\u00ae': ' (R)',
+    '\u00b0': ' degrees',   # degree symbol
+}
+# ASCII control characters other than tab and newlines
+PDF_CONTROL_BYTES = bytes(c for c in [*range(0x20), 0x7F] if c not in b'\t\n\r')
+
+def _pdf_text_errors(error):
+    """Codec error handler: replace or drop characters ASCII cannot encode"""
+    text = error.object[error.start:error.end]
+    return ''.join([PDF_REPLACEMENTS.get(ch, '') for ch in text]), error.end
+
+codecs.register_error('eh_pdf_text', _pdf_text_errors)
+
+# Excel lays out cell text at 96 DPI with whole-pixel character advances.
+# Arial shares Helvetica's metrics, which reportlab ships.
+PIXELS_PER_POINT = 96 / 72
+ZERO_WIDTH_CHARS = '\u200b\ufeff'
+# Words with the spaces or soft breaks that follow them
+_WRAP_TOKENS = re.compile(r'[^ \u200b]+[ \u200b]*|[ \u200b]+')
+
+@lru_cache(maxsize=None)
+def _char_widths(font_size):
+    """Arial pixel widths at font_size, filled in as characters are seen"""
+    return dict.fromkeys(ZERO_WIDTH_CHARS, 0)
+
+@lru_cache(maxsize=16384)
+def text_pixel_width(text, font_size):
+    """Width of text in Arial at font_size, in screen pixels"""
+    widths = _char_widths(font_size)
+    total = 0
+    for ch in text:
+        width = widths.get(ch)
+        if width is None:
+            width = widths[ch] = round(stringWidth(ch, 'Helvetica', font_size * PIXELS_PER_POINT))
+        total += width
+    return total
+
+@lru_cache(maxsize=4096)
+def wrapped_line_count(text, width, font_size):
+    """Number of lines text takes when Excel wraps it in a cell width pixels wide"""
+    lines = 0
+    for paragraph in text.split('\n'):
+        lines += 1
+        used = 0
+        for token in _WRAP_TOKENS.findall(paragraph):
+            word = token.rstrip(' \u200b')
+            word_width = text_pixel_width(word, font_size)
+            if used and used + word_width > width:
+                lines += 1
+                used = 0
+            if word_width > width:
+                # Words wider than the cell break between characters
+                extra, word_width = divmod(word_width, width)
+                lines += extra
+            used += word_width + text_pixel_width(token[len(word):], font_size)
+    return lines
+
+def price_quote(quote_data):
+    """Price a quote's line items once for every section of an export"""
+    return price_line_items(quote_data.get('line_items', []), quote_data.get('markup_percentage', 20.0))
+
+def describe_item(item):
+    """Return the description parts for a line item as a tuple of strings.
+    
+    Shared by the Excel and PDF exporters, which only join and format the
+    parts. Results are cached by the content of DESCRIPTION_FIELDS, so an
+    item is described once no matter how many formats are exported.
+    """
+    if isinstance(item, LineItem):
+        key = _description_fields(item)
+    else:
+        key = tuple(item.get(field) for field in DESCRIPTION_FIELDS)
+    try:
+        return _describe_fields(key)
+    except TypeError:
+        # Unhashable field values cannot be cached
+        return _describe_fields.__wrapped__(key)
+
+@lru_cache(maxsize=4096)
+def _describe_fields(fields):
+    """Build description parts from DESCRIPTION_FIELDS values"""
+    item = dict(zip(DESCRIPTION_FIELDS, fields))
+    description_parts = []
+    
+    # Main product name and model
+    product_name = item['description'].split('\n')[0] if item['description'] else ''
+    if product_name:
+        description_parts.append(product_name)
+    
+    # Add model number if available
+    if item['model']:
+        description_parts.append(f"Model: {item['model']}")
+    
+    # Sales text (product description)
+    if item['sales_text']:
+        description_parts.append(f"Description: {item['sales_text']}")
+    
+    # Delivery time
+    if item['delivery_time']:
+        description_parts.append(f"Delivery time: {item['delivery_time']}")
+    
+    # Order code description
+    if item['order_code']:
+        description_parts.append("Order code description:")
+        description_parts.append(item['order_code'])
+    
+    # Product configuration (consolidated with smaller font)
+    if item['config']:
+        description_parts.append("Product Configuration:")
+        # Consolidate configuration lines into single lines
+        current_line = ""
+        
+        for line in item['config'].split('  '):
+            line = line.strip()
+            if not line:
+                continue
+            
+            # If line starts with a number (like "030:"), start a new consolidated line
+            if line[0].isdigit():
+                if current_line:
+                    description_parts.append(current_line)
+                current_line = line
+            else:
+                # Append to current line with a space
+                if current_line:
+                    current_line += f" {line}"
+                else:
+                    current_line = line
+        
+        # Add the last line
+        if current_line:
+            description_parts.append(current_line)
+    
+    # Country information
+    country_info = []
+    if item['country_origin']:
+        country_info.append(f"Origin: {item['country_origin']}")
+    if item['country_dispatch']:
+        country_info.append(f"Dispatch: {item['country_dispatch']}")
+    if country_info:
+        description_parts.append("Country Information:")
+        description_parts.extend(country_info)
+    
+    return tuple(description_parts)
 
 class ExcelExporter:
     """Excel quote exporter with ENETK/EH branding"""
     
+    # Column widths for better layout
+    COLUMN_WIDTHS = {
+        'A': 8,   # Item #
+        'B': 80,  # Description (even wider for full product descriptions)
+        'C': 8,   # Qty
+        'D': 8,   # Unit
+        'E': 15,  # Unit Price
+        'F': 15   # Total Price
+    }
+    
+    # Text area of the description column in pixels: Excel column widths
+    # count digits of the default font (7px); the 5px Excel adds on top of
+    # that for the column is cell padding, not room for text
+    DESCRIPTION_WIDTH_PX = COLUMN_WIDTHS['B'] * 7
+    LINE_SPACING = 1.3       # line height relative to the font's pixel size
+    ROW_PADDING_PX = 4
+    MIN_ROW_HEIGHT = 20      # points
+    MAX_ROW_HEIGHT = 409.5   # Excel's limit, in points
+    
     def __init__(self):
         self.header_color = '8B0000'  # ENETK maroon
         self.light_color = 'F8F9FA'  # Very light gray
@@ -26,51 +225,81 @@ class ExcelExporter:
         self.text_color = '495057'   # Dark gray text
         self.border_color = 'DEE2E6'  # Light border
         self.highlight_color = 'E9ECEF'  # Highlight background
+        
+        # Shared style instances, built once per exporter
+        self.setup_styles()
     
     def _soft_breaks(self, s: str) -> str:
         """Add soft break hints for better text wrapping"""
         if not s:
             return s
         # Allow wrapping after common separators
-        for ch in ['/', '-', '_', ':', '(', ')', '+', '=']:
-            s = s.replace(ch, ch + '\u200b')  # Zero-width space
+        for ch, soft in SOFT_BREAKS:
+            if ch in s:
+                s = s.replace(ch, soft)
         return s
     
+    def text_row_height(self, text, font, width_px):
+        """Row height in points that shows text wrapped in a cell width_px wide"""
+        lines = wrapped_line_count(text, width_px, font.sz)
+        line_px = round(font.sz * PIXELS_PER_POINT * self.LINE_SPACING)
+        height = (lines * line_px + self.ROW_PADDING_PX) / PIXELS_PER_POINT
+        return min(self.MAX_ROW_HEIGHT, max(self.MIN_ROW_HEIGHT, height))
+    
     def export_quote(self, quote_data, output_path):
         """Export quote to Excel file"""
         wb = openpyxl.Workbook()
         ws = wb.active
         ws.title = "Quote"
         
-        # Set up styles
-        self.setup_styles()
+        # Set column widths for better layout
+        for col, width in self.COLUMN_WIDTHS.items():
+            ws.column_dimensions[col].width = width
         
-        # Create the quote
+        # Price the basket once for the line items and the totals
+        pricing = price_quote(quote_data)
+        
+        # Create the quote; each section sets the final alignment and height
+        # of the rows it covers
         self.create_header(ws, quote_data)
         self.create_company_info(ws, quote_data)
         self.create_quote_details(ws, quote_data)
         self.create_customer_info(ws, quote_data)
-        self.create_line_items(ws, quote_data)
-        self.create_totals(ws, quote_data)
+        self.create_line_items(ws, quote_data, pricing)
+        self.create_totals(ws, quote_data, pricing)
         self.create_terms(ws, quote_data)
         
-        # Format the worksheet
-        self.format_worksheet(ws)
-        
         # Save the file
         wb.save(output_path)
         return output_path
     
     def setup_styles(self):
-        """Setup Excel styles"""
+        """Setup Excel styles
+        
+        Every section reuses these instances instead of building its own
+        Font/PatternFill/Border objects per cell.
+        """
         self.header_font = Font(name='Arial', size=20, bold=True, color='FFFFFF')
         self.subheader_font = Font(name='Arial', size=12, bold=True)
         self.normal_font = Font(name='Arial', size=10)
         self.bold_font = Font(name='Arial', size=10, bold=True)
         
+        self.title_font = Font(name='Arial', size=18, bold=True, color=self.header_color)
+        self.tagline_font = Font(name='Arial', size=11, bold=True, color=self.accent_color)
+        self.banner_font = Font(name='Arial', size=24, bold=True, color='FFFFFF')
+        self.section_font = Font(name='Arial', size=12, bold=True, color='FFFFFF')
+        self.table_header_font = Font(name='Arial', size=11, bold=True, color='FFFFFF')
+        self.total_font = Font(name='Arial', size=14, bold=True, color='FFFFFF')
+        self.subtotal_font = Font(name='Arial', size=11, bold=True, color=self.text_color)
+        self.label_font = Font(name='Arial', size=10, bold=True, color=self.text_color)
+        self.text_font = Font(name='Arial', size=10, color=self.text_color)
+        self.small_text_font = Font(name='Arial', size=9, color=self.text_color)
+        
         self.header_fill = PatternFill(start_color=self.header_color, end_color=self.header_color, fill_type='solid')
         self.light_fill = PatternFill(start_color=self.light_color, end_color=self.light_color, fill_type='solid')
         self.accent_fill = PatternFill(start_color=self.accent_color, end_color=self.accent_color, fill_type='solid')
+        self.highlight_fill = PatternFill(start_color=self.highlight_color, end_color=self.highlight_color, fill_type='solid')
+        self.white_fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
         
         self.thin_border = Border(
             left=Side(style='thin'), right=Side(style='thin'),
@@ -80,55 +309,84 @@ class ExcelExporter:
             left=Side(style='thick'), right=Side(style='thick'),
             top=Side(style='thick'), bottom=Side(style='thick')
         )
-    
-    def create_header(self, ws, quote_data):
-        """Create quote header"""
-        # ENETK LLC branding with enhanced styling
-        ws['A1'] = 'ENETK LLC'
-        ws['A1'].font = Font(name='Arial', size=18, bold=True, color=self.header_color)
-        ws['A1'].fill = PatternFill(start_color=self.light_color, end_color=self.light_color, fill_type='solid')
-        ws['A1'].border = Border(
+        self.grid_border = Border(
+            left=Side(style='thin', color=self.border_color),
+            right=Side(style='thin', color=self.border_color),
+            top=Side(style='thin', color=self.border_color),
+            bottom=Side(style='thin', color=self.border_color)
+        )
+        self.brand_border = Border(
             left=Side(style='thick', color=self.header_color),
             right=Side(style='thick', color=self.header_color),
             top=Side(style='thick', color=self.header_color),
             bottom=Side(style='thick', color=self.header_color)
         )
-        ws.merge_cells('A1:F1')
+        
+        # Text wraps in every cell of the sheet; cells without a specific
+        # alignment, blank ones included, use wrap_alignment
+        self.center_alignment = Alignment(wrap_text=True, vertical='center', horizontal='center')
+        self.right_alignment = Alignment(wrap_text=True, vertical='center', horizontal='right')
+        self.wrap_alignment = Alignment(wrap_text=True, vertical='top', horizontal='left')
+        self.description_alignment = self.wrap_alignment
+        self.terms_alignment = self.wrap_alignment
+    
+    def fill_row(self, ws, row, height=20):
+        """Finish a row: blank cells get wrap_alignment, and a height if it has none"""
+        for column in range(1, len(self.COLUMN_WIDTHS) + 1):
+            cell = ws.cell(row=row, column=column)
+            if not cell.has_style:
+                cell.alignment = self.wrap_alignment
+        if ws.row_dimensions[row].height is None:
+            ws.row_dimensions[row].height = height
+    
+    def merge_row(self, ws, row):
+        """Merge a row across the sheet; the merged cells get wrap_alignment"""
+        ws.merge_cells(f'A{row}:{get_column_letter(len(self.COLUMN_WIDTHS))}{row}')
+        for column in range(2, len(self.COLUMN_WIDTHS) + 1):
+            ws.cell(row=row, column=column).alignment = self.wrap_alignment
+    
+    def create_header(self, ws, quote_data):
+        """Create quote header"""
+        # ENETK LLC branding with enhanced styling
+        ws['A1'] = 'ENETK LLC'
+        ws['A1'].font = self.title_font
+        ws['A1'].fill = self.light_fill
+        ws['A1'].alignment = self.wrap_alignment
+        ws['A1'].border = self.brand_border
+        self.merge_row(ws, 1)
         ws.row_dimensions[1].height = 35
         
         ws['A2'] = 'PLC AUTOMATION & INTEGRATION'
-        ws['A2'].font = Font(name='Arial', size=11, bold=True, color=self.accent_color)
-        ws['A2'].fill = PatternFill(start_color=self.light_color, end_color=self.light_color, fill_type='solid')
-        ws.merge_cells('A2:F2')
+        ws['A2'].font = self.tagline_font
+        ws['A2'].fill = self.light_fill
+        ws['A2'].alignment = self.wrap_alignment
+        self.merge_row(ws, 2)
         ws.row_dimensions[2].height = 25
         
         ws['A3'] = '11085 32E ST SW'
-        ws['A3'].font = Font(name='Arial', size=10, color=self.text_color)
-        ws['A3'].fill = PatternFill(start_color=self.light_color, end_color=self.light_color, fill_type='solid')
-        ws.merge_cells('A3:F3')
+        ws['A3'].font = self.text_font
+        ws['A3'].fill = self.light_fill
+        ws['A3'].alignment = self.wrap_alignment
+        self.merge_row(ws, 3)
         ws.row_dimensions[3].height = 20
         
         ws['A4'] = 'DICKINSON ND 58601-7810'
-        ws['A4'].font = Font(name='Arial', size=10, color=self.text_color)
-        ws['A4'].fill = PatternFill(start_color=self.light_color, end_color=self.light_color, fill_type='solid')
-        ws.merge_cells('A4:F4')
+        ws['A4'].font = self.text_font
+        ws['A4'].fill = self.light_fill
+        ws['A4'].alignment = self.wrap_alignment
+        self.merge_row(ws, 4)
         ws.row_dimensions[4].height = 20
         
         # Spacer
-        ws.row_dimensions[5].height = 10
+        self.fill_row(ws, 5, height=10)
         
         # Main title with enhanced styling
         ws['A6'] = 'QUOTE'
-        ws['A6'].font = Font(name='Arial', size=24, bold=True, color='FFFFFF')
-        ws['A6'].fill = PatternFill(start_color=self.header_color, end_color=self.header_color, fill_type='solid')
-        ws['A6'].alignment = Alignment(horizontal='center', vertical='center')
-        ws['A6'].border = Border(
-            left=Side(style='thick', color=self.header_color),
-            right=Side(style='thick', color=self.header_color),
-            top=Side(style='thick', color=self.header_color),
-            bottom=Side(style='thick', color=self.header_color)
-        )
-        ws.merge_cells('A6:F6')
+        ws['A6'].font = self.banner_font
+        ws['A6'].fill = self.header_fill
+        ws['A6'].alignment = self.center_alignment
+        ws['A6'].border = self.brand_border
+        self.merge_row(ws, 6)
         ws.row_dimensions[6].height = 45
     
     def create_company_info(self, ws, quote_data):
@@ -146,45 +404,39 @@ class ExcelExporter:
             ('Customer Ref:', quote_data.get('customer_ref', ''))
         ]
         
+        # Spacer
+        self.fill_row(ws, 7)
+        
         for i, (label, value) in enumerate(quote_details, 8):
             # Label styling
             ws[f'D{i}'] = label
-            ws[f'D{i}'].font = Font(name='Arial', size=10, bold=True, color=self.text_color)
-            ws[f'D{i}'].fill = PatternFill(start_color=self.highlight_color, end_color=self.highlight_color, fill_type='solid')
-            ws[f'D{i}'].border = Border(
-                left=Side(style='thin', color=self.border_color),
-                right=Side(style='thin', color=self.border_color),
-                top=Side(style='thin', color=self.border_color),
-                bottom=Side(style='thin', color=self.border_color)
-            )
+            ws[f'D{i}'].font = self.label_font
+            ws[f'D{i}'].fill = self.highlight_fill
+            ws[f'D{i}'].alignment = self.wrap_alignment
+            ws[f'D{i}'].border = self.grid_border
             
             # Value styling
             ws[f'E{i}'] = value
-            ws[f'E{i}'].font = Font(name='Arial', size=10, color=self.text_color)
-            ws[f'E{i}'].fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-            ws[f'E{i}'].border = Border(
-                left=Side(style='thin', color=self.border_color),
-                right=Side(style='thin', color=self.border_color),
-                top=Side(style='thin', color=self.border_color),
-                bottom=Side(style='thin', color=self.border_color)
-            )
+            ws[f'E{i}'].font = self.text_font
+            ws[f'E{i}'].fill = self.white_fill
+            ws[f'E{i}'].alignment = self.wrap_alignment
+            ws[f'E{i}'].border = self.grid_border
+            self.fill_row(ws, i)
     
     def create_customer_info(self, ws, quote_data):
         """Create customer information section"""
         start_row = 13
         
+        # Spacer
+        self.fill_row(ws, start_row - 1)
+        
         # Customer Information header with enhanced styling
         ws[f'A{start_row}'] = 'CUSTOMER INFORMATION'
-        ws[f'A{start_row}'].font = Font(name='Arial', size=12, bold=True, color='FFFFFF')
-        ws[f'A{start_row}'].fill = PatternFill(start_color=self.header_color, end_color=self.header_color, fill_type='solid')
-        ws[f'A{start_row}'].alignment = Alignment(horizontal='center', vertical='center')
-        ws[f'A{start_row}'].border = Border(
-            left=Side(style='thick', color=self.header_color),
-            right=Side(style='thick', color=self.header_color),
-            top=Side(style='thick', color=self.header_color),
-            bottom=Side(style='thick', color=self.header_color)
-        )
-        ws.merge_cells(f'A{start_row}:F{start_row}')
+        ws[f'A{start_row}'].font = self.section_font
+        ws[f'A{start_row}'].fill = self.header_fill
+        ws[f'A{start_row}'].alignment = self.center_alignment
+        ws[f'A{start_row}'].border = self.brand_border
+        self.merge_row(ws, start_row)
         ws.row_dimensions[start_row].height = 30
         
         # Customer details with enhanced styling
@@ -198,178 +450,80 @@ class ExcelExporter:
         for i, (label, value) in enumerate(customer_fields, start_row + 1):
             # Label styling
             ws[f'A{i}'] = label
-            ws[f'A{i}'].font = Font(name='Arial', size=10, bold=True, color=self.text_color)
-            ws[f'A{i}'].fill = PatternFill(start_color=self.highlight_color, end_color=self.highlight_color, fill_type='solid')
-            ws[f'A{i}'].border = Border(
-                left=Side(style='thin', color=self.border_color),
-                right=Side(style='thin', color=self.border_color),
-                top=Side(style='thin', color=self.border_color),
-                bottom=Side(style='thin', color=self.border_color)
-            )
+            ws[f'A{i}'].font = self.label_font
+            ws[f'A{i}'].fill = self.highlight_fill
+            ws[f'A{i}'].alignment = self.wrap_alignment
+            ws[f'A{i}'].border = self.grid_border
             
             # Value styling
             ws[f'B{i}'] = value
-            ws[f'B{i}'].font = Font(name='Arial', size=10, color=self.text_color)
-            ws[f'B{i}'].fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-            ws[f'B{i}'].border = Border(
-                left=Side(style='thin', color=self.border_color),
-                right=Side(style='thin', color=self.border_color),
-                top=Side(style='thin', color=self.border_color),
-                bottom=Side(style='thin', color=self.border_color)
-            )
+            ws[f'B{i}'].font = self.text_font
+            ws[f'B{i}'].fill = self.white_fill
+            ws[f'B{i}'].alignment = self.wrap_alignment
+            ws[f'B{i}'].border = self.grid_border
+            self.fill_row(ws, i)
         
         # Address information with enhanced styling
         address_row = start_row + 5
         ws[f'A{address_row}'] = 'Bill To:'
-        ws[f'A{address_row}'].font = Font(name='Arial', size=10, bold=True, color=self.text_color)
-        ws[f'A{address_row}'].fill = PatternFill(start_color=self.highlight_color, end_color=self.highlight_color, fill_type='solid')
-        ws[f'A{address_row}'].border = Border(
-            left=Side(style='thin', color=self.border_color),
-            right=Side(style='thin', color=self.border_color),
-            top=Side(style='thin', color=self.border_color),
-            bottom=Side(style='thin', color=self.border_color)
-        )
+        ws[f'A{address_row}'].font = self.label_font
+        ws[f'A{address_row}'].fill = self.highlight_fill
+        ws[f'A{address_row}'].alignment = self.wrap_alignment
+        ws[f'A{address_row}'].border = self.grid_border
         ws[f'B{address_row}'] = quote_data.get('bill_to', '')
-        ws[f'B{address_row}'].font = Font(name='Arial', size=10, color=self.text_color)
-        ws[f'B{address_row}'].fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-        ws[f'B{address_row}'].alignment = Alignment(wrap_text=True, vertical='top')
-        ws[f'B{address_row}'].border = Border(
-            left=Side(style='thin', color=self.border_color),
-            right=Side(style='thin', color=self.border_color),
-            top=Side(style='thin', color=self.border_color),
-            bottom=Side(style='thin', color=self.border_color)
-        )
+        ws[f'B{address_row}'].font = self.text_font
+        ws[f'B{address_row}'].fill = self.white_fill
+        ws[f'B{address_row}'].alignment = self.wrap_alignment
+        ws[f'B{address_row}'].border = self.grid_border
         
         ws[f'D{address_row}'] = 'Ship To:'
-        ws[f'D{address_row}'].font = Font(name='Arial', size=10, bold=True, color=self.text_color)
-        ws[f'D{address_row}'].fill = PatternFill(start_color=self.highlight_color, end_color=self.highlight_color, fill_type='solid')
-        ws[f'D{address_row}'].border = Border(
-            left=Side(style='thin', color=self.border_color),
-            right=Side(style='thin', color=self.border_color),
-            top=Side(style='thin', color=self.border_color),
-            bottom=Side(style='thin', color=self.border_color)
-        )
+        ws[f'D{address_row}'].font = self.label_font
+        ws[f'D{address_row}'].fill = self.highlight_fill
+        ws[f'D{address_row}'].alignment = self.wrap_alignment
+        ws[f'D{address_row}'].border = self.grid_border
         ws[f'E{address_row}'] = quote_data.get('ship_to', '')
-        ws[f'E{address_row}'].font = Font(name='Arial', size=10, color=self.text_color)
-        ws[f'E{address_row}'].fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-        ws[f'E{address_row}'].alignment = Alignment(wrap_text=True, vertical='top')
-        ws[f'E{address_row}'].border = Border(
-            left=Side(style='thin', color=self.border_color),
-            right=Side(style='thin', color=self.border_color),
-            top=Side(style='thin', color=self.border_color),
-            bottom=Side(style='thin', color=self.border_color)
-        )
+        ws[f'E{address_row}'].font = self.text_font
+        ws[f'E{address_row}'].fill = self.white_fill
+        ws[f'E{address_row}'].alignment = self.wrap_alignment
+        ws[f'E{address_row}'].border = self.grid_border
+        self.fill_row(ws, address_row)
     
-    def create_line_items(self, ws, quote_data):
-        """Create line items table"""
+    def create_line_items(self, ws, quote_data, pricing):
+        """Create line items table from the export's pricing"""
         start_row = 20
         
+        # Spacer
+        self.fill_row(ws, start_row - 1)
+        
         # Table headers with enhanced styling
         headers = ['Item #', 'Description', 'Qty', 'Unit', 'Unit Price', 'Total Price']
         for i, header in enumerate(headers, 1):
             cell = ws.cell(row=start_row, column=i)
             cell.value = header
-            cell.font = Font(name='Arial', size=11, bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color=self.header_color, end_color=self.header_color, fill_type='solid')
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = Border(
-                left=Side(style='thick', color=self.header_color),
-                right=Side(style='thick', color=self.header_color),
-                top=Side(style='thick', color=self.header_color),
-                bottom=Side(style='thick', color=self.header_color)
-            )
+            cell.font = self.table_header_font
+            cell.fill = self.header_fill
+            cell.alignment = self.center_alignment
+            cell.border = self.brand_border
         ws.row_dimensions[start_row].height = 35
         
         # Line items
-        markup = quote_data.get('markup_percentage', 20.0) / 100
+        line_items = quote_data.get('line_items', [])
         current_row = start_row + 1
         
-        for i, item in enumerate(quote_data.get('line_items', []), 1):
+        for i, (item, (quoted_price, total_price)) in enumerate(zip(line_items, pricing), 1):
             # Alternating row colors
             is_even_row = (i % 2 == 0)
-            row_fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid') if not is_even_row else PatternFill(start_color=self.light_color, end_color=self.light_color, fill_type='solid')
+            row_fill = self.white_fill if not is_even_row else self.light_fill
             
             # Item number
             item_cell = ws.cell(row=current_row, column=1, value=i)
-            item_cell.font = Font(name='Arial', size=10, bold=True, color=self.text_color)
+            item_cell.font = self.label_font
             item_cell.fill = row_fill
-            item_cell.alignment = Alignment(horizontal='center', vertical='center')
-            item_cell.border = Border(
-                left=Side(style='thin', color=self.border_color),
-                right=Side(style='thin', color=self.border_color),
-                top=Side(style='thin', color=self.border_color),
-                bottom=Side(style='thin', color=self.border_color)
-            )
+            item_cell.alignment = self.center_alignment
+            item_cell.border = self.grid_border
             
             # Create clean, professional description formatting
-            description_parts = []
-            
-            # Main product name and model
-            product_name = item.get('description', '').split('\n')[0] if item.get('description') else ''
-            if product_name:
-                description_parts.append(product_name)
-            
-            # Add model number if available
-            if item.get('model'):
-                description_parts.append(f"Model: {item['model']}")
-            
-            # Sales text (product description)
-            if item.get('sales_text'):
-                description_parts.append(f"Description: {item['sales_text']}")
-            
-            # Delivery time
-            if item.get('delivery_time'):
-                description_parts.append(f"Delivery time: {item['delivery_time']}")
-            
-            # Order code description
-            if item.get('order_code'):
-                description_parts.append("Order code description:")
-                description_parts.append(item['order_code'])
-            
-            # Product configuration (consolidated with smaller font)
-            if item.get('config'):
-                description_parts.append("Product Configuration:")
-                # Consolidate configuration lines into single lines
-                config_lines = item['config'].split('  ')
-                consolidated_lines = []
-                current_line = ""
-                
-                for line in config_lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    # If line starts with a number (like "030:"), start a new consolidated line
-                    if line and line[0].isdigit():
-                        if current_line:
-                            consolidated_lines.append(current_line)
-                        current_line = line
-                    else:
-                        # Append to current line with a space
-                        if current_line:
-                            current_line += f" {line}"
-                        else:
-                            current_line = line
-                
-                # Add the last line
-                if current_line:
-                    consolidated_lines.append(current_line)
-                
-                # Add consolidated lines (smaller font handled by CSS)
-                for line in consolidated_lines:
-                    description_parts.append(line)
-            
-            # Country information
-            country_info = []
-            if item.get('country_origin'):
-                country_info.append(f"Origin: {item['country_origin']}")
-            if item.get('country_dispatch'):
-                country_info.append(f"Dispatch: {item['country_dispatch']}")
-            if country_info:
-                description_parts.append("Country Information:")
-                description_parts.extend(country_info)
-            
-            description = "\n\n".join(description_parts)
+            description = "\n\n".join(describe_item(item))
             
             # Clean up the description for better formatting
             description = description.replace('\r\n', '\n').replace('\r', '\n')
@@ -378,154 +532,84 @@ class ExcelExporter:
             description = self._soft_breaks(description)
             
             desc_cell = ws.cell(row=current_row, column=2, value=description)
-            desc_cell.font = Font(name='Arial', size=9, color=self.text_color)
+            desc_cell.font = self.small_text_font
             desc_cell.fill = row_fill
-            desc_cell.alignment = Alignment(wrap_text=True, vertical='top', horizontal='left', shrink_to_fit=False)
-            desc_cell.border = Border(
-                left=Side(style='thin', color=self.border_color),
-                right=Side(style='thin', color=self.border_color),
-                top=Side(style='thin', color=self.border_color),
-                bottom=Side(style='thin', color=self.border_color)
-            )
+            desc_cell.alignment = self.description_alignment
+            desc_cell.border = self.grid_border
             
             # Quantity and unit
             qty_cell = ws.cell(row=current_row, column=3, value=item.get('quantity', 1))
-            qty_cell.font = Font(name='Arial', size=10, color=self.text_color)
+            qty_cell.font = self.text_font
             qty_cell.fill = row_fill
-            qty_cell.alignment = Alignment(horizontal='center', vertical='center')
-            qty_cell.border = Border(
-                left=Side(style='thin', color=self.border_color),
-                right=Side(style='thin', color=self.border_color),
-                top=Side(style='thin', color=self.border_color),
-                bottom=Side(style='thin', color=self.border_color)
-            )
+            qty_cell.alignment = self.center_alignment
+            qty_cell.border = self.grid_border
             
             unit_cell = ws.cell(row=current_row, column=4, value=item.get('unit', 'EA'))
-            unit_cell.font = Font(name='Arial', size=10, color=self.text_color)
+            unit_cell.font = self.text_font
             unit_cell.fill = row_fill
-            unit_cell.alignment = Alignment(horizontal='center', vertical='center')
-            unit_cell.border = Border(
-                left=Side(style='thin', color=self.border_color),
-                right=Side(style='thin', color=self.border_color),
-                top=Side(style='thin', color=self.border_color),
-                bottom=Side(style='thin', color=self.border_color)
-            )
+            unit_cell.alignment = self.center_alignment
+            unit_cell.border = self.grid_border
             
             # Prices
-            TAX_RATE = 0.08
-            unit_price = float(item.get('unit_price', 0))
-            price_with_tax = unit_price * (1 + TAX_RATE)
-            quoted_price = price_with_tax * (1 + markup)
-            total_price = quoted_price * float(item.get('quantity', 1))
-            
             unit_price_cell = ws.cell(row=current_row, column=5, value=quoted_price)
-            unit_price_cell.font = Font(name='Arial', size=10, bold=True, color=self.text_color)
+            unit_price_cell.font = self.label_font
             unit_price_cell.fill = row_fill
-            unit_price_cell.alignment = Alignment(horizontal='right', vertical='center')
+            unit_price_cell.alignment = self.right_alignment
             unit_price_cell.number_format = '$#,##0.00'
-            unit_price_cell.border = Border(
-                left=Side(style='thin', color=self.border_color),
-                right=Side(style='thin', color=self.border_color),
-                top=Side(style='thin', color=self.border_color),
-                bottom=Side(style='thin', color=self.border_color)
-            )
+            unit_price_cell.border = self.grid_border
             
             total_price_cell = ws.cell(row=current_row, column=6, value=total_price)
-            total_price_cell.font = Font(name='Arial', size=10, bold=True, color=self.text_color)
+            total_price_cell.font = self.label_font
             total_price_cell.fill = row_fill
-            total_price_cell.alignment = Alignment(horizontal='right', vertical='center')
+            total_price_cell.alignment = self.right_alignment
             total_price_cell.number_format = '$#,##0.00'
-            total_price_cell.border = Border(
-                left=Side(style='thin', color=self.border_color),
-                right=Side(style='thin', color=self.border_color),
-                top=Side(style='thin', color=self.border_color),
-                bottom=Side(style='thin', color=self.border_color)
-            )
-            
-            # Calculate row height based on content length and line breaks
-            description_length = len(description)
-            line_breaks = description.count('\n') + description.count('\r')
-            
-            # Calculate estimated lines based on content and line breaks
-            if line_breaks > 0:
-                # If there are explicit line breaks, use them as a guide
-                estimated_lines = max(3, line_breaks + 1)
-            else:
-                # Estimate based on content length
-                estimated_lines = max(3, description_length // 60)  # More conservative estimate
+            total_price_cell.border = self.grid_border
             
-            # Set row height with better calculation
-            row_height = max(80, estimated_lines * 25)  # Increased base height and line height
-            
-            ws.row_dimensions[current_row].height = row_height
+            # Row height from the description wrapped to column B's width
+            ws.row_dimensions[current_row].height = self.text_row_height(
+                description, self.small_text_font, self.DESCRIPTION_WIDTH_PX
+            )
             current_row += 1
         
+        # Spacer
+        self.fill_row(ws, current_row)
+        
         return current_row
     
-    def create_totals(self, ws, quote_data):
-        """Create totals section"""
+    def create_totals(self, ws, quote_data, pricing):
+        """Create totals section from the export's pricing"""
         line_items = quote_data.get('line_items', [])
-        markup = quote_data.get('markup_percentage', 20.0) / 100
         
-        # Calculate totals
-        TAX_RATE = 0.08
-        subtotal = 0
-        for item in line_items:
-            unit_price = float(item.get('unit_price', 0))
-            quantity = float(item.get('quantity', 1))
-            price_with_tax = unit_price * (1 + TAX_RATE)
-            quoted_price = price_with_tax * (1 + markup)
-            subtotal += quoted_price * quantity
-        
-        total = subtotal
+        subtotal = pricing.subtotal
+        total = pricing.total
         
         # Find the last row with data
         last_row = 20 + len(line_items) + 2
         
         # Totals with enhanced styling
         ws[f'E{last_row}'] = 'Subtotal:'
-        ws[f'E{last_row}'].font = Font(name='Arial', size=11, bold=True, color=self.text_color)
-        ws[f'E{last_row}'].fill = PatternFill(start_color=self.highlight_color, end_color=self.highlight_color, fill_type='solid')
-        ws[f'E{last_row}'].alignment = Alignment(horizontal='right', vertical='center')
-        ws[f'E{last_row}'].border = Border(
-            left=Side(style='thick', color=self.header_color),
-            right=Side(style='thick', color=self.header_color),
-            top=Side(style='thick', color=self.header_color),
-            bottom=Side(style='thick', color=self.header_color)
-        )
+        ws[f'E{last_row}'].font = self.subtotal_font
+        ws[f'E{last_row}'].fill = self.highlight_fill
+        ws[f'E{last_row}'].alignment = self.right_alignment
+        ws[f'E{last_row}'].border = self.brand_border
         ws[f'F{last_row}'] = subtotal
-        ws[f'F{last_row}'].font = Font(name='Arial', size=11, bold=True, color=self.text_color)
-        ws[f'F{last_row}'].fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-        ws[f'F{last_row}'].alignment = Alignment(horizontal='right', vertical='center')
+        ws[f'F{last_row}'].font = self.subtotal_font
+        ws[f'F{last_row}'].fill = self.white_fill
+        ws[f'F{last_row}'].alignment = self.right_alignment
         ws[f'F{last_row}'].number_format = '$#,##0.00'
-        ws[f'F{last_row}'].border = Border(
-            left=Side(style='thick', color=self.header_color),
-            right=Side(style='thick', color=self.header_color),
-            top=Side(style='thick', color=self.header_color),
-            bottom=Side(style='thick', color=self.header_color)
-        )
+        ws[f'F{last_row}'].border = self.brand_border
         
         ws[f'E{last_row + 1}'] = 'TOTAL:'
-        ws[f'E{last_row + 1}'].font = Font(name='Arial', size=14, bold=True, color='FFFFFF')
-        ws[f'E{last_row + 1}'].fill = PatternFill(start_color=self.header_color, end_color=self.header_color, fill_type='solid')
-        ws[f'E{last_row + 1}'].alignment = Alignment(horizontal='right', vertical='center')
-        ws[f'E{last_row + 1}'].border = Border(
-            left=Side(style='thick', color=self.header_color),
-            right=Side(style='thick', color=self.header_color),
-            top=Side(style='thick', color=self.header_color),
-            bottom=Side(style='thick', color=self.header_color)
-        )
+        ws[f'E{last_row + 1}'].font = self.total_font
+        ws[f'E{last_row + 1}'].fill = self.header_fill
+        ws[f'E{last_row + 1}'].alignment = self.right_alignment
+        ws[f'E{last_row + 1}'].border = self.brand_border
         ws[f'F{last_row + 1}'] = total
-        ws[f'F{last_row + 1}'].font = Font(name='Arial', size=14, bold=True, color='FFFFFF')
-        ws[f'F{last_row + 1}'].fill = PatternFill(start_color=self.header_color, end_color=self.header_color, fill_type='solid')
-        ws[f'F{last_row + 1}'].alignment = Alignment(horizontal='right', vertical='center')
+        ws[f'F{last_row + 1}'].font = self.total_font
+        ws[f'F{last_row + 1}'].fill = self.header_fill
+        ws[f'F{last_row + 1}'].alignment = self.right_alignment
         ws[f'F{last_row + 1}'].number_format = '$#,##0.00'
-        ws[f'F{last_row + 1}'].border = Border(
-            left=Side(style='thick', color=self.header_color),
-            right=Side(style='thick', color=self.header_color),
-            top=Side(style='thick', color=self.header_color),
-            bottom=Side(style='thick', color=self.header_color)
-        )
+        ws[f'F{last_row + 1}'].border = self.brand_border
         
         # Set row heights
         ws.row_dimensions[last_row].height = 25
@@ -535,23 +619,24 @@ class ExcelExporter:
         for col in range(1, 7):
             for row in range(last_row, last_row + 3):
                 ws.cell(row=row, column=col).border = self.thick_border
+                if col < 5 or row == last_row + 2:
+                    ws.cell(row=row, column=col).alignment = self.wrap_alignment
+        ws.row_dimensions[last_row + 2].height = 20
     
     def create_terms(self, ws, quote_data):
         """Create terms and conditions section"""
         last_row = 20 + len(quote_data.get('line_items', [])) + 6
         
+        # Spacer
+        self.fill_row(ws, last_row - 1)
+        
         # Terms header with enhanced styling
         ws[f'A{last_row}'] = 'TERMS AND CONDITIONS'
-        ws[f'A{last_row}'].font = Font(name='Arial', size=14, bold=True, color='FFFFFF')
-        ws[f'A{last_row}'].fill = PatternFill(start_color=self.header_color, end_color=self.header_color, fill_type='solid')
-        ws[f'A{last_row}'].alignment = Alignment(horizontal='center', vertical='center')
-        ws[f'A{last_row}'].border = Border(
-            left=Side(style='thick', color=self.header_color),
-            right=Side(style='thick', color=self.header_color),
-            top=Side(style='thick', color=self.header_color),
-            bottom=Side(style='thick', color=self.header_color)
-        )
-        ws.merge_cells(f'A{last_row}:F{last_row}')
+        ws[f'A{last_row}'].font = self.total_font
+        ws[f'A{last_row}'].fill = self.header_fill
+        ws[f'A{last_row}'].alignment = self.center_alignment
+        ws[f'A{last_row}'].border = self.brand_border
+        self.merge_row(ws, last_row)
         ws.row_dimensions[last_row].height = 35
         
         # Lead time and quote validity information
@@ -632,60 +717,275 @@ class ExcelExporter:
         
         for i, term in enumerate(terms, last_row + 1):
             ws[f'A{i}'] = term
-            ws[f'A{i}'].font = Font(name='Arial', size=9, color=self.text_color)
-            ws[f'A{i}'].alignment = Alignment(wrap_text=True, vertical='top', horizontal='left')
-            ws[f'A{i}'].fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-            ws[f'A{i}'].border = Border(
-                left=Side(style='thin', color=self.border_color),
-                right=Side(style='thin', color=self.border_color),
-                top=Side(style='thin', color=self.border_color),
-                bottom=Side(style='thin', color=self.border_color)
-            )
+            ws[f'A{i}'].font = self.small_text_font
+            ws[f'A{i}'].alignment = self.terms_alignment
+            ws[f'A{i}'].fill = self.white_fill
+            ws[f'A{i}'].border = self.grid_border
             # Merge across all columns for better readability
-            ws.merge_cells(f'A{i}:F{i}')
+            self.merge_row(ws, i)
             ws.row_dimensions[i].height = 20
+
+class _StreamingSheet:
+    """Worksheet stand-in that streams rows into a write-only worksheet.
     
-    def format_worksheet(self, ws):
-        """Format the entire worksheet"""
-        # Set column widths for better layout
-        column_widths = {
-            'A': 8,   # Item #
-            'B': 80,  # Description (even wider for full product descriptions)
-            'C': 8,   # Qty
-            'D': 8,   # Unit
-            'E': 15,  # Unit Price
-            'F': 15   # Total Price
-        }
-        
-        for col, width in column_widths.items():
+    Supports the subset of the Worksheet API the ExcelExporter section
+    builders use (ws['A1'], ws.cell(), merge_cells, row_dimensions). Rows are
+    kept in a small buffer so a builder can still touch the last few rows;
+    older rows are written out as the builders left them.
+    """
+    
+    LOOKBACK = 3
+    
+    def __init__(self, ws, max_column):
+        self.ws = ws
+        self.max_column = max_column
+        self.rows = {}
+        self.next_row = 1
+        self.row_dimensions = _StreamingRowDimensions(self)
+    
+    def _touch(self, row):
+        """Make sure row is still buffered, flushing rows that fell out of the window"""
+        if row < self.next_row:
+            raise RuntimeError(f"Row {row} has already been written to the stream")
+        if row - self.LOOKBACK > self.next_row:
+            self.flush(row - self.LOOKBACK)
+        return self.rows.setdefault(row, {})
+    
+    def cell(self, row, column, value=None):
+        cells = self._touch(row)
+        cell = cells.get(column)
+        if cell is None:
+            cell = cells[column] = WriteOnlyCell(self.ws)
+        if value is not None:
+            cell.value = value
+        return cell
+    
+    def __getitem__(self, coordinate):
+        column, row = coordinate_from_string(coordinate)
+        return self.cell(row=row, column=column_index_from_string(column))
+    
+    def __setitem__(self, coordinate, value):
+        self[coordinate].value = value
+    
+    def merge_cells(self, range_string):
+        """Merge a range; edge cells take the anchor's borders, as openpyxl does"""
+        min_col, min_row, max_col, max_row = range_boundaries(range_string)
+        anchor = self.cell(row=min_row, column=min_col)
+        
+        for row in range(min_row, max_row + 1):
+            cells = self._touch(row)
+            for column in range(min_col, max_col + 1):
+                if (row, column) == (min_row, min_col):
+                    continue
+                cell = cells[column] = WriteOnlyCell(self.ws)
+                edges = {
+                    'top': row == min_row,
+                    'left': column == min_col,
+                    'right': column == max_col,
+                    'bottom': row == max_row
+                }
+                for name, on_edge in edges.items():
+                    side = getattr(anchor.border, name)
+                    if on_edge and side is not None and side.style is not None:
+                        cell.border += Border(**{name: side})
+        
+        self.ws.merged_cells.add(range_string)
+    
+    def flush(self, upto_row=None):
+        """Write buffered rows below upto_row (every buffered row if None)"""
+        if upto_row is None:
+            upto_row = max(self.rows, default=self.next_row - 1) + 1
+        
+        for row in range(self.next_row, upto_row):
+            cells = self.rows.pop(row, {})
+            values = [cells.get(column) for column in range(1, self.max_column + 1)]
+            
+            height = self.row_dimensions.pop(row)
+            if height is not None:
+                self.ws.row_dimensions[row].height = height
+            self.ws.append(values)
+        
+        self.next_row = max(self.next_row, upto_row)
+
+class _StreamingRowDimensions:
+    """row_dimensions for _StreamingSheet; only height is supported"""
+    
+    def __init__(self, sheet):
+        self.sheet = sheet
+        self.dimensions = {}
+    
+    def __getitem__(self, row):
+        self.sheet._touch(row)
+        dimension = self.dimensions.get(row)
+        if dimension is None:
+            dimension = self.dimensions[row] = _StreamingRowDimension()
+        return dimension
+    
+    def pop(self, row):
+        dimension = self.dimensions.pop(row, None)
+        return dimension.height if dimension is not None else None
+
+class _StreamingRowDimension:
+    """Height of a buffered row"""
+    
+    def __init__(self):
+        self.height = None
+
+class StreamingExcelExporter(ExcelExporter):
+    """Excel exporter built on openpyxl's write-only mode.
+    
+    Produces the same branded ENETK sheet as ExcelExporter, but rows are
+    written out in order with their final styles as they are built, so
+    memory and save time stay low for quotes with hundreds of items.
+    """
+    
+    def export_quote(self, quote_data, output_path):
+        """Export quote to Excel file, streaming rows to disk"""
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Quote")
+        
+        # Column widths must be set before the first row is written
+        for col, width in self.COLUMN_WIDTHS.items():
             ws.column_dimensions[col].width = width
         
-        # Ensure text wrapping is enabled for the entire worksheet
-        for row in range(1, ws.max_row + 1):
-            for col in range(1, ws.max_column + 1):
-                cell = ws.cell(row=row, column=col)
-                if cell.alignment is None:
-                    cell.alignment = Alignment(wrap_text=True, vertical='top')
-                else:
-                    # Update existing alignment to ensure wrap_text is True
-                    cell.alignment = Alignment(
-                        wrap_text=True,
-                        vertical=cell.alignment.vertical or 'top',
-                        horizontal=cell.alignment.horizontal or 'left'
-                    )
-        
-        # Only set row heights if none have been set already
-        # This preserves the dynamic heights calculated in create_line_items
-        for row in range(1, ws.max_row + 1):
-            if ws.row_dimensions[row].height is None:
-                if row == 1:  # Header row
-                    ws.row_dimensions[row].height = 40
-                else:
-                    ws.row_dimensions[row].height = 20  # default
+        sheet = _StreamingSheet(ws, max_column=len(self.COLUMN_WIDTHS))
+        pricing = price_quote(quote_data)
+        
+        # Create the quote
+        self.create_header(sheet, quote_data)
+        self.create_company_info(sheet, quote_data)
+        self.create_quote_details(sheet, quote_data)
+        self.create_customer_info(sheet, quote_data)
+        self.create_line_items(sheet, quote_data, pricing)
+        self.create_totals(sheet, quote_data, pricing)
+        self.create_terms(sheet, quote_data)
+        sheet.flush()
+        
+        # Save the file
+        wb.save(output_path)
+        return output_path
+
+class _DescriptionLayout:
+    """Sanitized HTML, parsed fragments and wrapped lines of one description"""
+    
+    __slots__ = ('html', 'frags', 'lines')
+    
+    def __init__(self, html, frags):
+        self.html = html
+        self.frags = frags
+        self.lines = {}  # wrap widths -> reportlab line breaks
+
+class _LaidOutParagraph(Paragraph):
+    """Paragraph that reuses the line breaks stored in its layout.
+    
+    Table splitting wraps each description several times per build; the
+    first wrap at a width is kept and later ones return it unchanged.
+    Pieces produced by split() have no layout and wrap as usual.
+    """
+    
+    layout = None
+    
+    def breakLinesCJK(self, maxWidths):
+        if self.layout is None or getattr(self, '_splitpara', 0):
+            return Paragraph.breakLinesCJK(self, maxWidths)
+        key = tuple(maxWidths)
+        lines = self.layout.lines.get(key)
+        if lines is None:
+            lines = self.layout.lines[key] = Paragraph.breakLinesCJK(self, maxWidths)
+        return lines
+    
+    def split(self, availWidth, availHeight):
+        # Splitting edits the words of the broken lines; keep the cached ones intact
+        if self.layout is not None and hasattr(self, 'blPara'):
+            self.blPara = deepcopy(self.blPara)
+        return Paragraph.split(self, availWidth, availHeight)
+
+class ParagraphLayoutCache:
+    """Description layouts shared by every PDF export in the process.
+    
+    Entries are keyed by description parts, paragraph style, column width
+    and sanitizer, so re-exporting a quote after a price change skips
+    sanitizing, markup parsing and line wrapping for unchanged items.
+    The least recently used entries are dropped beyond maxsize.
+    """
+    
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.layouts = OrderedDict()
+    
+    @staticmethod
+    def style_key(style):
+        """Hashable key for everything that affects how a style lays out text"""
+        return tuple((name, repr(value)) for name, value in sorted(vars(style).items()) if name != 'parent')
+    
+    def paragraph(self, parts, style, width, sanitize, style_key=None):
+        """Return a Paragraph for description parts, laid out from the cache"""
+        if style_key is None:
+            style_key = self.style_key(style)
+        key = (parts, style_key, width, getattr(sanitize, '__func__', sanitize))
+        layout = self.layouts.get(key)
+        if layout is None:
+            html = "<br/><br/>".join(escape(sanitize(p)) for p in parts)
+            layout = _DescriptionLayout(html, Paragraph(html, style).frags)
+            self.layouts[key] = layout
+            if len(self.layouts) > self.maxsize:
+                self.layouts.popitem(last=False)
+        else:
+            self.layouts.move_to_end(key)
+        
+        para = _LaidOutParagraph(layout.html, style, frags=layout.frags)
+        para.layout = layout
+        return para
+    
+    def clear(self):
+        self.layouts.clear()
 
 class PDFExporter:
     """PDF quote exporter with ENETK/EH branding"""
     
+    # Description paragraphs laid out by earlier exports
+    layout_cache = ParagraphLayoutCache()
+    
+    # Table styles are the same for every quote, so they are built once
+    LABEL_TABLE_STYLE = TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ])
+    
+    ITEMS_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B0000')),  # ENETK maroon
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),  # Smaller font for better fit
+        
+        # Alignment per column
+        ('ALIGN', (0, 1), (0, -1), 'CENTER'),   # Item #
+        ('ALIGN', (1, 1), (1, -1), 'LEFT'),     # Description
+        ('ALIGN', (2, 1), (3, -1), 'CENTER'),   # Qty, Unit
+        ('ALIGN', (4, 1), (5, -1), 'RIGHT'),    # Prices
+        
+        ('VALIGN', (0, 1), (-1, -1), 'TOP'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ('LEFTPADDING', (0, 0), (-1, -1), 3),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 3),
+        ('TOPPADDING', (0, 0), (-1, -1), 4),
+        
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ])
+    
+    TOTALS_TABLE_STYLE = TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 12),
+        ('FONTSIZE', (0, 1), (-1, 1), 14),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#F2F2F2')),
+    ])
+    
     def __init__(self):
         self.styles = getSampleStyleSheet()
         self.setup_custom_styles()
@@ -740,49 +1040,44 @@ class PDFExporter:
             spaceAfter=6,
             spaceBefore=6
         )
+        
+        # Company tagline and address under the header title
+        self.tagline_style = ParagraphStyle(
+            'CompanyTagline',
+            parent=self.styles['Normal'],
+            fontSize=12,
+            textColor=colors.HexColor('#808080')
+        )
+        self.address_style = ParagraphStyle(
+            'Address',
+            parent=self.styles['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#808080')
+        )
     
     def _sanitize_for_pdf(self, s: str) -> str:
         """Sanitize text for PDF output by removing problematic characters."""
         if not s:
             return s
         
-        import re
-        
-        # Replace problematic characters that cause black squares
-        repl = {
-            '\u200b': '',      # zero-width space
-            '\ufeff': '',      # BOM
-            '\u00a0': ' ',     # NBSP -> space
-            '\u25a0': '',      # ■ black square -> remove
-            '\u2022': '* ',    # • bullet -> ASCII bullet
-            '\u2018': "'", '\u2019': "'",  # curly quotes -> straight
-            '\u201c': '"', '\u201d': '"',
-            '\u2013': '-', '\u2014': '-', '\u2212': '-',  # dashes -> hyphen
-            '\u2026': '...',    # ellipsis
-            '\u2122': ' TM', '\u00ae': ' (R)',
-            '°': ' degrees',   # degree symbol
-        }
-        
-        for k, v in repl.items():
-            s = s.replace(k, v)
-        
-        # Drop anything still non-ASCII (safe fallback)
-        s = re.sub(r'[^\x20-\x7E\n\r\t]', '', s)
-        
-        return s
+        # Encode to ASCII, replacing characters that cause black squares and
+        # dropping any other non-ASCII, then remove control characters
+        s = s.encode('ascii', 'eh_pdf_text').translate(None, PDF_CONTROL_BYTES)
+        return s.decode('ascii')
     
     def export_quote(self, quote_data, output_path):
         """Export quote to PDF file"""
         doc = SimpleDocTemplate(output_path, pagesize=letter, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
         story = []
+        pricing = price_quote(quote_data)
         
         # Create the quote content
         self.create_header(story, quote_data)
         self.create_company_info(story, quote_data)
         self.create_quote_details(story, quote_data)
         self.create_customer_info(story, quote_data)
-        self.create_line_items(story, quote_data, doc.width)  # Pass available width
-        self.create_totals(story, quote_data)
+        self.create_line_items(story, quote_data, doc.width, pricing)  # Pass available width
+        self.create_totals(story, quote_data, pricing)
         self.create_terms(story, quote_data)
         
         # Build PDF
@@ -793,12 +1088,8 @@ class PDFExporter:
         """Create PDF header"""
         # ENETK LLC branding
         story.append(Paragraph("ENETK LLC", self.title_style))
-        story.append(Paragraph("PLC AUTOMATION & INTEGRATION", 
-                              ParagraphStyle('CompanyTagline', parent=self.styles['Normal'], 
-                                           fontSize=12, textColor=colors.HexColor('#808080'))))
-        story.append(Paragraph("11085 32E ST SW<br/>DICKINSON ND 58601-7810", 
-                              ParagraphStyle('Address', parent=self.styles['Normal'], 
-                                           fontSize=10, textColor=colors.HexColor('#808080'))))
+        story.append(Paragraph("PLC AUTOMATION & INTEGRATION", self.tagline_style))
+        story.append(Paragraph("11085 32E ST SW<br/>DICKINSON ND 58601-7810", self.address_style))
         story.append(Spacer(1, 20))
         story.append(Paragraph("QUOTE", self.title_style))
         story.append(Spacer(1, 20))
@@ -818,12 +1109,7 @@ class PDFExporter:
         ]
         
         details_table = Table(details_data, colWidths=[2*inch, 4*inch])
-        details_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        details_table.setStyle(self.LABEL_TABLE_STYLE)
         
         story.append(details_table)
         story.append(Spacer(1, 20))
@@ -840,17 +1126,12 @@ class PDFExporter:
         ]
         
         customer_table = Table(customer_data, colWidths=[1.5*inch, 4.5*inch])
-        customer_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        customer_table.setStyle(self.LABEL_TABLE_STYLE)
         
         story.append(customer_table)
         story.append(Spacer(1, 20))
     
-    def create_line_items(self, story, quote_data, available_width):
+    def create_line_items(self, story, quote_data, available_width, pricing):
         """Create line items table with proper width calculation and text wrapping"""
         story.append(Paragraph("LINE ITEMS", self.header_style))
         
@@ -872,91 +1153,14 @@ class PDFExporter:
         
         # Prepare data
         table_data = [headers]
-        markup = quote_data.get('markup_percentage', 20.0) / 100
+        line_items = quote_data.get('line_items', [])
+        style_key = self.layout_cache.style_key(self.desc_style)
         
-        for i, item in enumerate(quote_data.get('line_items', []), 1):
-            # Create clean, professional description formatting
-            description_parts = []
-            
-            # Main product name and model
-            product_name = item.get('description', '').split('\n')[0] if item.get('description') else ''
-            if product_name:
-                description_parts.append(product_name)
-            
-            # Add model number if available
-            if item.get('model'):
-                description_parts.append(f"Model: {item['model']}")
-            
-            # Sales text (product description)
-            if item.get('sales_text'):
-                description_parts.append(f"Description: {item['sales_text']}")
-            
-            # Delivery time
-            if item.get('delivery_time'):
-                description_parts.append(f"Delivery time: {item['delivery_time']}")
-            
-            # Order code description
-            if item.get('order_code'):
-                description_parts.append("Order code description:")
-                description_parts.append(item['order_code'])
-            
-            # Product configuration (consolidated with smaller font)
-            if item.get('config'):
-                description_parts.append("Product Configuration:")
-                # Consolidate configuration lines into single lines
-                config_lines = item['config'].split('  ')
-                consolidated_lines = []
-                current_line = ""
-                
-                for line in config_lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    # If line starts with a number (like "030:"), start a new consolidated line
-                    if line and line[0].isdigit():
-                        if current_line:
-                            consolidated_lines.append(current_line)
-                        current_line = line
-                    else:
-                        # Append to current line with a space
-                        if current_line:
-                            current_line += f" {line}"
-                        else:
-                            current_line = line
-                
-                # Add the last line
-                if current_line:
-                    consolidated_lines.append(current_line)
-                
-                # Add consolidated lines (smaller font handled by CSS)
-                for line in consolidated_lines:
-                    description_parts.append(line)
-            
-            # Country information
-            country_info = []
-            if item.get('country_origin'):
-                country_info.append(f"Origin: {item['country_origin']}")
-            if item.get('country_dispatch'):
-                country_info.append(f"Dispatch: {item['country_dispatch']}")
-            if country_info:
-                description_parts.append("Country Information:")
-                description_parts.extend(country_info)
-            
-            # Sanitize text and create HTML
-            from xml.sax.saxutils import escape
-            parts = [self._sanitize_for_pdf(p) for p in description_parts if p]
-            desc_html = "<br/><br/>".join(escape(p) for p in parts)
-            
-            # Create Paragraph object for proper text wrapping
-            desc_para = Paragraph(desc_html, self.desc_style)
-            
-            # Prices
-            TAX_RATE = 0.08
-            unit_price = float(item.get('unit_price', 0))
-            price_with_tax = unit_price * (1 + TAX_RATE)
-            quoted_price = price_with_tax * (1 + markup)
-            total_price = quoted_price * float(item.get('quantity', 1))
+        for i, (item, (quoted_price, total_price)) in enumerate(zip(line_items, pricing), 1):
+            # Sanitized, wrapped description Paragraph, reused across exports
+            desc_para = self.layout_cache.paragraph(
+                describe_item(item), self.desc_style, desc_w, self._sanitize_for_pdf, style_key
+            )
             
             row_data = [
                 str(i),
@@ -970,47 +1174,15 @@ class PDFExporter:
         
         # Create table with calculated column widths and better row splitting
         items_table = Table(table_data, colWidths=col_widths, repeatRows=1, splitByRow=1, splitInRow=1)
-        items_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B0000')),  # ENETK maroon
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),  # Smaller font for better fit
-            
-            # Alignment per column
-            ('ALIGN', (0, 1), (0, -1), 'CENTER'),   # Item #
-            ('ALIGN', (1, 1), (1, -1), 'LEFT'),     # Description
-            ('ALIGN', (2, 1), (3, -1), 'CENTER'),   # Qty, Unit
-            ('ALIGN', (4, 1), (5, -1), 'RIGHT'),    # Prices
-            
-            ('VALIGN', (0, 1), (-1, -1), 'TOP'),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('LEFTPADDING', (0, 0), (-1, -1), 3),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 3),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        items_table.setStyle(self.ITEMS_TABLE_STYLE)
         
         story.append(items_table)
         story.append(Spacer(1, 20))
     
-    def create_totals(self, story, quote_data):
-        """Create totals section"""
-        line_items = quote_data.get('line_items', [])
-        markup = quote_data.get('markup_percentage', 20.0) / 100
-        tax_rate = quote_data.get('tax_percentage', 8.0) / 100
-        
-        # Calculate totals
-        TAX_RATE = 0.08
-        subtotal = 0
-        for item in line_items:
-            unit_price = float(item.get('unit_price', 0))
-            quantity = float(item.get('quantity', 1))
-            price_with_tax = unit_price * (1 + TAX_RATE)
-            quoted_price = price_with_tax * (1 + markup)
-            subtotal += quoted_price * quantity
-        
-        total = subtotal
+    def create_totals(self, story, quote_data, pricing):
+        """Create totals section from the export's pricing"""
+        subtotal = pricing.subtotal
+        total = pricing.total
         
         # Totals table
         totals_data = [
@@ -1019,16 +1191,7 @@ class PDFExporter:
         ]
         
         totals_table = Table(totals_data, colWidths=[4*inch, 2*inch])
-        totals_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 12),
-            ('FONTSIZE', (0, 1), (-1, 1), 14),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#F2F2F2')),
-        ]))
+        totals_table.setStyle(self.TOTALS_TABLE_STYLE)
         
         story.append(totals_table)
         story.append(Spacer(1, 20))
@@ -1113,3 +1276,94 @@ class PDFExporter:
         """
         
         story.append(Paragraph(terms_text, self.normal_style))
+
+class PageTemplatePDFExporter(PDFExporter):
+    """PDF exporter that stamps the ENETK header and footer from a page template.
+    
+    The branded header and the static part of the footer are drawn once per
+    document into a Form XObject, which the PageTemplate's onPage callback
+    places on every page; only the page number is drawn per page. The story
+    holds just the quote's own tables, so quotes with hundreds of items
+    repeat the branding on every page without reflowing it.
+    """
+    
+    HEADER_FORM = 'enetk_header'
+    
+    # Page geometry in points; the frame sits between the header and footer bands
+    TOP_MARGIN = 72
+    BOTTOM_MARGIN = 36
+    FOOTER_BASELINE = 20
+    SIDE_MARGIN = 72
+    
+    def export_quote(self, quote_data, output_path):
+        """Export quote to PDF file"""
+        doc = BaseDocTemplate(output_path, pagesize=letter,
+                              leftMargin=self.SIDE_MARGIN, rightMargin=self.SIDE_MARGIN,
+                              topMargin=self.TOP_MARGIN, bottomMargin=self.BOTTOM_MARGIN)
+        frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='body')
+        doc.addPageTemplates([PageTemplate(id='quote', frames=[frame], onPage=self.draw_page)])
+        doc.quote_number = self._sanitize_for_pdf(str(quote_data.get('quote_number', '')))
+        story = []
+        pricing = price_quote(quote_data)
+        
+        # Create the quote content
+        self.create_header(story, quote_data)
+        self.create_company_info(story, quote_data)
+        self.create_quote_details(story, quote_data)
+        self.create_customer_info(story, quote_data)
+        self.create_line_items(story, quote_data, doc.width, pricing)
+        self.create_totals(story, quote_data, pricing)
+        self.create_terms(story, quote_data)
+        
+        # Build PDF
+        doc.build(story)
+        return output_path
+    
+    def create_header(self, story, quote_data):
+        """Only the title flows with the content; the branding is on the page template"""
+        story.append(Paragraph("QUOTE", self.title_style))
+    
+    def draw_page(self, canvas, doc):
+        """onPage callback: stamp the header form and the page number"""
+        if not canvas.hasForm(self.HEADER_FORM):
+            canvas.beginForm(self.HEADER_FORM)
+            self.draw_branding(canvas, doc)
+            canvas.endForm()
+        
+        canvas.saveState()
+        canvas.doForm(self.HEADER_FORM)
+        canvas.setFont('Helvetica', 8)
+        canvas.setFillColor(colors.HexColor('#808080'))
+        footer = f"Page {doc.page}"
+        if doc.quote_number:
+            footer = f"Quote {doc.quote_number}  |  {footer}"
+        canvas.drawRightString(doc.pagesize[0] - doc.rightMargin, self.FOOTER_BASELINE, footer)
+        canvas.restoreState()
+    
+    def draw_branding(self, canvas, doc):
+        """Draw the static header and footer; recorded once into the header form"""
+        page_width, page_height = doc.pagesize
+        left = doc.leftMargin
+        right = page_width - doc.rightMargin
+        top = page_height - 30
+        
+        canvas.setFillColor(colors.HexColor('#8B0000'))
+        canvas.setFont('Helvetica-Bold', 22)
+        canvas.drawString(left, top - 10, "ENETK LLC")
+        
+        canvas.setFillColor(colors.HexColor('#808080'))
+        canvas.setFont('Helvetica', 10)
+        canvas.drawString(left, top - 24, "PLC AUTOMATION & INTEGRATION")
+        canvas.setFont('Helvetica', 9)
+        canvas.drawRightString(right, top - 10, "11085 32E ST SW")
+        canvas.drawRightString(right, top - 22, "DICKINSON ND 58601-7810")
+        
+        canvas.setStrokeColor(colors.HexColor('#8B0000'))
+        canvas.setLineWidth(1.5)
+        canvas.line(left, top - 32, right, top - 32)
+        
+        canvas.setStrokeColor(colors.HexColor('#808080'))
+        canvas.setLineWidth(0.5)
+        canvas.line(left, self.FOOTER_BASELINE + 10, right, self.FOOTER_BASELINE + 10)
+        canvas.setFont('Helvetica', 8)
+        canvas.drawString(left, self.FOOTER_BASELINE, "ENETK LLC  |  PLC AUTOMATION & INTEGRATION")
@@ -3,19 +3,40 @@ File parsing modules for the Desktop Quote Generator
 Handles RTF, XML, XLSX, and CSV file imports
 """
 
+import os
 import re
 import xml.etree.ElementTree as ET
 import openpyxl
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+from rtf_reader import read_rtf_lines, iter_rtf_lines
+from parse_cache import parse_cache
+from line_item import LineItem
+
 class FileParser:
     """Base class for file parsers"""
     
+    # Bump when a parser's output changes so cached results are not reused
+    VERSION = 2
+    
     def parse(self, file_path):
         """Parse file and return list of items"""
         raise NotImplementedError("Subclasses must implement parse method")
     
+    def parse_batches(self, file_path, batch_size=100):
+        """Parse file incrementally, yielding (items, rows_done, rows_total).
+        
+        Parsers that can read their source row by row override this so
+        callers can show progress; the default parses the whole file and
+        hands the items out in batches.
+        """
+        items = self.parse(file_path)
+        for start in range(0, len(items), batch_size):
+            done = min(start + batch_size, len(items))
+            yield items[start:done], done, len(items)
+    
     def clean_text(self, text):
         """Clean and normalize text"""
         if not text:
@@ -50,111 +71,103 @@ class FileParser:
 class RTFParser(FileParser):
     """Parser for RTF files"""
     
+    # Common item patterns, combined and compiled once
+    ITEM_LINE_PATTERN = re.compile('|'.join([
+        r'\d+\s+\d+\s+PC',  # Quantity PC pattern
+        r'Model no\.:',      # Model number
+        r'Level, radar,',    # Product description start
+        r'Qty:',             # Quantity label
+        r'Price:',           # Price label
+    ]), re.IGNORECASE)
+    
+    # Item field patterns
+    QUANTITY_PATTERN = re.compile(r'(\d+)\s+(\d+)\s+PC')
+    MODEL_PATTERN = re.compile(r'Model no\.:\s*([^\n]+)')
+    ORDER_CODE_PATTERN = re.compile(r'\(([^)]+)\)')
+    DESCRIPTION_PATTERN = re.compile(r'Level, radar,([^:]+)')
+    PRICE_PATTERN = re.compile(r'(\d{1,3}(?:,\d{3})*\.\d{2})')
+    
     def parse(self, file_path):
         """Parse RTF file and extract quote items"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Remove RTF formatting
-            plain_text = self.clean_rtf(content)
+            # Plain text with RTF formatting removed
+            plain_text = self.join_lines(read_rtf_lines(file_path))
             return self.extract_items_from_text(plain_text)
-            
+        
         except Exception as e:
             raise Exception(f"Error parsing RTF file: {str(e)}")
     
     def clean_rtf(self, rtf_content):
         """Remove RTF formatting codes"""
-        # Remove RTF control codes
-        plain_text = re.sub(r'\\[a-z]+\d*\s?', '', rtf_content)
-        plain_text = re.sub(r'[{}]', '', plain_text)
-        plain_text = re.sub(r'\\[^a-z]', '', plain_text)
-        
-        # Clean up whitespace
-        plain_text = re.sub(r'\s+', ' ', plain_text)
-        plain_text = re.sub(r'\n\s*\n', '\n\n', plain_text)
-        
-        return plain_text
+        return self.join_lines(iter_rtf_lines([rtf_content]))
+    
+    def join_lines(self, lines):
+        """Join text lines, collapsing whitespace"""
+        return ' '.join(' '.join(lines).split())
     
     def extract_items_from_text(self, text):
         """Extract items from cleaned text"""
         items = []
         lines = text.split('\n')
         
-        current_item = {}
+        current_item = None
         item_count = 0
         
         for line in lines:
             line = line.strip()
             if not line:
-                if current_item and 'description' in current_item:
+                if current_item is not None:
                     items.append(current_item)
-                    current_item = {}
+                    current_item = None
                 continue
             
             # Look for item patterns
             if self.is_item_line(line):
-                if current_item and 'description' in current_item:
+                if current_item is not None:
                     items.append(current_item)
                 
                 current_item = self.parse_item_line(line)
                 item_count += 1
-            elif current_item and 'description' in current_item:
+            elif current_item is not None:
                 # Add to current item description
-                current_item['description'] += f" {line}"
+                current_item.description += f" {line}"
         
         # Add last item
-        if current_item and 'description' in current_item:
+        if current_item is not None:
             items.append(current_item)
         
         return items
     
     def is_item_line(self, line):
         """Check if line contains item information"""
-        # Look for common item patterns
-        patterns = [
-            r'\d+\s+\d+\s+PC',  # Quantity PC pattern
-            r'Model no\.:',      # Model number
-            r'Level, radar,',    # Product description start
-            r'Qty:',             # Quantity label
-            r'Price:',           # Price label
-        ]
-        
-        return any(re.search(pattern, line, re.IGNORECASE) for pattern in patterns)
+        return self.ITEM_LINE_PATTERN.search(line) is not None
     
     def parse_item_line(self, line):
         """Parse individual item line"""
-        item = {
-            'description': '',
-            'quantity': 1,
-            'unit': 'EA',
-            'unit_price': 0.0,
-            'model': '',
-            'order_code': ''
-        }
+        item = LineItem()
         
         # Extract quantity
-        qty_match = re.search(r'(\d+)\s+(\d+)\s+PC', line)
+        qty_match = self.QUANTITY_PATTERN.search(line)
         if qty_match:
             item['quantity'] = int(qty_match.group(2))
         
         # Extract model number
-        model_match = re.search(r'Model no\.:\s*([^\n]+)', line)
+        model_match = self.MODEL_PATTERN.search(line)
         if model_match:
             item['model'] = model_match.group(1).strip()
         
         # Extract order code
-        order_match = re.search(r'\(([^)]+)\)', line)
+        order_match = self.ORDER_CODE_PATTERN.search(line)
         if order_match:
             item['order_code'] = order_match.group(1).strip()
         
         # Extract description
-        desc_match = re.search(r'Level, radar,([^:]+)', line)
+        desc_match = self.DESCRIPTION_PATTERN.search(line)
         if desc_match:
             item['description'] = desc_match.group(1).strip()
         
         # Extract price
-        price_match = re.search(r'(\d{1,3}(?:,\d{3})*\.\d{2})', line)
+        price_match = self.PRICE_PATTERN.search(line)
         if price_match:
             item['unit_price'] = self.extract_price(price_match.group(1))
         
@@ -186,20 +199,13 @@ class XMLParser(FileParser):
                     items.append(item)
             
             return items
-            
+        
         except Exception as e:
             raise Exception(f"Error parsing XML file: {str(e)}")
     
     def parse_xml_item(self, element):
         """Parse individual XML item element"""
-        item = {
-            'description': '',
-            'quantity': 1,
-            'unit': 'EA',
-            'unit_price': 0.0,
-            'model': '',
-            'order_code': ''
-        }
+        item = LineItem()
         
         # Extract description
         desc_elem = (
@@ -254,47 +260,65 @@ class XMLParser(FileParser):
 class ExcelParser(FileParser):
     """Parser for Excel files"""
     
+    # Item data lives in columns A to S
+    MAX_COLUMNS = 19
+    
     def parse(self, file_path):
         """Parse Excel file and extract quote items"""
+        return [item for items, _, _ in self.parse_batches(file_path) for item in items]
+    
+    def parse_batches(self, file_path, batch_size=100):
+        """Parse Excel file, yielding items every batch_size rows.
+        
+        The workbook is opened read-only with cached formula values and rows
+        are streamed as plain value tuples, so memory stays flat no matter
+        how large the export is.
+        """
+        try:
+            wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        except Exception as e:
+            raise Exception(f"Error parsing Excel file: {str(e)}")
+        
         try:
-            wb = openpyxl.load_workbook(file_path)
             ws = wb.active
             
+            # The dimension record may be missing; progress then grows with the rows read
+            total = max((ws.max_row or 1) - 1, 0)
             items = []
+            done = 0
             
             # Try to find data starting from row 2 (assuming row 1 is header)
-            for row in range(2, ws.max_row + 1):
-                item = self.parse_excel_row(ws, row)
+            rows = ws.iter_rows(min_row=2, max_col=self.MAX_COLUMNS, values_only=True)
+            for done, values in enumerate(rows, 1):
+                item = self.parse_excel_values(values)
                 if item and item['description']:
                     items.append(item)
+                
+                if done % batch_size == 0:
+                    yield items, done, max(done, total)
+                    items = []
             
-            return items
-            
+            if done % batch_size or done != total:
+                yield items, done, done
+        
         except Exception as e:
             raise Exception(f"Error parsing Excel file: {str(e)}")
+        finally:
+            wb.close()
     
     def parse_excel_row(self, worksheet, row):
         """Parse individual Excel row"""
-        item = {
-            'description': '',
-            'quantity': 1,
-            'unit': 'EA',
-            'unit_price': 0.0,
-            'model': '',
-            'order_code': '',
-            'config': '',
-            'sales_text': '',
-            'delivery_time': '',
-            'country_origin': '',
-            'country_dispatch': '',
-            'customer_ref': ''
-        }
+        return self.parse_excel_values(
+            worksheet.cell(row=row, column=col).value for col in range(1, self.MAX_COLUMNS + 1)
+        )
+    
+    def parse_excel_values(self, values):
+        """Parse the cell values of one Excel row"""
+        item = LineItem()
         
-        # Get cell values
-        cells = []
-        for col in range(1, 20):  # Check up to column S
-            cell_value = worksheet.cell(row=row, column=col).value
-            cells.append(str(cell_value) if cell_value else '')
+        # Cell values as text, padded to column S
+        cells = [str(value) if value else '' for value in values]
+        cells += [''] * (self.MAX_COLUMNS - len(cells))
         
         # Skip empty rows
         if all(not cell.strip() for cell in cells):
@@ -486,32 +510,130 @@ class ExcelParser(FileParser):
 class CSVParser(FileParser):
     """Parser for CSV files"""
     
+    # Column name keywords for each item field, checked in this order
+    COLUMN_KEYWORDS = [
+        ('description', ['description', 'desc', 'name', 'product']),
+        ('quantity', ['quantity', 'qty', 'amount']),
+        ('unit_price', ['price', 'cost', 'unit_price']),
+        ('model', ['model', 'part', 'sku']),
+        ('unit', ['unit', 'uom']),
+    ]
+    
+    # First number in a price or quantity
+    NUMBER_PATTERN = r'(\d+\.?\d*)'
+    
+    # Rows read from the file at a time
+    CHUNK_ROWS = 10000
+    
     def parse(self, file_path):
         """Parse CSV file and extract quote items"""
+        return [item for items, _, _ in self.parse_batches(file_path) for item in items]
+    
+    def parse_batches(self, file_path, batch_size=100):
+        """Parse CSV file chunk by chunk, yielding items every batch_size rows.
+        
+        Only a chunk of CHUNK_ROWS rows (and the one after it) is in memory at
+        a time, so catalogs of any size import in bounded memory. Until the
+        last chunk, the total row count is estimated from how far into the
+        file the reader has got.
+        """
         try:
-            df = pd.read_csv(file_path)
-            items = []
-            
-            for _, row in df.iterrows():
-                item = self.parse_csv_row(row)
-                if item and item['description']:
-                    items.append(item)
-            
-            return items
+            size = os.path.getsize(file_path)
+            done = 0
             
+            with open(file_path, 'rb') as file:
+                # Cells are read as written, so every chunk sees the same text
+                chunks = pd.read_csv(file, dtype=str, chunksize=self.CHUNK_ROWS)
+                chunk = next(chunks, None)
+                while chunk is not None:
+                    following = next(chunks, None)
+                    rows = self.parse_frame(chunk)
+                    read = done + len(rows)
+                    if following is None:
+                        total = read
+                    else:
+                        total = max(read + len(following), round(read * size / max(file.tell(), 1)))
+                    
+                    for start in range(0, len(rows), batch_size):
+                        end = min(start + batch_size, len(rows))
+                        yield [item for item in rows[start:end] if item], done + end, total
+                    
+                    done = read
+                    chunk = following
+        
         except Exception as e:
             raise Exception(f"Error parsing CSV file: {str(e)}")
     
+    def map_columns(self, columns):
+        """Item field for each column position, from keywords in the column names"""
+        fields = []
+        for col in columns:
+            col_lower = col.lower()
+            fields.append(next(
+                (field for field, keywords in self.COLUMN_KEYWORDS if any(keyword in col_lower for keyword in keywords)),
+                None
+            ))
+        return fields
+    
+    def parse_frame(self, df):
+        """Parse every row of a DataFrame at once; returns an item or None per row.
+        
+        The column mapping is resolved once and each mapped column is cleaned
+        and converted with vectorized string operations. Where several
+        columns map to one field, the last non-blank one wins, and the first
+        three columns fill in a missing description, quantity and price, as
+        parse_csv_row does for a single row.
+        """
+        if len(df) == 0:
+            return []
+        
+        # Cell text as parse_csv_row sees it: row values share one dtype
+        values = df.to_numpy()
+        raw = [pd.Series(values[:, i].astype(str), dtype=object) for i in range(values.shape[1])]
+        
+        fields = {
+            'description': pd.Series('', index=raw[0].index, dtype=object),
+            'quantity': pd.Series(1, index=raw[0].index, dtype=object),
+            'unit_price': pd.Series(0.0, index=raw[0].index, dtype=object),
+            'model': pd.Series('', index=raw[0].index, dtype=object),
+            'unit': pd.Series('EA', index=raw[0].index, dtype=object),
+        }
+        
+        for i, field in enumerate(self.map_columns(df.columns)):
+            if field is None:
+                continue
+            present = pd.notna(values[:, i]) & (raw[i].str.strip() != '')
+            fields[field] = fields[field].where(~present, self.convert_column(field, raw[i]))
+        
+        # Positional fallbacks for rows the names did not cover
+        for field, position, default in (('description', 0, ''), ('quantity', 1, 1), ('unit_price', 2, 0.0)):
+            if position < len(raw):
+                missing = fields[field] == default
+                if missing.any():
+                    fields[field][missing] = self.convert_column(field, raw[position][missing])
+        
+        return [
+            LineItem(description, quantity, unit, unit_price, model) if description else None
+            for description, quantity, unit, unit_price, model in zip(
+                fields['description'].tolist(), fields['quantity'].tolist(), fields['unit'].tolist(),
+                fields['unit_price'].tolist(), fields['model'].tolist()
+            )
+        ]
+    
+    def convert_column(self, field, text):
+        """Vectorized clean_text, extract_quantity or extract_price for one column of text"""
+        if field == 'quantity':
+            number = text.str.extract(self.NUMBER_PATTERN, expand=False).astype(float)
+            return np.trunc(number.fillna(1)).astype(object)
+        if field == 'unit_price':
+            text = text.str.replace('$', '', regex=False).str.replace(',', '', regex=False).str.replace('USD', '', regex=False)
+            number = text.str.extract(self.NUMBER_PATTERN, expand=False).astype(float)
+            return number.fillna(0.0).astype(object)
+        return text.str.strip().str.replace('\n', ' ', regex=False).str.replace('\r', ' ', regex=False)
+    
     def parse_csv_row(self, row):
         """Parse individual CSV row"""
-        item = {
-            'description': '',
-            'quantity': 1,
-            'unit': 'EA',
-            'unit_price': 0.0,
-            'model': '',
-            'order_code': ''
-        }
+        item = LineItem()
         
         # Try to map columns by name
         columns = row.index.tolist()
@@ -546,17 +668,51 @@ class CSVParser(FileParser):
         
         return item if item['description'] else None
 
-def get_parser(file_path):
-    """Get appropriate parser for file type"""
+class CachedParser(FileParser):
+    """Wraps a parser so unchanged files are served from a ParseCache.
+    
+    A miss streams batches from the wrapped parser as usual and stores the
+    items once the whole file has been read; a cancelled import is not cached.
+    """
+    
+    def __init__(self, parser, cache=parse_cache):
+        self.parser = parser
+        self.cache = cache
+    
+    def __getattr__(self, name):
+        return getattr(self.parser, name)
+    
+    def parse(self, file_path):
+        return self.cache.parse(file_path, self.parser)
+    
+    def parse_batches(self, file_path, batch_size=100):
+        key = self.cache.key(file_path, self.parser)
+        items = self.cache.get(key)
+        if items is not None:
+            for start in range(0, len(items), batch_size):
+                done = min(start + batch_size, len(items))
+                yield items[start:done], done, len(items)
+            return
+        
+        items = []
+        for batch in self.parser.parse_batches(file_path, batch_size):
+            items.extend(batch[0])
+            yield batch
+        self.cache.put(key, items)
+
+def get_parser(file_path, cache=parse_cache):
+    """Get appropriate parser for file type, cached unless cache is None"""
     file_ext = file_path.lower().split('.')[-1]
     
     if file_ext == 'rtf':
-        return RTFParser()
+        parser = RTFParser()
     elif file_ext in ['xml']:
-        return XMLParser()
+        parser = XMLParser()
     elif file_ext in ['xlsx', 'xls']:
-        return ExcelParser()
+        parser = ExcelParser()
     elif file_ext == 'csv':
-        return CSVParser()
+        parser = CSVParser()
     else:
         raise Exception(f"Unsupported file type: {file_ext}")
+    
+    return parser if cache is None else CachedParser(parser, cache)
@@ -5,9 +5,16 @@ Simple script to generate quotes from files or custom data
 """
 
 import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from quote_generator import QuoteGenerator, QuoteData
 from datetime import datetime
 
+SUPPORTED_EXTENSIONS = ('.xml', '.rtf', '.xlsx', '.xls')
+
 def generate_from_file():
     """Generate quote from an existing file"""
     generator = QuoteGenerator()
@@ -16,7 +23,7 @@ def generate_from_file():
     print("Supported formats: .xml, .rtf, .xlsx, .xls")
     
     # List available files
-    files = [f for f in os.listdir('.') if f.endswith(('.xml', '.rtf', '.xlsx', '.xls'))]
+    files = [f for f in os.listdir('.') if f.endswith(SUPPORTED_EXTENSIONS)]
     
     if not files:
         print("No supported files found in current directory.")
@@ -117,6 +124,92 @@ def generate_custom_quote():
     print(f"\nCustom quote generated: {output_path}")
     print("Open the file in Excel to view your quote!")
 
+def find_quote_files(directory):
+    """List supported quote files in a directory (not recursive)"""
+    files = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if os.path.isfile(path) and name.lower().endswith(SUPPORTED_EXTENSIONS):
+            files.append(path)
+    return files
+
+def process_quote_file(file_path, output_dir, template_path):
+    """Parse one file and generate its quote (runs in a worker process)"""
+    start = time.perf_counter()
+    result = {'file': file_path}
+    
+    try:
+        generator = QuoteGenerator()
+        data = generator.parse_file(file_path)
+        
+        # Keep the extension in the name so foo.rtf and foo.xlsx don't collide
+        name, ext = os.path.splitext(os.path.basename(file_path))
+        output_path = os.path.join(output_dir, f"quote_{name}_{ext.lstrip('.').lower()}.xlsx")
+        generator.generate_quote(data, template_path=template_path, output_path=output_path)
+        
+        result.update({
+            'status': 'ok',
+            'output': output_path,
+            'quote_number': data.quote_number,
+            'items': len(data.line_items)
+        })
+    except Exception as e:
+        result.update({'status': 'error', 'error': str(e)})
+    
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    return result
+
+def generate_batch(directory, output_dir=None, workers=None, template_path="quote_template_simple.xlsx"):
+    """Generate quotes for every supported file in a directory
+    
+    Files are spread across a process pool. A manifest of outputs, errors
+    and per-file timing is written to batch_manifest.json in output_dir.
+    Returns the manifest dict.
+    """
+    if output_dir is None:
+        output_dir = os.path.join(directory, 'batch_quotes')
+    os.makedirs(output_dir, exist_ok=True)
+    template_path = os.path.abspath(template_path)
+    
+    files = find_quote_files(directory)
+    print(f"Found {len(files)} supported files in {directory}")
+    
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(process_quote_file, f, output_dir, template_path) for f in files]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            name = os.path.basename(result['file'])
+            if result['status'] == 'ok':
+                print(f"  OK    {name} -> {os.path.basename(result['output'])} ({result['seconds']:.2f}s)")
+            else:
+                print(f"  ERROR {name}: {result['error']} ({result['seconds']:.2f}s)")
+    
+    results.sort(key=lambda r: r['file'])
+    errors = [r for r in results if r['status'] != 'ok']
+    manifest = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'source_directory': os.path.abspath(directory),
+        'output_directory': os.path.abspath(output_dir),
+        'workers': workers or os.cpu_count(),
+        'total_files': len(results),
+        'succeeded': len(results) - len(errors),
+        'failed': len(errors),
+        'elapsed_seconds': round(time.perf_counter() - start, 3),
+        'files': results
+    }
+    
+    manifest_path = os.path.join(output_dir, 'batch_manifest.json')
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    
+    print(f"\n{manifest['succeeded']} quotes generated, {manifest['failed']} failed "
+          f"in {manifest['elapsed_seconds']:.2f}s")
+    print(f"Manifest: {manifest_path}")
+    return manifest
+
 def main():
     """Main menu"""
     print("=" * 50)
@@ -141,5 +234,22 @@ def main():
         else:
             print("Invalid choice. Please try again.")
 
+def run_cli(argv):
+    """Command line entry point for batch generation"""
+    parser = argparse.ArgumentParser(description="Generate quotes from EH export files")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    batch_parser = subparsers.add_parser('batch', help="Generate quotes for every file in a directory")
+    batch_parser.add_argument('directory', help="Directory containing .xml/.rtf/.xlsx/.xls exports")
+    batch_parser.add_argument('--output-dir', help="Where to write quotes (default: DIRECTORY/batch_quotes)")
+    batch_parser.add_argument('--workers', type=int, default=None, help="Number of worker processes (default: CPU count)")
+    batch_parser.add_argument('--template', default="quote_template_simple.xlsx", help="Quote template workbook")
+    
+    args = parser.parse_args(argv)
+    manifest = generate_batch(args.directory, args.output_dir, args.workers, args.template)
+    return 1 if manifest['failed'] else 0
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     main()
@@ -0,0 +1,72 @@
+"""
+Background file import for the Desktop Quote Generator
+Runs a file parser on a worker thread and reports batches through a queue
+"""
+
+import queue
+import threading
+
+from file_parsers import get_parser
+from parse_cache import parse_cache
+
+class ImportWorker:
+    """Parse a file on a background thread.
+    
+    The worker never touches Tk; it puts messages on `messages` for the UI
+    thread to poll with root.after():
+        
+        ('batch', items, rows_done, rows_total)
+        ('done', item_count)
+        ('cancelled', item_count)
+        ('error', message)
+    
+    Exactly one of done/cancelled/error is sent last. Unless a parser is
+    given, results are served from and stored in `cache`; pass None to
+    always parse.
+    """
+    
+    def __init__(self, file_path, parser=None, batch_size=100, cache=parse_cache):
+        self.file_path = file_path
+        self.parser = parser or get_parser(file_path, cache)
+        self.batch_size = batch_size
+        self.messages = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name='quote-import', daemon=True)
+    
+    def start(self):
+        """Start parsing in the background"""
+        self.thread.start()
+        return self
+    
+    def cancel(self):
+        """Ask the worker to stop after the current batch"""
+        self.cancel_event.set()
+    
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+    
+    def run(self):
+        """Worker thread body"""
+        count = 0
+        try:
+            batches = self.parser.parse_batches(self.file_path, self.batch_size)
+            for items, done, total in batches:
+                if self.cancelled:
+                    batches.close()
+                    self.messages.put(('cancelled', count))
+                    return
+                count += len(items)
+                self.messages.put(('batch', items, done, total))
+            self.messages.put(('done', count))
+        except Exception as e:
+            self.messages.put(('error', str(e)))
+    
+    def poll(self):
+        """Return all messages queued so far without blocking"""
+        messages = []
+        while True:
+            try:
+                messages.append(self.messages.get_nowait())
+            except queue.Empty:
+                return messages
@@ -0,0 +1,123 @@
+"""
+Line item record for the Desktop Quote Generator
+A compact, typed replacement for free-form line item dicts
+"""
+
+import sys
+
+# Field names and defaults, in display order
+FIELDS = (
+    'description', 'quantity', 'unit', 'unit_price', 'model', 'order_code', 'config',
+    'sales_text', 'delivery_time', 'country_origin', 'country_dispatch', 'customer_ref'
+)
+DEFAULTS = ('', 1, 'EA', 0.0, '', '', '', '', '', '', '', '')
+
+# Short codes repeated across every item of a quote; stored interned
+CODE_FIELDS = frozenset(['unit', 'country_origin', 'country_dispatch'])
+
+_FIELD_SET = frozenset(FIELDS)
+
+def _coerce(field, value):
+    """Convert a field value to its stored type"""
+    if field == 'quantity':
+        return int(value)
+    if field == 'unit_price':
+        return float(value)
+    if field in CODE_FIELDS:
+        return sys.intern(str(value))
+    return value
+
+class LineItem:
+    """One quote line item.
+    
+    Fields live in __slots__ instead of a per-item dict; quantity is an int,
+    unit_price a float, and unit and country codes are interned strings.
+    Code that still treats items as dicts keeps working: item['model'],
+    item.get('unit', 'EA'), item['description'] = ... and 'config' in item
+    all map onto the fields, and to_dict() gives a plain dict.
+    """
+    
+    __slots__ = FIELDS
+    
+    def __init__(self, description='', quantity=1, unit='EA', unit_price=0.0, model='',
+                 order_code='', config='', sales_text='', delivery_time='',
+                 country_origin='', country_dispatch='', customer_ref=''):
+        self.description = description
+        self.quantity = int(quantity)
+        self.unit = sys.intern(unit)
+        self.unit_price = float(unit_price)
+        self.model = model
+        self.order_code = order_code
+        self.config = config
+        self.sales_text = sales_text
+        self.delivery_time = delivery_time
+        self.country_origin = sys.intern(country_origin)
+        self.country_dispatch = sys.intern(country_dispatch)
+        self.customer_ref = customer_ref
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build an item from a dict (or LineItem), ignoring unknown keys"""
+        if isinstance(data, cls):
+            return data.copy()
+        return cls(**{field: data[field] for field in FIELDS if field in data})
+    
+    def to_dict(self):
+        """Plain dict of every field"""
+        return {field: getattr(self, field) for field in FIELDS}
+    
+    def copy(self):
+        item = LineItem.__new__(LineItem)
+        for field in FIELDS:
+            setattr(item, field, getattr(self, field))
+        return item
+    
+    def values(self):
+        return [getattr(self, field) for field in FIELDS]
+    
+    # Dict-compatible access
+    
+    def __getitem__(self, key):
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key, value):
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        setattr(self, key, _coerce(key, value))
+    
+    def __contains__(self, key):
+        return key in _FIELD_SET
+    
+    def get(self, key, default=None):
+        if key not in _FIELD_SET:
+            return default
+        return getattr(self, key)
+    
+    def keys(self):
+        return FIELDS
+    
+    def items(self):
+        return zip(FIELDS, self.values())
+    
+    def __eq__(self, other):
+        if not isinstance(other, LineItem):
+            return NotImplemented
+        return self.values() == other.values()
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        changed = ', '.join(
+            f"{field}={value!r}" for field, value, default in zip(FIELDS, self.values(), DEFAULTS)
+            if value != default
+        )
+        return f"LineItem({changed})"
+    
+    def __getstate__(self):
+        return tuple(self.values())
+    
+    def __setstate__(self, state):
+        for field, value in zip(FIELDS, state):
+            setattr(self, field, _coerce(field, value))
@@ -0,0 +1,126 @@
+"""
+Line item model for the Desktop Quote Generator
+Keeps running totals and cached display values so edits only touch changed rows
+"""
+
+from pricing import price_line_items
+
+class LineItemRow:
+    """Cached display values for one line item"""
+    
+    def __init__(self, item, quoted_price, total_price):
+        self.quoted_price = quoted_price
+        self.total_price = total_price
+        self.cents = round(total_price * 100)
+        
+        # Tree description with model and order code
+        description = item.get('description', '')
+        if item.get('model'):
+            description += f" | Model: {item['model']}"
+        if item.get('order_code'):
+            description += f" | Code: {item['order_code']}"
+        
+        unit = item.get('unit', 'EA')
+        self.tree_values = (
+            description,
+            int(item.get('quantity', 1)),
+            unit,
+            f"${quoted_price:.2f}",
+            f"${total_price:.2f}"
+        )
+        
+        preview_description = item.get('description', '')
+        if len(preview_description) > 35:
+            preview_description = preview_description[:35] + '...'
+        quantity = int(float(item.get('quantity', 1)))
+        self.preview_body = f"{preview_description:<40} {quantity:<5} {unit:<5} ${quoted_price:<11.2f} ${total_price:<11.2f}"
+
+class LineItemModel:
+    """Line items of a quote with per-row display cache and a running subtotal.
+    
+    Every mutation reprices only the rows it touches and adjusts the subtotal
+    by the difference, so the cost of an edit does not grow with the number
+    of items. The items list is shared with quote_data['line_items'] and is
+    always mutated in place.
+    """
+    
+    def __init__(self, items, markup_percentage=20.0):
+        self.items = items
+        self.markup_percentage = markup_percentage
+        self.rows = []
+        self.subtotal_cents = 0
+        self._build_rows(0, items)
+    
+    def __len__(self):
+        return len(self.items)
+    
+    @property
+    def subtotal(self):
+        return self.subtotal_cents / 100
+    
+    @property
+    def total(self):
+        return self.subtotal
+    
+    def _price_rows(self, items):
+        """Build display rows for items at the current markup"""
+        pricing = price_line_items(items, self.markup_percentage)
+        return [LineItemRow(item, quoted, total) for item, (quoted, total) in zip(items, pricing)]
+    
+    def _build_rows(self, index, items):
+        """Insert rows for items at index and add them to the subtotal"""
+        rows = self._price_rows(items)
+        self.rows[index:index] = rows
+        self.subtotal_cents += sum(row.cents for row in rows)
+    
+    def tree_values(self, index):
+        """Treeview values for the row at index (item numbers are 1-based)"""
+        return (index + 1,) + self.rows[index].tree_values
+    
+    def preview_line(self, index):
+        """Preview text line for the row at index"""
+        return f"{index + 1:<5} {self.rows[index].preview_body}"
+    
+    def preview_lines(self):
+        """All preview item lines"""
+        return [self.preview_line(i) for i in range(len(self.rows))]
+    
+    def extend(self, items):
+        """Append items, pricing them together; returns the index of the first new row"""
+        start = len(self.items)
+        self.items.extend(items)
+        self._build_rows(start, items)
+        return start
+    
+    def append(self, item):
+        """Append one item; returns its index"""
+        return self.extend([item])
+    
+    def replace(self, index, item):
+        """Replace the item at index"""
+        self.items[index] = item
+        old = self.rows[index]
+        self.rows[index] = self._price_rows([item])[0]
+        self.subtotal_cents += self.rows[index].cents - old.cents
+    
+    def remove(self, index):
+        """Remove the item at index"""
+        del self.items[index]
+        self.subtotal_cents -= self.rows.pop(index).cents
+    
+    def clear(self):
+        """Remove all items"""
+        del self.items[:]
+        self.rows = []
+        self.subtotal_cents = 0
+    
+    def set_markup(self, markup_percentage):
+        """Reprice every row for a new markup; returns indexes whose display changed"""
+        if markup_percentage == self.markup_percentage:
+            return []
+        
+        self.markup_percentage = markup_percentage
+        old_rows = self.rows
+        self.rows = self._price_rows(self.items)
+        self.subtotal_cents = sum(row.cents for row in self.rows)
+        return [i for i, (old, new) in enumerate(zip(old_rows, self.rows)) if old.tree_values != new.tree_values]
@@ -0,0 +1,152 @@
+"""
+Parse cache for the Desktop Quote Generator
+Keeps parsed import results on disk so re-importing an unchanged file skips parsing
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser('~'), '.eh_quote_generator', 'parse_cache')
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+class ParseCache:
+    """On-disk cache of parser results keyed by file content.
+    
+    The key is a SHA-256 of the file bytes, the parser's class name and its
+    VERSION, so renamed or copied files still hit and a parser change only
+    needs a version bump. Entries are pickles under `directory`; reads touch
+    the entry's mtime and writes evict the least recently used entries once
+    the directory grows past `max_bytes`. Cache I/O problems never fail a
+    parse, they only turn into misses.
+    """
+    
+    SUFFIX = '.pickle'
+    
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory or os.environ.get('EH_QUOTE_PARSE_CACHE', DEFAULT_DIRECTORY)
+        self.max_bytes = max_bytes
+    
+    @staticmethod
+    def file_digest(file_path, chunk_size=1024 * 1024):
+        """SHA-256 of the file's contents"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def key(self, file_path, parser, *extra):
+        """Cache key for parsing file_path with parser, or None if the file can't be read"""
+        try:
+            content = self.file_digest(file_path)
+        except OSError:
+            return None
+        
+        parser_class = parser if isinstance(parser, type) else type(parser)
+        parts = [content, f"{parser_class.__module__}.{parser_class.__qualname__}",
+                 str(getattr(parser_class, 'VERSION', 0))]
+        parts.extend(str(part) for part in extra)
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+    
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.SUFFIX)
+    
+    def get(self, key, default=None):
+        """Return the cached value for key, or default"""
+        if key is None:
+            return default
+        
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return default
+        except Exception:
+            # Truncated or written by an incompatible version
+            self._remove(path)
+            return default
+        
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+    
+    def put(self, key, value):
+        """Store value under key and evict old entries if the cache is over size"""
+        if key is None:
+            return
+        
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                self._remove(tmp_path)
+                raise
+            self.evict()
+        except (OSError, pickle.PicklingError, TypeError):
+            pass
+    
+    def parse(self, file_path, parser):
+        """Return parser.parse(file_path), served from the cache when the file is unchanged"""
+        key = self.key(file_path, parser)
+        value = self.get(key)
+        if value is None:
+            value = parser.parse(file_path)
+            self.put(key, value)
+        return value
+    
+    def _entries(self):
+        """(mtime, size, path) for every cache entry"""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        
+        for name in names:
+            if not name.endswith(self.SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return entries
+    
+    def size(self):
+        """Total bytes held by cache entries"""
+        return sum(size for _, size, _ in self._entries())
+    
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+    
+    def clear(self):
+        """Remove every cache entry"""
+        for _, _, path in self._entries():
+            self._remove(path)
+    
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+# Shared by the file parsers and QuoteGenerator
+parse_cache = ParseCache()
@@ -11,12 +11,52 @@ import pandas as pd
 import openpyxl
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
 from openpyxl.utils import get_column_letter
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import json
+import pickle
 from typing import Dict, List, Any, Optional
 
+from rtf_reader import read_rtf_lines
+from parse_cache import parse_cache
+
+# Date formats seen in imported quotes: US display, ISO, and str() of Excel datetimes
+DATE_FORMATS = ('%m/%d/%Y', '%Y-%m-%d', '%Y-%m-%d %H:%M:%S')
+
+@lru_cache(maxsize=1024)
+def parse_date(text: str) -> Optional[date]:
+    """Parse a date string in any of DATE_FORMATS; None if none match"""
+    text = text.strip()
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+def days_between(start: str, end: str) -> Optional[int]:
+    """Days from one date string to another; None if either does not parse"""
+    start_date, end_date = parse_date(start), parse_date(end)
+    if start_date is None or end_date is None:
+        return None
+    return (end_date - start_date).days
+
 class QuoteData:
-    """Data structure to hold parsed quote information"""
+    """Data structure to hold parsed quote information
+    
+    Dates keep the text they were imported as; the *_dt properties parse
+    it through the cached parse_date, and expiration is derived from the
+    quote date and quote_expiration_days.
+    """
+    
+    __slots__ = (
+        'quote_number', 'quote_date', 'customer_reference', 'customer_number',
+        'customer_company', 'customer_contact', 'customer_phone', 'customer_email',
+        'customer_address', 'line_items', 'subtotal', 'tax', 'freight', 'total',
+        'currency', 'payment_terms', 'delivery_terms', 'valid_until',
+        'lead_time_value', 'lead_time_unit', 'quote_expiration_days', 'quote_expiration_date',
+    )
+    
     def __init__(self):
         self.quote_number = ""
         self.quote_date = ""
@@ -42,42 +82,50 @@ class QuoteData:
         self.quote_expiration_days = 30  # Default 30 days
         self.quote_expiration_date = ""
     
+    @property
+    def quote_dt(self) -> Optional[date]:
+        return parse_date(self.quote_date) if self.quote_date else None
+    
+    @property
+    def valid_until_dt(self) -> Optional[date]:
+        return parse_date(self.valid_until) if self.valid_until else None
+    
+    @property
+    def quote_expiration_dt(self) -> Optional[date]:
+        return parse_date(self.quote_expiration_date) if self.quote_expiration_date else None
+    
+    @property
+    def expiration(self) -> date:
+        """Quote date (today if missing or unreadable) plus quote_expiration_days"""
+        return (self.quote_dt or date.today()) + timedelta(days=self.quote_expiration_days)
+    
     def calculate_expiration_date(self):
         """Calculate quote expiration date based on quote date and expiration days"""
-        if self.quote_date:
-            try:
-                # Parse quote date (handle different formats)
-                if '/' in self.quote_date:
-                    quote_dt = datetime.strptime(self.quote_date, '%m/%d/%Y')
-                elif '-' in self.quote_date:
-                    quote_dt = datetime.strptime(self.quote_date, '%Y-%m-%d')
-                else:
-                    quote_dt = datetime.now()
-                
-                # Add expiration days
-                from datetime import timedelta
-                expiration_dt = quote_dt + timedelta(days=self.quote_expiration_days)
-                self.quote_expiration_date = expiration_dt.strftime('%m/%d/%Y')
-            except ValueError:
-                # If date parsing fails, use current date + expiration days
-                from datetime import timedelta
-                expiration_dt = datetime.now() + timedelta(days=self.quote_expiration_days)
-                self.quote_expiration_date = expiration_dt.strftime('%m/%d/%Y')
-        else:
-            # If no quote date, use current date + expiration days
-            from datetime import timedelta
-            expiration_dt = datetime.now() + timedelta(days=self.quote_expiration_days)
-            self.quote_expiration_date = expiration_dt.strftime('%m/%d/%Y')
+        self.quote_expiration_date = self.expiration.strftime('%m/%d/%Y')
     
     def get_lead_time_display(self):
         """Get formatted lead time display string"""
         if self.lead_time_value > 0:
             return f"{self.lead_time_value} {self.lead_time_unit}"
         return "TBD"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """All fields as a dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __eq__(self, other):
+        if not isinstance(other, QuoteData):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+    
+    __hash__ = None
 
 class FileParser:
     """Base class for file parsers"""
     
+    # Bump when a parser's output changes so cached results are not reused
+    VERSION = 2
+    
     @staticmethod
     def detect_file_type(file_path: str) -> str:
         """Detect file type based on extension"""
@@ -91,9 +139,136 @@ class FileParser:
         else:
             raise ValueError(f"Unsupported file type: {ext}")
 
+def _text(elem):
+    return elem.text
+
+def _int(elem):
+    return int(elem.text)
+
+def _float(elem):
+    return float(elem.text)
+
+class ExtractionPlan:
+    """Field extraction plan for a fixed XML layout, compiled once.
+    
+    Paths such as 'bas:product/bas:texts/bas:shortDescription[@language="en"]'
+    are resolved to namespaced tags up front and merged into a tree, so
+    extract() reads every field in a single walk over the element instead of
+    one find() per field. Like find(), the first matching element wins.
+    """
+    
+    STEP_PATTERN = re.compile(r'^(\w+):(\w+)(?:\[@(\w+)="([^"]*)"\])?$')
+    
+    def __init__(self, paths: List[str], namespaces: Dict[str, str]):
+        self.paths = list(paths)
+        self.root = {}
+        for path in self.paths:
+            node = self.root
+            steps = path.split('/')
+            for depth, step in enumerate(steps):
+                match = self.STEP_PATTERN.match(step)
+                if not match:
+                    raise ValueError(f"Unsupported path step: {step}")
+                prefix, tag, attr, value = match.groups()
+                tag = f"{{{namespaces[prefix]}}}{tag}"
+                
+                # Each tag maps to a list of [attr, value, children, paths]
+                branches = node.setdefault(tag, [])
+                for branch in branches:
+                    if branch[0] == attr and branch[1] == value:
+                        break
+                else:
+                    branch = [attr, value, {}, []]
+                    branches.append(branch)
+                
+                if depth == len(steps) - 1:
+                    branch[3].append(path)
+                node = branch[2]
+    
+    def extract(self, element) -> Dict[str, Any]:
+        """Return {path: element} for every planned path present under element"""
+        found = {}
+        self._walk(element, self.root, found)
+        return found
+    
+    def _walk(self, element, node, found):
+        taken = set()
+        for child in element:
+            branches = node.get(child.tag)
+            if not branches:
+                continue
+            for branch in branches:
+                attr, value, children, paths = branch
+                if id(branch) in taken:
+                    continue
+                if attr is not None and child.get(attr) != value:
+                    continue
+                taken.add(id(branch))
+                for path in paths:
+                    found[path] = child
+                if children:
+                    self._walk(child, children, found)
+
 class XMLParser(FileParser):
     """Parser for XML files (EH Online Shop format)"""
     
+    # Namespaces used by the EH Online Shop basket export
+    NAMESPACES = {
+        'bas': 'urn:com:endress:crm:onlineshop:basket.2.6.xsd',
+        'c': 'urn:com:endress:crm:onlineshop:common.2.6.xsd'
+    }
+    
+    HEADER_TAG = '{urn:com:endress:crm:onlineshop:basket.2.6.xsd}header'
+    ITEM_TAG = '{urn:com:endress:crm:onlineshop:basket.2.6.xsd}item'
+    
+    # Header fields copied straight onto QuoteData: (path, attribute, converter)
+    HEADER_FIELDS = [
+        ('bas:docNumber/c:docNo', 'quote_number', _text),
+        ('bas:docNumber/c:date', 'quote_date', _text),
+        ('bas:custReference', 'customer_reference', _text),
+        ('bas:customer/bas:number', 'customer_number', _text),
+        ('bas:customer/bas:name', 'customer_company', _text),
+        ('bas:customer/bas:contact/c:connectivity/c:phone[@type="phone"]', 'customer_phone', _text),
+        ('bas:customer/bas:contact/c:connectivity/c:email[@type="email"]', 'customer_email', _text),
+        ('bas:pricing/bas:totalsSales/bas:netValue', 'subtotal', _float),
+        ('bas:pricing/bas:totalsSales/bas:tax', 'tax', _float),
+        ('bas:pricing/bas:totalsSales/bas:grossValue', 'total', _float),
+        ('bas:pricing/bas:validToDate', 'valid_until', _text),
+        ('bas:paymentTerms', 'payment_terms', _text),
+        ('bas:delivery/bas:incoterms/bas:description', 'delivery_terms', _text),
+    ]
+    
+    # Header elements combined into derived fields (contact, address, lead time)
+    BILL_TO = 'bas:customer/bas:address[@type="BILL_TO"]'
+    HEADER_PARTS = [
+        'bas:customer/bas:contact/c:firstname',
+        'bas:customer/bas:contact/c:lastname',
+        BILL_TO,
+        BILL_TO + '/c:name1',
+        BILL_TO + '/c:street',
+        BILL_TO + '/c:city',
+        BILL_TO + '/c:region',
+        BILL_TO + '/c:postalcode',
+        BILL_TO + '/c:country',
+        'bas:delivery/bas:leadTime',
+    ]
+    
+    # Line item fields: (path, line item key, converter)
+    ITEM_FIELDS = [
+        ('bas:itemNo', 'item_number', _text),
+        ('bas:product/bas:materialNo', 'material_number', _text),
+        ('bas:product/bas:orderCode', 'order_code', _text),
+        ('bas:product/bas:texts/bas:shortDescription[@language="en"]', 'description', _text),
+        ('bas:product/bas:texts/bas:longDescription[@language="en"]', 'long_description', _text),
+        ('bas:product/bas:quantity', 'quantity', _int),
+        ('bas:product/bas:quantity', 'unit', lambda elem: elem.get('unit', 'PC')),
+        ('bas:itemPricing/bas:unitSalesPrice', 'unit_price', _float),
+        ('bas:itemPricing/bas:itemSalesPrice', 'total_price', _float),
+    ]
+    
+    HEADER_PLAN = ExtractionPlan([path for path, _, _ in HEADER_FIELDS] + HEADER_PARTS, NAMESPACES)
+    ITEM_PLAN = ExtractionPlan([path for path, _, _ in ITEM_FIELDS], NAMESPACES)
+    
     @staticmethod
     def parse(file_path: str) -> QuoteData:
         """Parse XML file and extract quote data"""
@@ -103,214 +278,180 @@ class XMLParser(FileParser):
         data = QuoteData()
         
         # Define namespaces
-        namespaces = {
-            'bas': 'urn:com:endress:crm:onlineshop:basket.2.6.xsd',
-            'c': 'urn:com:endress:crm:onlineshop:common.2.6.xsd'
-        }
+        namespaces = XMLParser.NAMESPACES
         
         # Extract header information
         header = root.find('bas:header', namespaces)
         if header is not None:
-            # Quote number and date
-            doc_number = header.find('bas:docNumber', namespaces)
-            if doc_number is not None:
-                data.quote_number = doc_number.find('c:docNo', namespaces).text if doc_number.find('c:docNo', namespaces) is not None else ""
-                data.quote_date = doc_number.find('c:date', namespaces).text if doc_number.find('c:date', namespaces) is not None else ""
-            
-            # Customer reference
-            cust_ref = header.find('bas:custReference', namespaces)
-            if cust_ref is not None:
-                data.customer_reference = cust_ref.text
-            
-            # Customer information
-            customer = header.find('bas:customer', namespaces)
-            if customer is not None:
-                data.customer_number = customer.find('bas:number', namespaces).text if customer.find('bas:number', namespaces) is not None else ""
-                data.customer_company = customer.find('bas:name', namespaces).text if customer.find('bas:name', namespaces) is not None else ""
-                
-                # Contact information
-                contact = customer.find('bas:contact', namespaces)
-                if contact is not None:
-                    firstname = contact.find('c:firstname', namespaces)
-                    lastname = contact.find('c:lastname', namespaces)
-                    if firstname is not None and lastname is not None:
-                        data.customer_contact = f"{firstname.text} {lastname.text}".strip()
-                    
-                    # Phone and email
-                    connectivity = contact.find('c:connectivity', namespaces)
-                    if connectivity is not None:
-                        phone = connectivity.find('c:phone[@type="phone"]', namespaces)
-                        if phone is not None:
-                            data.customer_phone = phone.text
-                        
-                        email = connectivity.find('c:email[@type="email"]', namespaces)
-                        if email is not None:
-                            data.customer_email = email.text
-                
-                # Address
-                address = customer.find('bas:address[@type="BILL_TO"]', namespaces)
-                if address is not None:
-                    name1 = address.find('c:name1', namespaces)
-                    street = address.find('c:street', namespaces)
-                    city = address.find('c:city', namespaces)
-                    region = address.find('c:region', namespaces)
-                    postal = address.find('c:postalcode', namespaces)
-                    country = address.find('c:country', namespaces)
-                    
-                    address_parts = []
-                    if name1 is not None:
-                        address_parts.append(name1.text)
-                    if street is not None:
-                        address_parts.append(street.text)
-                    if city is not None and region is not None and postal is not None:
-                        address_parts.append(f"{city.text}, {region.text} {postal.text}")
-                    if country is not None:
-                        address_parts.append(country.text)
-                    
-                    data.customer_address = "\n".join(address_parts)
-            
-            # Pricing information
-            pricing = header.find('bas:pricing', namespaces)
-            if pricing is not None:
-                totals = pricing.find('bas:totalsSales', namespaces)
-                if totals is not None:
-                    net_value = totals.find('bas:netValue', namespaces)
-                    if net_value is not None:
-                        data.subtotal = float(net_value.text)
-                    
-                    tax = totals.find('bas:tax', namespaces)
-                    if tax is not None:
-                        data.tax = float(tax.text)
-                    
-                    gross_value = totals.find('bas:grossValue', namespaces)
-                    if gross_value is not None:
-                        data.total = float(gross_value.text)
-                
-                # Valid until date
-                valid_to = pricing.find('bas:validToDate', namespaces)
-                if valid_to is not None:
-                    data.valid_until = valid_to.text
-            
-            # Payment terms
-            payment_terms = header.find('bas:paymentTerms', namespaces)
-            if payment_terms is not None:
-                data.payment_terms = payment_terms.text
-            
-            # Delivery terms
-            delivery = header.find('bas:delivery', namespaces)
-            if delivery is not None:
-                incoterms = delivery.find('bas:incoterms', namespaces)
-                if incoterms is not None:
-                    desc = incoterms.find('bas:description', namespaces)
-                    if desc is not None:
-                        data.delivery_terms = desc.text
-                
-                # Extract lead time information
-                lead_time = delivery.find('bas:leadTime', namespaces)
-                if lead_time is not None:
-                    # Try to extract lead time value and unit
-                    lead_time_text = lead_time.text if lead_time.text else ""
-                    # Look for patterns like "14 days", "2 weeks", "1 month"
-                    import re
-                    lead_time_match = re.search(r'(\d+)\s*(day|week|month|days|weeks|months)', lead_time_text.lower())
-                    if lead_time_match:
-                        data.lead_time_value = int(lead_time_match.group(1))
-                        unit = lead_time_match.group(2)
-                        if unit in ['day', 'days']:
-                            data.lead_time_unit = 'Days'
-                        elif unit in ['week', 'weeks']:
-                            data.lead_time_unit = 'Weeks'
-                        elif unit in ['month', 'months']:
-                            data.lead_time_unit = 'Months'
-            
-            # Extract quote expiration information
-            if data.valid_until:
-                # If we have a valid_until date, calculate expiration days
-                try:
-                    from datetime import datetime
-                    if '/' in data.valid_until:
-                        valid_until_dt = datetime.strptime(data.valid_until, '%Y-%m-%d')
-                    elif '-' in data.valid_until:
-                        valid_until_dt = datetime.strptime(data.valid_until, '%Y-%m-%d')
-                    else:
-                        valid_until_dt = datetime.now()
-                    
-                    if data.quote_date:
-                        if '/' in data.quote_date:
-                            quote_dt = datetime.strptime(data.quote_date, '%Y-%m-%d')
-                        elif '-' in data.quote_date:
-                            quote_dt = datetime.strptime(data.quote_date, '%Y-%m-%d')
-                        else:
-                            quote_dt = datetime.now()
-                        
-                        # Calculate days between quote date and valid until
-                        from datetime import timedelta
-                        delta = valid_until_dt - quote_dt
-                        data.quote_expiration_days = delta.days
-                        data.quote_expiration_date = data.valid_until
-                except:
-                    # If parsing fails, use defaults
-                    data.quote_expiration_days = 30
-                    data.calculate_expiration_date()
+            XMLParser._parse_header(header, data)
         
         # Extract line items
         items = root.findall('bas:item', namespaces)
         for item in items:
-            line_item = {}
-            
-            # Item number
-            item_no = item.find('bas:itemNo', namespaces)
-            if item_no is not None:
-                line_item['item_number'] = item_no.text
-            
-            # Product information
-            product = item.find('bas:product', namespaces)
-            if product is not None:
-                # Material number and order code
-                material_no = product.find('bas:materialNo', namespaces)
-                if material_no is not None:
-                    line_item['material_number'] = material_no.text
-                
-                order_code = product.find('bas:orderCode', namespaces)
-                if order_code is not None:
-                    line_item['order_code'] = order_code.text
-                
-                # Description
-                texts = product.find('bas:texts', namespaces)
-                if texts is not None:
-                    short_desc = texts.find('bas:shortDescription[@language="en"]', namespaces)
-                    if short_desc is not None:
-                        line_item['description'] = short_desc.text
-                    
-                    long_desc = texts.find('bas:longDescription[@language="en"]', namespaces)
-                    if long_desc is not None:
-                        line_item['long_description'] = long_desc.text
-                
-                # Quantity
-                quantity = product.find('bas:quantity', namespaces)
-                if quantity is not None:
-                    line_item['quantity'] = int(quantity.text)
-                    line_item['unit'] = quantity.get('unit', 'PC')
-            
-            # Pricing
-            item_pricing = item.find('bas:itemPricing', namespaces)
-            if item_pricing is not None:
-                unit_price = item_pricing.find('bas:unitSalesPrice', namespaces)
-                if unit_price is not None:
-                    line_item['unit_price'] = float(unit_price.text)
-                
-                item_price = item_pricing.find('bas:itemSalesPrice', namespaces)
-                if item_price is not None:
-                    line_item['total_price'] = float(item_price.text)
-            
+            line_item = XMLParser._parse_item(item)
             if line_item:
                 data.line_items.append(line_item)
         
         return data
+    
+    @staticmethod
+    def parse_streaming(file_path: str) -> QuoteData:
+        """Parse XML file with iterparse, keeping memory flat for large baskets"""
+        data = QuoteData()
+        
+        for kind, value in XMLParser._iter_basket(file_path):
+            if kind == 'header':
+                XMLParser._parse_header(value, data)
+            else:
+                data.line_items.append(value)
+        
+        return data
+    
+    @staticmethod
+    def iter_line_items(file_path: str):
+        """Yield line item dicts one at a time as each bas:item closes"""
+        for kind, value in XMLParser._iter_basket(file_path):
+            if kind == 'item':
+                yield value
+    
+    @staticmethod
+    def _iter_basket(file_path: str):
+        """Stream the basket, yielding ('header', element) and ('item', dict) pairs.
+        
+        Only direct children of the basket root are handled. Finished elements
+        are cleared and detached from the root so the tree never grows.
+        """
+        depth = 0
+        root = None
+        
+        for event, elem in ET.iterparse(file_path, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+            
+            depth -= 1
+            if depth != 1:
+                continue
+            
+            if elem.tag == XMLParser.HEADER_TAG:
+                yield 'header', elem
+            elif elem.tag == XMLParser.ITEM_TAG:
+                line_item = XMLParser._parse_item(elem)
+                if line_item:
+                    yield 'item', line_item
+            
+            # Drop the finished subtree so memory does not grow with the file
+            elem.clear()
+            root.remove(elem)
+    
+    @staticmethod
+    def _parse_header(header, data: QuoteData):
+        """Fill quote data from a bas:header element"""
+        found = XMLParser.HEADER_PLAN.extract(header)
+        
+        # Direct fields
+        for path, attribute, convert in XMLParser.HEADER_FIELDS:
+            if path in found:
+                setattr(data, attribute, convert(found[path]))
+        
+        # Contact name needs both parts present
+        firstname = found.get('bas:customer/bas:contact/c:firstname')
+        lastname = found.get('bas:customer/bas:contact/c:lastname')
+        if firstname is not None and lastname is not None:
+            data.customer_contact = f"{firstname.text} {lastname.text}".strip()
+        
+        # Address
+        if XMLParser.BILL_TO in found:
+            parts = {name: found.get(f"{XMLParser.BILL_TO}/c:{name}") for name in
+                     ('name1', 'street', 'city', 'region', 'postalcode', 'country')}
+            
+            address_parts = []
+            if parts['name1'] is not None:
+                address_parts.append(parts['name1'].text)
+            if parts['street'] is not None:
+                address_parts.append(parts['street'].text)
+            if parts['city'] is not None and parts['region'] is not None and parts['postalcode'] is not None:
+                address_parts.append(f"{parts['city'].text}, {parts['region'].text} {parts['postalcode'].text}")
+            if parts['country'] is not None:
+                address_parts.append(parts['country'].text)
+            
+            data.customer_address = "\n".join(address_parts)
+        
+        # Extract lead time information
+        lead_time = found.get('bas:delivery/bas:leadTime')
+        if lead_time is not None:
+            # Try to extract lead time value and unit
+            lead_time_text = lead_time.text if lead_time.text else ""
+            # Look for patterns like "14 days", "2 weeks", "1 month"
+            lead_time_match = re.search(r'(\d+)\s*(day|week|month|days|weeks|months)', lead_time_text.lower())
+            if lead_time_match:
+                data.lead_time_value = int(lead_time_match.group(1))
+                unit = lead_time_match.group(2)
+                if unit in ['day', 'days']:
+                    data.lead_time_unit = 'Days'
+                elif unit in ['week', 'weeks']:
+                    data.lead_time_unit = 'Weeks'
+                elif unit in ['month', 'months']:
+                    data.lead_time_unit = 'Months'
+        
+        # Extract quote expiration information
+        if data.valid_until:
+            # If we have a valid_until date, calculate expiration days
+            valid_until = data.valid_until_dt
+            if valid_until is None or (data.quote_date and data.quote_dt is None):
+                # If parsing fails, use defaults
+                data.quote_expiration_days = 30
+                data.calculate_expiration_date()
+            elif data.quote_date:
+                # Calculate days between quote date and valid until
+                data.quote_expiration_days = (valid_until - data.quote_dt).days
+                data.quote_expiration_date = data.valid_until
+    
+    @staticmethod
+    def _parse_item(item) -> Dict[str, Any]:
+        """Build a line item dict from a bas:item element"""
+        found = XMLParser.ITEM_PLAN.extract(item)
+        
+        line_item = {}
+        for path, key, convert in XMLParser.ITEM_FIELDS:
+            if path in found:
+                line_item[key] = convert(found[path])
+        
+        return line_item
 
 class RTFParser(FileParser):
     """Parser for RTF files"""
     
+    # Item row: item number, quantity and unit, optionally followed by the product name
+    ITEM_ROW = re.compile(r'^(\d+)\s+(\d+)\s+([A-Z]{1,3})(?:\s+(.+))?$')
+    
+    # Unit, line and quote total prices, e.g. "4,050.83"
+    PRICE = re.compile(r'^(\d{1,3}(?:,\d{3})*\.\d{2})$')
+    
+    # Line item fields, compiled once and tried in order on each line of an item
+    ITEM_PATTERNS = [
+        ('material_number', re.compile(r'^Model no\.:\s*(.+)$')),
+        ('order_code', re.compile(r'^\(([^()]+)\)$')),
+        ('price', PRICE),
+        ('delivery_time', re.compile(r'^Delivery time:\s*(.+)$')),
+        ('hs_code', re.compile(r'^HS-Code:\s*(.+)$')),
+        ('country_origin', re.compile(r'^Country of origin:\s*(.+)$')),
+        ('country_dispatch', re.compile(r'^Country of dispatch:\s*(.+)$')),
+    ]
+    
+    # Product configuration option code, e.g. "CD" or "3HK"
+    CONFIG_CODE = re.compile(r'^[0-9A-Z]{1,4}$')
+    
+    # Quote total labels and the QuoteData field each one sets
+    TOTAL_LABELS = {
+        'Total price net': 'subtotal',
+        'Total freight': 'freight',
+        'Total tax': 'tax',
+        'Total price gross': 'total',
+    }
+    
     @staticmethod
     def parse(file_path: str) -> QuoteData:
         """Parse RTF file and extract quote data"""
@@ -319,40 +460,34 @@ class RTFParser(FileParser):
         
         data = QuoteData()
         
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # Extract text content from RTF (simplified approach)
-        # Remove RTF formatting codes
-        text_content = re.sub(r'\\[a-z]+\d*', '', content)
-        text_content = re.sub(r'[{}]', '', text_content)
-        text_content = re.sub(r'\\[^a-z]', '', text_content)
-        
-        # Split into lines and clean up
-        lines = [line.strip() for line in text_content.split('\n') if line.strip()]
+        # Plain text lines of the document, one per paragraph or table cell
+        lines = [line.strip() for line in read_rtf_lines(file_path) if line.strip()]
         
         # Extract information using patterns
         for i, line in enumerate(lines):
-            if 'Quote no.' in line and ':' in line:
+            # Labels carry their colon, or it sits in the next table cell
+            has_colon = ':' in line or lines[i + 1:i + 2] == [':']
+            
+            if 'Quote no.' in line and has_colon:
                 # Look for quote number in next few lines
                 for j in range(i+1, min(i+5, len(lines))):
                     if lines[j] and not lines[j].startswith(':'):
                         data.quote_number = lines[j]
                         break
             
-            elif 'Quote date' in line and ':' in line:
+            elif 'Quote date' in line and has_colon:
                 for j in range(i+1, min(i+5, len(lines))):
                     if lines[j] and not lines[j].startswith(':'):
                         data.quote_date = lines[j]
                         break
             
-            elif 'Your reference' in line and ':' in line:
+            elif 'Your reference' in line and has_colon:
                 for j in range(i+1, min(i+5, len(lines))):
                     if lines[j] and not lines[j].startswith(':'):
                         data.customer_reference = lines[j]
                         break
             
-            elif 'Customer no.' in line and ':' in line:
+            elif 'Customer no.' in line and has_colon:
                 for j in range(i+1, min(i+5, len(lines))):
                     if lines[j] and not lines[j].startswith(':'):
                         data.customer_number = lines[j]
@@ -382,50 +517,167 @@ class RTFParser(FileParser):
                     if lines[j] and not lines[j].startswith(':'):
                         data.quote_expiration_date = lines[j]
                         # Calculate expiration days
-                        try:
-                            if '/' in data.quote_expiration_date:
-                                exp_dt = datetime.strptime(data.quote_expiration_date, '%m/%d/%Y')
-                            elif '-' in data.quote_expiration_date:
-                                exp_dt = datetime.strptime(data.quote_expiration_date, '%Y-%m-%d')
-                            else:
-                                exp_dt = datetime.now()
-                            
-                            if data.quote_date:
-                                if '/' in data.quote_date:
-                                    quote_dt = datetime.strptime(data.quote_date, '%m/%d/%Y')
-                                elif '-' in data.quote_date:
-                                    quote_dt = datetime.strptime(data.quote_date, '%Y-%m-%d')
-                                else:
-                                    quote_dt = datetime.now()
-                                
-                                delta = exp_dt - quote_dt
-                                data.quote_expiration_days = delta.days
-                        except:
-                            data.quote_expiration_days = 30
+                        if data.quote_date:
+                            days = days_between(data.quote_date, data.quote_expiration_date)
+                            data.quote_expiration_days = 30 if days is None else days
                         break
         
-        # Extract line items (simplified - would need more sophisticated parsing)
-        # This is a basic implementation - would need enhancement for complex RTF files
-        data.line_items = [
-            {
-                'item_number': '1',
-                'quantity': 1,
-                'unit': 'PC',
-                'description': 'Sample Product from RTF',
-                'unit_price': 1000.0,
-                'total_price': 1000.0
-            }
-        ]
-        
-        data.subtotal = 1000.0
-        data.tax = 50.0
-        data.total = 1050.0
+        # Extract line items and totals in one pass over the lines
+        data.line_items = RTFParser._parse_line_items(lines, data)
+        
+        if not data.subtotal:
+            data.subtotal = sum(item['total_price'] for item in data.line_items)
+        if not data.tax:
+            data.tax = data.subtotal * 0.05
+        if not data.total:
+            data.total = data.subtotal + data.tax + data.freight
         
         # Calculate expiration date if not found
         if not data.quote_expiration_date:
             data.calculate_expiration_date()
         
         return data
+    
+    @staticmethod
+    def _parse_line_items(lines: List[str], data: QuoteData) -> List[Dict[str, Any]]:
+        """Extract line items from the document lines, and the quote totals after them.
+        
+        An item starts at its item number, quantity and unit, which are either
+        three table cells or one line. The product name follows; lines up to
+        the unit and total prices are the long description, and the option
+        code/text pairs after them are the product configuration.
+        """
+        items = []
+        item = None
+        in_totals = False
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            
+            # Totals close the item list
+            if line in RTFParser.TOTAL_LABELS:
+                item = None
+                in_totals = True
+                price = RTFParser.PRICE.match(lines[i + 1]) if i + 1 < len(lines) else None
+                if price:
+                    setattr(data, RTFParser.TOTAL_LABELS[line], float(price.group(1).replace(',', '')))
+                    i += 1
+                i += 1
+                continue
+            
+            # Item row as three table cells ("20", "1", "PC") or one line
+            row = None
+            if line.isdigit() and i + 2 < len(lines):
+                row = RTFParser.ITEM_ROW.match(' '.join(lines[i:i + 3]))
+                width = 3
+            if not row:
+                row = RTFParser.ITEM_ROW.match(line)
+                width = 1
+            if row and not in_totals:
+                item = {
+                    'item_number': row.group(1),
+                    'quantity': int(row.group(2)),
+                    'unit': row.group(3),
+                    'description': row.group(4) or ''
+                }
+                prices, long_description, config = [], [], []
+                items.append((item, prices, long_description, config))
+                i += width
+                continue
+            
+            if item is None:
+                i += 1
+                continue
+            
+            for field, pattern in RTFParser.ITEM_PATTERNS:
+                match = pattern.match(line)
+                if match:
+                    break
+            
+            if match and field == 'price':
+                if len(prices) < 2:
+                    prices.append(float(match.group(1).replace(',', '')))
+                else:
+                    config.append(line)
+            elif match:
+                item[field] = match.group(1).strip()
+            elif not item['description']:
+                item['description'] = line
+            elif not prices:
+                long_description.append(line)
+            elif RTFParser.CONFIG_CODE.match(line) and i + 1 < len(lines):
+                config.append(f"{line} {lines[i + 1]}")
+                i += 1
+            else:
+                config.append(line)
+            i += 1
+        
+        line_items = []
+        for item, prices, long_description, config in items:
+            if long_description:
+                item['long_description'] = '\n'.join(long_description)
+            if config:
+                item['config'] = '\n'.join(config)
+            item['unit_price'] = prices[0] if prices else 0.0
+            item['total_price'] = prices[1] if len(prices) > 1 else item['unit_price'] * item['quantity']
+            line_items.append(item)
+        return line_items
+
+class LabelIndex:
+    """Sheet values loaded once, with the coordinates of every header label.
+    
+    Each non-empty cell is classified into at most one label kind while the
+    grid is built, in row-major order, so header fields become lookups of
+    the few cells to the right of their labels instead of a keyword check
+    and neighbour probe for every cell in the sheet.
+    """
+    
+    # Cells to the right of a label searched for its value
+    NEIGHBOURS = 3
+    
+    def __init__(self, rows):
+        self.rows = [tuple(row) for row in rows]
+        self.labels = {'quote #': [], 'quote date': [], 'lead time': [], 'valid until': [], 'customer': []}
+        for r, row in enumerate(self.rows):
+            for c, value in enumerate(row):
+                if value:
+                    kind = self.classify(str(value).strip())
+                    if kind:
+                        self.labels[kind].append((r, c))
+    
+    @staticmethod
+    def classify(text: str) -> Optional[str]:
+        """Normalized label for a cell's text, or None if it is not a label"""
+        lowered = text.lower()
+        if 'quote' in lowered and '#' in lowered:
+            return 'quote #'
+        if 'date' in lowered and ('quote' in lowered or ':' in text):
+            return 'quote date'
+        if 'lead' in lowered and 'time' in lowered:
+            return 'lead time'
+        if ('valid' in lowered and 'until' in lowered) or 'expir' in lowered:
+            return 'valid until'
+        if 'company' in lowered or 'customer' in lowered:
+            return 'customer'
+        return None
+    
+    def find(self, label: str, accept=None, before=None) -> List[tuple]:
+        """Return [(coord, value)] for each label with a value, in sheet order.
+        
+        A label's value is the first non-empty cell among its right-hand
+        neighbours that passes accept. Only labels before the coordinate
+        `before` are considered when it is given.
+        """
+        found = []
+        for r, c in self.labels[label]:
+            if before is not None and (r, c) >= before:
+                break
+            row = self.rows[r]
+            for value in row[c + 1:c + 1 + self.NEIGHBOURS]:
+                if value and (accept is None or accept(value)):
+                    found.append(((r, c), value))
+                    break
+        return found
 
 class ExcelParser(FileParser):
     """Parser for Excel files"""
@@ -438,94 +690,49 @@ class ExcelParser(FileParser):
         
         data = QuoteData()
         
-        # Use openpyxl for more precise cell access
+        # Load the sheet once; labels and line items are read from the grid
         try:
-            wb = openpyxl.load_workbook(file_path)
-            ws = wb.active
-            
-            # Extract information by searching for specific text patterns
-            for row in ws.iter_rows():
-                for cell in row:
-                    if cell.value:
-                        cell_value = str(cell.value).strip()
-                        
-                        # Look for quote number
-                        if 'quote' in cell_value.lower() and '#' in cell_value.lower():
-                            # Look for quote number in adjacent cells
-                            for offset in range(1, 4):
-                                if cell.column + offset <= ws.max_column:
-                                    next_cell = ws.cell(row=cell.row, column=cell.column + offset)
-                                    if next_cell.value and not str(next_cell.value).lower().startswith('quote'):
-                                        data.quote_number = str(next_cell.value)
-                                        break
-                        
-                        # Look for quote date
-                        elif 'date' in cell_value.lower() and ('quote' in cell_value.lower() or ':' in cell_value):
-                            for offset in range(1, 4):
-                                if cell.column + offset <= ws.max_column:
-                                    next_cell = ws.cell(row=cell.row, column=cell.column + offset)
-                                    if next_cell.value and str(next_cell.value).replace('/', '').replace('-', '').replace(' ', '').isdigit():
-                                        data.quote_date = str(next_cell.value)
-                                        break
-                        
-                        # Look for lead time
-                        elif 'lead' in cell_value.lower() and 'time' in cell_value.lower():
-                            for offset in range(1, 4):
-                                if cell.column + offset <= ws.max_column:
-                                    next_cell = ws.cell(row=cell.row, column=cell.column + offset)
-                                    if next_cell.value:
-                                        lead_time_text = str(next_cell.value)
-                                        # Parse lead time (e.g., "14 days", "2 weeks")
-                                        lead_time_match = re.search(r'(\d+)\s*(day|week|month|days|weeks|months)', lead_time_text.lower())
-                                        if lead_time_match:
-                                            data.lead_time_value = int(lead_time_match.group(1))
-                                            unit = lead_time_match.group(2)
-                                            if unit in ['day', 'days']:
-                                                data.lead_time_unit = 'Days'
-                                            elif unit in ['week', 'weeks']:
-                                                data.lead_time_unit = 'Weeks'
-                                            elif unit in ['month', 'months']:
-                                                data.lead_time_unit = 'Months'
-                                        break
-                        
-                        # Look for quote expiration/valid until
-                        elif ('valid' in cell_value.lower() and 'until' in cell_value.lower()) or ('expir' in cell_value.lower()):
-                            for offset in range(1, 4):
-                                if cell.column + offset <= ws.max_column:
-                                    next_cell = ws.cell(row=cell.row, column=cell.column + offset)
-                                    if next_cell.value:
-                                        data.quote_expiration_date = str(next_cell.value)
-                                        # Calculate expiration days
-                                        try:
-                                            if '/' in data.quote_expiration_date:
-                                                exp_dt = datetime.strptime(data.quote_expiration_date, '%m/%d/%Y')
-                                            elif '-' in data.quote_expiration_date:
-                                                exp_dt = datetime.strptime(data.quote_expiration_date, '%Y-%m-%d')
-                                            else:
-                                                exp_dt = datetime.now()
-                                            
-                                            if data.quote_date:
-                                                if '/' in data.quote_date:
-                                                    quote_dt = datetime.strptime(data.quote_date, '%m/%d/%Y')
-                                                elif '-' in data.quote_date:
-                                                    quote_dt = datetime.strptime(data.quote_date, '%Y-%m-%d')
-                                                else:
-                                                    quote_dt = datetime.now()
-                                                
-                                                delta = exp_dt - quote_dt
-                                                data.quote_expiration_days = delta.days
-                                        except:
-                                            data.quote_expiration_days = 30
-                                        break
-                        
-                        # Look for customer company
-                        elif 'company' in cell_value.lower() or 'customer' in cell_value.lower():
-                            for offset in range(1, 4):
-                                if cell.column + offset <= ws.max_column:
-                                    next_cell = ws.cell(row=cell.row, column=cell.column + offset)
-                                    if next_cell.value and not str(next_cell.value).lower().startswith(('company', 'customer')):
-                                        data.customer_company = str(next_cell.value)
-                                        break
+            wb = openpyxl.load_workbook(file_path, read_only=True)
+            try:
+                grid = LabelIndex(wb.active.iter_rows(values_only=True))
+            finally:
+                wb.close()
+            
+            # Header fields come from the cells next to their labels
+            quote_numbers = grid.find('quote #', lambda value: not str(value).lower().startswith('quote'))
+            if quote_numbers:
+                data.quote_number = str(quote_numbers[-1][1])
+            
+            quote_dates = grid.find('quote date', ExcelParser._is_date_value)
+            if quote_dates:
+                data.quote_date = str(quote_dates[-1][1])
+            
+            # Lead time from the last label whose value parses (e.g., "14 days", "2 weeks")
+            for _, value in reversed(grid.find('lead time')):
+                lead_time_match = re.search(r'(\d+)\s*(day|week|month|days|weeks|months)', str(value).lower())
+                if lead_time_match:
+                    data.lead_time_value = int(lead_time_match.group(1))
+                    unit = lead_time_match.group(2)
+                    if unit in ['day', 'days']:
+                        data.lead_time_unit = 'Days'
+                    elif unit in ['week', 'weeks']:
+                        data.lead_time_unit = 'Weeks'
+                    elif unit in ['month', 'months']:
+                        data.lead_time_unit = 'Months'
+                    break
+            
+            # Quote expiration/valid until, counted from the quote date given above it
+            expirations = grid.find('valid until')
+            if expirations:
+                coord, value = expirations[-1]
+                data.quote_expiration_date = str(value)
+                dates_above = grid.find('quote date', ExcelParser._is_date_value, before=coord)
+                if dates_above:
+                    data.quote_expiration_days = ExcelParser._expiration_days(data.quote_expiration_date, str(dates_above[-1][1]))
+            
+            customers = grid.find('customer', lambda value: not str(value).lower().startswith(('company', 'customer')))
+            if customers:
+                data.customer_company = str(customers[-1][1])
             
             # If no quote number found, generate one
             if not data.quote_number:
@@ -541,8 +748,8 @@ class ExcelParser(FileParser):
             
             # Extract line items from data rows
             line_items = []
-            for row in ws.iter_rows(min_row=10):  # Start from row 10 to skip headers
-                row_values = [cell.value for cell in row if cell.value is not None]
+            for row in grid.rows[9:]:  # Start from row 10 to skip headers
+                row_values = [value for value in row if value is not None]
                 if len(row_values) >= 4:  # Ensure we have enough columns
                     try:
                         # Try to extract numeric values for prices
@@ -578,7 +785,7 @@ class ExcelParser(FileParser):
             # Calculate expiration date if not found
             if not data.quote_expiration_date:
                 data.calculate_expiration_date()
-            
+        
         except Exception as e:
             # Fallback to pandas if openpyxl fails
             try:
@@ -612,6 +819,50 @@ class ExcelParser(FileParser):
             data.calculate_expiration_date()
         
         return data
+    
+    @staticmethod
+    def _is_date_value(value) -> bool:
+        """Whether a cell value looks like a date such as 09/05/2025 or 2025-09-05"""
+        return str(value).replace('/', '').replace('-', '').replace(' ', '').isdigit()
+    
+    @staticmethod
+    def _expiration_days(expiration_date: str, quote_date: str) -> int:
+        """Days between the quote date and its expiration date"""
+        days = days_between(quote_date, expiration_date)
+        return 30 if days is None else days
+
+class TemplateCache:
+    """Cache of quote template workbooks keyed by path.
+    
+    Each template is loaded with openpyxl once and kept as a pickled
+    snapshot; get() unpickles a fresh, independent copy, which is much
+    cheaper than unzipping and parsing the xlsx again. An entry is reloaded
+    when the template file's mtime or size changes.
+    """
+    
+    def __init__(self):
+        self._entries = {}
+    
+    def get(self, template_path: str):
+        """Return a new workbook copy of the template"""
+        path = os.path.abspath(template_path)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        
+        entry = self._entries.get(path)
+        if entry is None or entry[0] != key:
+            workbook = openpyxl.load_workbook(path)
+            entry = (key, pickle.dumps(workbook, protocol=pickle.HIGHEST_PROTOCOL))
+            self._entries[path] = entry
+        
+        return pickle.loads(entry[1])
+    
+    def clear(self):
+        """Drop all cached templates"""
+        self._entries.clear()
+
+# Shared by all QuoteGenerator instances so batch runs reuse loaded templates
+template_cache = TemplateCache()
 
 class QuoteGenerator:
     """Main quote generation class"""
@@ -622,12 +873,33 @@ class QuoteGenerator:
             'rtf': RTFParser(),
             'excel': ExcelParser()
         }
+        self.template_cache = template_cache
+        self.parse_cache = parse_cache
     
-    def parse_file(self, file_path: str) -> QuoteData:
-        """Parse input file and return quote data"""
+    def parse_file(self, file_path: str, streaming: bool = False) -> QuoteData:
+        """Parse input file and return quote data
+        
+        With streaming=True, XML baskets are read with iterparse so memory
+        stays flat for very large exports. Results are cached on disk by
+        file content; set parse_cache to None to always parse.
+        """
         file_type = FileParser.detect_file_type(file_path)
         parser = self.parsers[file_type]
-        return parser.parse(file_path)
+        
+        # Parsers fill missing dates from today, so entries only hold for the day
+        cache = self.parse_cache
+        key = cache.key(file_path, parser, datetime.now().strftime('%Y-%m-%d')) if cache else None
+        data = cache.get(key) if cache else None
+        if data is not None:
+            return data
+        
+        if streaming and file_type == 'xml':
+            data = parser.parse_streaming(file_path)
+        else:
+            data = parser.parse(file_path)
+        if cache:
+            cache.put(key, data)
+        return data
     
     def generate_quote(self, data: QuoteData, template_path: str = "quote_template_simple.xlsx", output_path: str = None) -> str:
         """Generate quote from parsed data"""
@@ -638,8 +910,8 @@ class QuoteGenerator:
         # Calculate expiration date before generating quote
         data.calculate_expiration_date()
         
-        # Load template
-        wb = openpyxl.load_workbook(template_path)
+        # Load template (cached copy, reloaded if the file changes)
+        wb = self.template_cache.get(template_path)
         ws = wb.active
         
         # Fill in quote data
@@ -795,7 +1067,7 @@ def main():
         print("Generating quote...")
         output_path = generator.generate_quote(data)
         print(f"Quote generated: {output_path}")
-        
+    
     except Exception as e:
         print(f"Error: {e}")
 
@@ -0,0 +1,169 @@
+"""
+RTF reader for the Desktop Quote Generator
+Turns RTF documents into plain text lines in a single streaming pass
+"""
+
+import codecs
+import re
+
+# Destinations whose groups hold no document text
+IGNORED_DESTINATIONS = frozenset([
+    'fonttbl', 'colortbl', 'stylesheet', 'listtable', 'listoverridetable',
+    'revtbl', 'rsidtbl', 'info', 'pict', 'shppict', 'nonshppict', 'object',
+    'objdata', 'fldinst', 'datastore', 'themedata', 'colorschememapping',
+    'latentstyles', 'xmlnstbl', 'generator', 'nonesttables', 'filetbl',
+    'pgdsctbl', 'footnote', 'annotation', 'atnid', 'atnauthor',
+])
+
+# Control words that end the current line
+LINE_BREAKS = frozenset(['par', 'line', 'row', 'sect', 'page', 'cell', 'nestcell', 'nestrow'])
+
+# Control words that stand for a character
+SPECIAL_CHARACTERS = {
+    'tab': '\t',
+    'emdash': '\u2014',
+    'endash': '\u2013',
+    'emspace': ' ',
+    'enspace': ' ',
+    'qmspace': ' ',
+    'bullet': '\u2022',
+    'lquote': '\u2018',
+    'rquote': '\u2019',
+    'ldblquote': '\u201c',
+    'rdblquote': '\u201d',
+}
+
+# Control words the reader acts on; every other control word only sets formatting
+KEYWORDS = LINE_BREAKS | SPECIAL_CHARACTERS.keys() | IGNORED_DESTINATIONS | {'u', 'uc', 'ansicpg'}
+
+# One match per token: a run of formatting control words and raw line breaks,
+# control word with optional parameter and its delimiting space, hex escape,
+# control symbol, group brace, or run of text. Together the alternatives match
+# every character, so tokens are contiguous.
+TOKEN_PATTERN = re.compile(
+    r"(?:\\(?!(?:%s)(?![a-zA-Z]))[a-zA-Z]{1,32}(?:-?\d{1,10})? ?|[\r\n]+)+"
+    r"|\\([a-zA-Z]{1,32})(-?\d{1,10})? ?"
+    r"|\\'([0-9a-fA-F]{2})"
+    r"|\\(.)"
+    r"|([{}])"
+    r"|([^\\{}\r\n]{1,4096})" % '|'.join(sorted(KEYWORDS, key=len, reverse=True)),
+    re.DOTALL
+)
+
+# Characters held back at the end of each chunk so no token is cut in half
+HOLDBACK = 64
+
+def iter_rtf_lines(chunks, codepage='cp1252'):
+    """Yield the plain text lines of an RTF document given as text chunks.
+    
+    Control words are handled as they are read: paragraph, line and table
+    cell breaks end a line, \\'hh escapes are decoded with the document's
+    code page, \\uN characters replace their fallback text, and groups of
+    \\* and other non-text destinations (font and colour tables, pictures)
+    are skipped. Chunks should be decoded as latin-1 so raw bytes survive.
+    """
+    stack = []
+    skip = False        # inside a group that holds no text
+    uc = 1              # fallback characters following each \uN
+    fallback = 0        # fallback characters still to drop
+    pending = bytearray()
+    parts = []
+    
+    carry = ''
+    chunks = iter(chunks)
+    final = False
+    while not final:
+        chunk = next(chunks, None)
+        final = chunk is None
+        buffer = carry if final else carry + chunk
+        limit = len(buffer) if final else len(buffer) - HOLDBACK
+        
+        pos = 0
+        for match in TOKEN_PATTERN.finditer(buffer):
+            if match.end() > limit:
+                break
+            pos = match.end()
+            if match.lastindex is None:
+                continue  # formatting and raw line breaks
+            word, param, hex_code, symbol, brace, text = match.groups()
+            
+            if hex_code is not None:
+                if skip:
+                    continue
+                if fallback:
+                    fallback -= 1
+                else:
+                    pending.append(int(hex_code, 16))
+                continue
+            
+            if pending:
+                parts.append(pending.decode(codepage, 'replace'))
+                pending.clear()
+            
+            if text is not None:
+                if skip:
+                    continue
+                if fallback:
+                    dropped = min(fallback, len(text))
+                    text = text[dropped:]
+                    fallback -= dropped
+                if not text.isascii():
+                    try:
+                        text = text.encode('latin-1').decode(codepage, 'replace')
+                    except UnicodeEncodeError:
+                        pass  # chunks were already decoded
+                parts.append(text)
+            
+            elif brace is not None:
+                fallback = 0
+                if brace == '{':
+                    stack.append((skip, uc))
+                elif stack:
+                    skip, uc = stack.pop()
+            
+            elif skip:
+                continue
+            
+            elif word is not None:
+                if word in LINE_BREAKS:
+                    yield ''.join(parts)
+                    parts = []
+                elif word in SPECIAL_CHARACTERS:
+                    parts.append(SPECIAL_CHARACTERS[word])
+                elif word == 'u' and param:
+                    parts.append(chr(int(param) % 0x10000))
+                    fallback = uc
+                elif word == 'uc' and param:
+                    uc = int(param)
+                elif word == 'ansicpg' and param:
+                    try:
+                        codepage = codecs.lookup(f'cp{param}').name
+                    except LookupError:
+                        pass
+                elif word in IGNORED_DESTINATIONS:
+                    skip = True
+            
+            elif symbol is not None:
+                if symbol == '*':
+                    skip = True
+                elif symbol in '\\{}':
+                    parts.append(symbol)
+                elif symbol == '~':
+                    parts.append('\u00a0')
+                elif symbol == '_':
+                    parts.append('-')
+                elif symbol in '\r\n':
+                    yield ''.join(parts)
+                    parts = []
+        
+        carry = buffer[pos:]
+    
+    if pending:
+        parts.append(pending.decode(codepage, 'replace'))
+    if parts:
+        yield ''.join(parts)
+
+def read_rtf_lines(file_path, chunk_size=65536):
+    """Yield the plain text lines of an RTF file, reading it in chunks"""
+    with open(file_path, 'r', encoding='latin-1', newline='') as file:
+        yield from iter_rtf_lines(iter(lambda: file.read(chunk_size), ''))
@@ -28,6 +28,13 @@ def build_simple():
             "--add-data", "file_parsers.py;.",
             "--add-data", "exporters.py;.",
             "--add-data", "dialogs.py;.",
+            "--add-data", "pricing.py;.",
+            "--add-data", "line_item.py;.",
+            "--add-data", "line_item_model.py;.",
+            "--add-data", "import_worker.py;.",
+            "--add-data", "export_worker.py;.",
+            "--add-data", "rtf_reader.py;.",
+            "--add-data", "parse_cache.py;.",
             "desktop_quote_generator.py"
         ]
         
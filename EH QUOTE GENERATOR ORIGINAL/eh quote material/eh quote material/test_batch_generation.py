@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for batch quote generation across a directory
+"""
+
+import os
+import json
+import shutil
+import tempfile
+
+from generate_quote import generate_batch, find_quote_files
+
+SAMPLE_FILES = [
+    'ehOnline-Shop_20250905-160419.xml',
+    'ehOnline-Shop_2061348427.rtf',
+    'ehOnline-Shop_2061348427.xlsx',
+]
+
+def test_batch_generation():
+    """Generate quotes for a directory and check the manifest"""
+    print("🧪 Testing batch quote generation...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in SAMPLE_FILES:
+            shutil.copy(name, tmp)
+        with open(os.path.join(tmp, 'broken.xlsx'), 'w') as f:
+            f.write('not a workbook')
+        with open(os.path.join(tmp, 'notes.txt'), 'w') as f:
+            f.write('ignored')
+        
+        assert len(find_quote_files(tmp)) == 4
+        
+        output_dir = os.path.join(tmp, 'out')
+        manifest = generate_batch(tmp, output_dir, workers=2)
+        
+        assert manifest['total_files'] == 4
+        assert manifest['succeeded'] == 3
+        assert manifest['failed'] == 1
+        
+        by_name = {os.path.basename(r['file']): r for r in manifest['files']}
+        assert by_name['broken.xlsx']['status'] == 'error'
+        for name in SAMPLE_FILES:
+            result = by_name[name]
+            assert result['status'] == 'ok'
+            assert os.path.exists(result['output'])
+            assert result['seconds'] >= 0
+        
+        # Same stem with different extensions must not overwrite each other
+        outputs = [r['output'] for r in manifest['files'] if r['status'] == 'ok']
+        assert len(set(outputs)) == len(outputs)
+        
+        with open(os.path.join(output_dir, 'batch_manifest.json')) as f:
+            assert json.load(f)['succeeded'] == 3
+    
+    print("✅ Batch generation wrote all quotes and the manifest")
+
+if __name__ == "__main__":
+    test_batch_generation()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test script for the columnar CSV import
+"""
+
+import csv
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from file_parsers import CSVParser
+from line_item import LineItem
+
+ROWS = [
+    ['Part No', 'Description', 'Qty', 'Unit', 'Unit Price', 'Cost'],
+    ['5W4C1H-1234/0', 'Promag W 400\nflowmeter', '2', 'PC', '$4,250.00', ''],
+    ['FMR60B-1JQQ7/0', 'Micropilot FMR60B', '1.5 pcs', '', '', '2,876.23 USD'],
+    ['', '   ', 'ten', 'EA', 'call', ''],
+    ['PMC51', '', '', '', '', ''],
+    ['', '', '', '', '', ''],
+]
+
+def write_csv(path, rows):
+    """Write rows to a CSV file"""
+    with open(path, 'w', newline='') as file:
+        csv.writer(file).writerows(rows)
+
+def test_matches_row_parser():
+    """Converting whole columns gives the same items as parse_csv_row per row"""
+    print("🧪 Comparing columnar import with row-by-row parsing...")
+    
+    parser = CSVParser()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'items.csv')
+        write_csv(path, ROWS)
+        df = pd.read_csv(path)
+        
+        expected = [parser.parse_csv_row(row) for _, row in df.iterrows()]
+        assert parser.parse_frame(df) == expected
+        
+        items = parser.parse(path)
+    
+    assert items == [item for item in expected if item]
+    assert items[0] == LineItem(
+        description='Promag W 400 flowmeter', quantity=2, unit='PC',
+        unit_price=4250.0, model='5W4C1H-1234/0', order_code=''
+    )
+    assert items[1]['unit_price'] == 2876.23 and items[1]['unit'] == 'EA'
+    print(f"✅ {len(items)} items identical")
+
+def test_column_mapping():
+    """Column names map to item fields once, in keyword priority order"""
+    print("🧪 Mapping column names...")
+    
+    fields = CSVParser().map_columns(['Product Code', 'Qty', 'Unit Price', 'SKU', 'UOM', 'Notes'])
+    assert fields == ['description', 'quantity', 'unit_price', 'model', 'unit', None]
+    print("✅ Columns mapped")
+
+def test_chunked_reading():
+    """Items and progress do not depend on how many rows are read at a time"""
+    print("🧪 Reading a CSV in small chunks...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'items.csv')
+        rows = [['SKU', 'Description', 'Qty', 'Price']]
+        rows += [[f'00{i}', f'Item {i}', i % 4, f'{i}.25'] for i in range(1, 1001)]
+        write_csv(path, rows)
+        
+        expected = CSVParser().parse(path)
+        parser = CSVParser()
+        parser.CHUNK_ROWS = 64
+        batches = list(parser.parse_batches(path, batch_size=50))
+    
+    assert [item for items, _, _ in batches for item in items] == expected
+    assert expected[0]['model'] == '001'
+    
+    progress = [done for _, done, _ in batches]
+    assert progress == sorted(progress) and progress[-1] == 1000
+    assert all(total >= done for _, done, total in batches)
+    assert batches[-1][2] == 1000
+    print(f"✅ {len(batches)} batches, same items")
+
+def test_large_price_list():
+    """A 100,000 row price list imports in seconds"""
+    print("🧪 Importing a 100,000 row price list...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'price_list.csv')
+        rows = [['Part No', 'Description', 'Qty', 'Unit', 'Unit Price']]
+        rows += [[f'5W4C1H-{i:06d}', f'Promag W 400 DN{i % 300}', i % 7 + 1, 'PC', f'${1000 + i % 5000:,}.50'] for i in range(100000)]
+        write_csv(path, rows)
+        
+        start = time.perf_counter()
+        items = CSVParser().parse(path)
+        elapsed = time.perf_counter() - start
+    
+    assert len(items) == 100000
+    assert items[-1]['unit_price'] == 5999.5 and items[-1]['quantity'] == 5
+    print(f"✅ Imported in {elapsed:.2f}s")
+    assert elapsed < 10
+
+if __name__ == "__main__":
+    test_matches_row_parser()
+    test_column_mapping()
+    test_chunked_reading()
+    test_large_price_list()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test script for the Excel header label index
+"""
+
+import os
+import tempfile
+
+import openpyxl
+
+from quote_generator import LabelIndex, ExcelParser
+
+ROWS = [
+    ('Quote #:', None, 'Q-1001', None),
+    ('Customer:', 'Company', 'Acme Pipelines', None),
+    ('Quote Date:', '01/15/2025', None, None),
+    ('Lead Time', 'TBD', None, None),
+    ('Lead Time', '3 weeks', None, None),
+    ('Valid Until:', '02/14/2025', None, None),
+]
+
+def test_labels_indexed_in_one_scan():
+    """Every label cell is classified once, in sheet order"""
+    print("🧪 Building label index...")
+    
+    grid = LabelIndex(ROWS)
+    assert grid.labels['quote #'] == [(0, 0)]
+    assert grid.labels['customer'] == [(1, 0), (1, 1)]
+    assert grid.labels['lead time'] == [(3, 0), (4, 0)]
+    assert LabelIndex.classify('Net price') is None
+    print("✅ Labels indexed")
+
+def test_find_skips_rejected_neighbours():
+    """A label's value is the first accepted cell among its neighbours"""
+    print("🧪 Looking up label values...")
+    
+    grid = LabelIndex(ROWS)
+    assert grid.find('quote #') == [((0, 0), 'Q-1001')]
+    
+    customers = grid.find('customer', lambda value: not str(value).lower().startswith(('company', 'customer')))
+    assert [value for _, value in customers] == ['Acme Pipelines', 'Acme Pipelines']
+    
+    assert grid.find('quote date', before=(2, 0)) == []
+    assert grid.find('quote date', before=(5, 0)) == [((2, 0), '01/15/2025')]
+    print("✅ Label values found")
+
+def test_parse_header_fields():
+    """ExcelParser reads header fields through the index"""
+    print("🧪 Parsing header fields from a sheet...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'labels.xlsx')
+        wb = openpyxl.Workbook()
+        for row in ROWS:
+            wb.active.append(row)
+        wb.save(path)
+        
+        data = ExcelParser.parse(path)
+    
+    assert data.quote_number == 'Q-1001'
+    assert data.customer_company == 'Acme Pipelines'
+    assert data.quote_date == '01/15/2025'
+    assert (data.lead_time_value, data.lead_time_unit) == (3, 'Weeks')
+    assert data.quote_expiration_date == '02/14/2025'
+    assert data.quote_expiration_days == 30
+    print("✅ Header fields parsed")
+
+if __name__ == "__main__":
+    test_labels_indexed_in_one_scan()
+    test_find_skips_rejected_neighbours()
+    test_parse_header_fields()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test script for the Excel sheet layout set by the section builders
+"""
+
+import os
+import tempfile
+
+import openpyxl
+from openpyxl.cell.cell import MergedCell
+
+from exporters import ExcelExporter, StreamingExcelExporter
+from file_parsers import ExcelParser
+from test_streaming_excel_export import build_quote_data
+
+SAMPLE_XLSX = 'ehOnline-Shop_2061348427.xlsx'
+
+def test_every_cell_wraps_and_every_row_has_height():
+    """Sections leave no cell without wrapping and no row without a height"""
+    print("🧪 Checking cell alignment and row heights...")
+    
+    quote_data = build_quote_data(ExcelParser().parse(SAMPLE_XLSX) * 3)
+    with tempfile.TemporaryDirectory() as tmp:
+        for exporter_class in (ExcelExporter, StreamingExcelExporter):
+            path = exporter_class().export_quote(quote_data, os.path.join(tmp, 'quote.xlsx'))
+            ws = openpyxl.load_workbook(path).active
+            assert ws.max_column == len(ExcelExporter.COLUMN_WIDTHS)
+            
+            for row in ws.iter_rows(min_row=1, max_row=ws.max_row, max_col=ws.max_column):
+                for cell in row:
+                    if isinstance(cell, MergedCell):
+                        continue  # openpyxl drops their styles when loading
+                    assert cell.alignment.wrap_text, cell.coordinate
+                    assert cell.alignment.vertical in ('top', 'center'), cell.coordinate
+                    assert cell.alignment.horizontal in ('left', 'center', 'right'), cell.coordinate
+            
+            heights = [ws.row_dimensions[row].height for row in range(1, ws.max_row + 1)]
+            assert None not in heights
+            assert heights[:7] == [35, 25, 20, 20, 10, 45, 20]
+            assert ws['B21'].alignment.horizontal == 'left'
+            assert ws['E21'].alignment.horizontal == 'right'
+            assert ws['C8'].alignment.horizontal == 'left'
+    print("✅ All cells wrap and all rows have heights")
+
+if __name__ == "__main__":
+    test_every_cell_wraps_and_every_row_has_height()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test script for the parallel Excel + PDF export
+"""
+
+import os
+import tempfile
+
+import openpyxl
+
+from export_worker import ExportWorker
+from file_parsers import ExcelParser
+from test_streaming_excel_export import build_quote_data
+
+SAMPLE_XLSX = 'ehOnline-Shop_2061348427.xlsx'
+
+def wait_for_messages(worker):
+    """Collect worker messages until it reports it is done"""
+    worker.thread.join(timeout=120)
+    assert not worker.thread.is_alive()
+    return worker.poll()
+
+def test_exports_both_formats_from_snapshot():
+    """Excel and PDF are written in parallel from a copy of the quote data"""
+    print("🧪 Exporting Excel and PDF together...")
+    
+    quote_data = build_quote_data(ExcelParser().parse(SAMPLE_XLSX))
+    with tempfile.TemporaryDirectory() as tmp:
+        targets = [('excel', os.path.join(tmp, 'q.xlsx')), ('pdf', os.path.join(tmp, 'q.pdf'))]
+        worker = ExportWorker(quote_data, targets).start()
+        
+        # Edits made while exporting must not reach the files
+        quote_data['quote_number'] = 'CHANGED'
+        quote_data['line_items'].clear()
+        
+        messages = wait_for_messages(worker)
+        assert messages[-1] == ('done', 2)
+        assert sorted(messages[:-1]) == sorted(('exported', kind, path) for kind, path in targets)
+        
+        ws = openpyxl.load_workbook(targets[0][1]).active
+        values = [cell.value for row in ws.iter_rows() for cell in row]
+        assert 'ENETK-TEST-005' in values and 'CHANGED' not in values
+        with open(targets[1][1], 'rb') as f:
+            assert f.read(5) == b'%PDF-'
+    print("✅ Both quotes written from the snapshot")
+
+def test_errors_are_reported_per_format():
+    """A failing export is reported without stopping the other one"""
+    print("🧪 Exporting to a missing directory...")
+    
+    quote_data = build_quote_data(ExcelParser().parse(SAMPLE_XLSX))
+    with tempfile.TemporaryDirectory() as tmp:
+        targets = [('excel', os.path.join(tmp, 'missing', 'q.xlsx')), ('pdf', os.path.join(tmp, 'q.pdf'))]
+        messages = wait_for_messages(ExportWorker(quote_data, targets).start())
+        assert os.path.exists(targets[1][1])
+    
+    assert messages[-1] == ('done', 1)
+    assert [m[:2] for m in messages if m[0] == 'error'] == [('error', 'excel')]
+    print("✅ Excel error reported, PDF still written")
+
+if __name__ == "__main__":
+    test_exports_both_formats_from_snapshot()
+    test_errors_are_reported_per_format()
@@ -13,6 +13,7 @@ def test_import_with_lead_time_expiration():
     print("=" * 70)
     
     generator = QuoteGenerator()
+    generator.parse_cache = None
     
     # Test with existing sample files
     sample_files = [
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test script for background file import
+"""
+
+import os
+import tempfile
+import threading
+
+import openpyxl
+
+from file_parsers import ExcelParser, CSVParser
+from import_worker import ImportWorker
+
+SAMPLE_XLSX = 'ehOnline-Shop_2061348427.xlsx'
+
+def build_large_export(path, copies):
+    """Write an E+H export with the sample item rows repeated `copies` times"""
+    source = openpyxl.load_workbook(SAMPLE_XLSX).active
+    rows = list(source.iter_rows(values_only=True))
+    header, items = rows[:5], rows[5:]
+    
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for row in header:
+        ws.append(row)
+    for copy in range(copies):
+        for i, row in enumerate(items, 1):
+            ws.append((float((copy * len(items) + i) * 10),) + row[1:])
+    wb.save(path)
+
+def wait_for_messages(worker):
+    """Collect worker messages until it reports how it ended"""
+    worker.thread.join(timeout=60)
+    assert not worker.thread.is_alive()
+    return worker.poll()
+
+def test_batches_match_full_parse():
+    """Items arrive in batches with row progress and match a direct parse"""
+    print("🧪 Importing a large export on a worker thread...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'large.xlsx')
+        build_large_export(path, 150)
+        
+        worker = ImportWorker(path, batch_size=50, cache=None).start()
+        messages = wait_for_messages(worker)
+        expected = ExcelParser().parse(path)
+    
+    batches = [m for m in messages if m[0] == 'batch']
+    assert messages[-1] == ('done', len(expected))
+    assert len(batches) > 1
+    
+    progress = [done for _, _, done, _ in batches]
+    assert progress == sorted(progress)
+    assert progress[-1] == batches[-1][3]
+    
+    items = [item for _, batch, _, _ in batches for item in batch]
+    assert items == expected
+    print(f"✅ {len(items)} items in {len(batches)} batches, {progress[-1]} rows processed")
+
+def test_cancel_stops_import():
+    """Cancelling stops the worker after the current batch"""
+    print("🧪 Cancelling an import...")
+    
+    release = threading.Event()
+    
+    class SlowParser(CSVParser):
+        def parse_batches(self, file_path, batch_size=100):
+            for done in range(1, 1001):
+                yield [{'description': f'Item {done}'}], done, 1000
+                release.wait()
+    
+    worker = ImportWorker('items.csv', parser=SlowParser()).start()
+    worker.cancel()
+    release.set()
+    messages = wait_for_messages(worker)
+    
+    assert messages[-1][0] == 'cancelled'
+    assert len(messages) < 1000
+    print(f"✅ Cancelled after {messages[-1][1]} items")
+
+def test_errors_are_reported():
+    """Parser errors come back as an error message instead of raising on the thread"""
+    print("🧪 Importing a missing file...")
+    
+    worker = ImportWorker('does_not_exist.xlsx', cache=None).start()
+    messages = wait_for_messages(worker)
+    
+    assert messages == [messages[-1]] and messages[-1][0] == 'error'
+    assert 'Error parsing Excel file' in messages[-1][1]
+    print("✅ Error reported through the queue")
+
+if __name__ == "__main__":
+    test_batches_match_full_parse()
+    test_cancel_stops_import()
+    test_errors_are_reported()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared line item description builder
+"""
+
+import os
+import tempfile
+
+import openpyxl
+
+from exporters import ExcelExporter, PDFExporter, describe_item, _describe_fields
+
+SAMPLE_ITEM = {
+    'item_number': '1',
+    'description': 'Promag W 400\nElectromagnetic flowmeter',
+    'model': '5W4C1H',
+    'sales_text': 'Flowmeter for water and wastewater',
+    'delivery_time': '4 weeks',
+    'order_code': '5W4C1H-AAGBBAAAAAAA1+AA',
+    'config': '010: Approval  ATEX  020: Output  HART 4-20mA  ',
+    'country_origin': 'Germany',
+    'country_dispatch': 'USA',
+    'quantity': 2,
+    'unit': 'PC',
+    'unit_price': 4250.00
+}
+
+def test_description_parts():
+    """describe_item should produce the same parts the exporters used to build"""
+    print("🧪 Building line item description...")
+
+    assert describe_item(SAMPLE_ITEM) == (
+        'Promag W 400',
+        'Model: 5W4C1H',
+        'Description: Flowmeter for water and wastewater',
+        'Delivery time: 4 weeks',
+        'Order code description:',
+        '5W4C1H-AAGBBAAAAAAA1+AA',
+        'Product Configuration:',
+        '010: Approval ATEX',
+        '020: Output HART 4-20mA',
+        'Country Information:',
+        'Origin: Germany',
+        'Dispatch: USA'
+    )
+    assert describe_item({'description': 'Only a name'}) == ('Only a name',)
+    assert describe_item({}) == ()
+    print("✅ Description parts correct")
+
+def test_description_cached_across_formats():
+    """Exporting Excel and PDF should describe each distinct item only once"""
+    print("🧪 Checking description cache across Excel and PDF export...")
+
+    items = [dict(SAMPLE_ITEM, item_number=str(i), quantity=i) for i in range(1, 21)]
+    quote_data = {'quote_number': 'ENETK-DESC', 'line_items': items}
+
+    _describe_fields.cache_clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        excel_path = os.path.join(tmp, 'quote.xlsx')
+        ExcelExporter().export_quote(quote_data, excel_path)
+        PDFExporter().export_quote(quote_data, os.path.join(tmp, 'quote.pdf'))
+
+        ws = openpyxl.load_workbook(excel_path).active
+        assert ws['B21'].value.startswith('Promag W 400\n\nModel:')
+
+    info = _describe_fields.cache_info()
+    print(f"   Cache hits: {info.hits}, misses: {info.misses}")
+    assert info.misses == 1
+    assert info.hits == 2 * len(items) - 1
+    print("✅ Description built once for 20 rows in two formats")
+
+def test_unhashable_fields():
+    """Items with unhashable field values are described without caching"""
+    print("🧪 Describing item with unhashable field...")
+
+    item = dict(SAMPLE_ITEM, model=['5W4C1H'])
+    assert describe_item(item)[1] == "Model: ['5W4C1H']"
+    print("✅ Unhashable item described")
+
+if __name__ == "__main__":
+    test_description_parts()
+    test_description_cached_across_formats()
+    test_unhashable_fields()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for the slotted LineItem record
+"""
+
+import pickle
+import sys
+import tracemalloc
+
+from line_item import LineItem, FIELDS
+from file_parsers import ExcelParser
+from pricing import price_line_items
+from exporters import describe_item
+
+SAMPLE_XLSX = 'ehOnline-Shop_2061348427.xlsx'
+
+def test_dict_compatible_access():
+    """Items read and write like the dicts they replace"""
+    print("🧪 Testing dict-style access...")
+    
+    item = LineItem(description='Promag W 400', quantity='2', unit_price='4250.5')
+    assert item.quantity == 2 and item.unit_price == 4250.5
+    assert item['description'] == 'Promag W 400'
+    assert item.get('unit', 'XX') == 'EA'
+    assert item.get('total_price', 0.0) == 0.0
+    assert 'config' in item and 'total_price' not in item
+    
+    item['description'] += ' flowmeter'
+    item['quantity'] = 3.0
+    assert item.description == 'Promag W 400 flowmeter' and item.quantity == 3
+    
+    try:
+        item['total_price'] = 1.0
+        assert False, "unknown keys should raise"
+    except KeyError:
+        pass
+    
+    data = item.to_dict()
+    assert list(data) == list(FIELDS) and dict(item) == data
+    assert LineItem.from_dict(dict(data, total_price=9.0)) == item
+    print("✅ Dict-style access works")
+
+def test_codes_interned_and_pickled():
+    """Unit and country codes are shared strings, also after a round trip"""
+    print("🧪 Testing interned codes...")
+    
+    code = ''.join(['P', 'C'])
+    item = LineItem(description='x', unit=code, country_origin=''.join(['D', 'E']))
+    item['country_dispatch'] = ''.join(['U', 'S'])
+    assert item.unit is sys.intern('PC')
+    assert item.country_origin is sys.intern('DE')
+    assert item.country_dispatch is sys.intern('US')
+    
+    copy = pickle.loads(pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL))
+    assert copy == item and copy.unit is sys.intern('PC')
+    assert not hasattr(item, '__dict__')
+    print("✅ Codes interned")
+
+def test_parsed_items_are_smaller():
+    """Parsed items price and describe the same as dicts with less memory"""
+    print("🧪 Comparing LineItem and dict memory...")
+    
+    items = ExcelParser().parse(SAMPLE_XLSX)
+    assert items and all(isinstance(item, LineItem) for item in items)
+    dicts = [item.to_dict() for item in items]
+    
+    assert list(price_line_items(items)) == list(price_line_items(dicts))
+    assert [describe_item(item) for item in items] == [describe_item(item) for item in dicts]
+    
+    def build(make, count=2000):
+        tracemalloc.start()
+        try:
+            kept = [make(i) for i in range(count)]
+            return tracemalloc.get_traced_memory()[0], kept
+        finally:
+            tracemalloc.stop()
+    
+    template = items[0].to_dict()
+    dict_bytes, _ = build(lambda i: dict(template, quantity=i))
+    slot_bytes, _ = build(lambda i: LineItem(**dict(template, quantity=i)))
+    assert slot_bytes < dict_bytes / 2
+    print(f"✅ {slot_bytes // 2000} bytes per LineItem vs {dict_bytes // 2000} per dict")
+
+if __name__ == "__main__":
+    test_dict_compatible_access()
+    test_codes_interned_and_pickled()
+    test_parsed_items_are_smaller()
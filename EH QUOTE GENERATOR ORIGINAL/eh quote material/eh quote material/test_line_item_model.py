@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test script for the incremental line item model used by the desktop app
+"""
+
+import random
+import time
+
+from line_item_model import LineItemModel
+from pricing import price_line_items
+
+def make_item(rng):
+    """Random line item like the desktop app stores"""
+    return {
+        'description': rng.choice(['Promag W 400', 'Micropilot FMR63B - Level Radar Sensor', 'Cerabar PMC71B']),
+        'model': rng.choice(['', '5W4C1H', 'FMR63B-9XA0/0']),
+        'order_code': rng.choice(['', '71524852']),
+        'quantity': rng.randint(1, 10),
+        'unit': 'PC',
+        'unit_price': round(rng.uniform(10, 9000), 2)
+    }
+
+def assert_matches_full_recompute(model, markup):
+    """Running totals and cached rows must match pricing everything from scratch"""
+    pricing = price_line_items(model.items, markup)
+    assert model.subtotal == pricing.subtotal
+    for index, (quoted_price, total_price) in enumerate(pricing):
+        assert model.tree_values(index)[4:] == (f"${quoted_price:.2f}", f"${total_price:.2f}")
+
+def test_running_totals():
+    """Add, replace and remove keep the subtotal exact without repricing everything"""
+    print("🧪 Checking running totals across edits...")
+    
+    rng = random.Random(9)
+    items = []
+    model = LineItemModel(items, 20.0)
+    model.extend([make_item(rng) for _ in range(300)])
+    assert len(items) == 300
+    
+    for _ in range(500):
+        operation = rng.choice(['append', 'replace', 'remove'])
+        if operation == 'append':
+            model.append(make_item(rng))
+        elif operation == 'replace':
+            model.replace(rng.randrange(len(model)), make_item(rng))
+        else:
+            model.remove(rng.randrange(len(model)))
+    
+    assert items is model.items
+    assert_matches_full_recompute(model, 20.0)
+    
+    model.clear()
+    assert items == [] and model.subtotal == 0
+    print("✅ Subtotal exact after 500 edits")
+
+def test_markup_change_marks_dirty_rows():
+    """Changing the markup reports only rows whose displayed prices changed"""
+    print("🧪 Checking dirty rows on markup change...")
+    
+    items = [{'description': 'Free part', 'unit_price': 0}, {'description': 'Sensor', 'unit_price': 100, 'quantity': 2}]
+    model = LineItemModel(items, 20.0)
+    
+    assert model.set_markup(20.0) == []
+    assert model.set_markup(25.0) == [1]
+    assert_matches_full_recompute(model, 25.0)
+    print("✅ Only the priced row is dirty")
+
+def test_display_values():
+    """Tree and preview values use the desktop app's formats"""
+    print("🧪 Checking cached display values...")
+    
+    item = {
+        'description': 'Micropilot FMR63B - Level Radar Sensor',
+        'model': 'FMR63B-9XA0/0',
+        'order_code': '71524852',
+        'quantity': 2,
+        'unit': 'PC',
+        'unit_price': 100.0
+    }
+    model = LineItemModel([item], 20.0)
+    
+    assert model.tree_values(0) == (
+        1,
+        'Micropilot FMR63B - Level Radar Sensor | Model: FMR63B-9XA0/0 | Code: 71524852',
+        2,
+        'PC',
+        '$129.60',
+        '$259.20'
+    )
+    assert model.preview_line(0) == f"{1:<5} {'Micropilot FMR63B - Level Radar Sen...':<40} {2:<5} {'PC':<5} ${129.6:<11.2f} ${259.2:<11.2f}"
+    print("✅ Display values correct")
+
+def test_edit_cost_is_flat():
+    """Replacing one item should not get slower with more items"""
+    print("🧪 Timing single-item edits...")
+    
+    rng = random.Random(1)
+    timings = {}
+    for count in (100, 5000):
+        model = LineItemModel([make_item(rng) for _ in range(count)], 20.0)
+        start = time.perf_counter()
+        for _ in range(200):
+            model.replace(rng.randrange(count), make_item(rng))
+        timings[count] = (time.perf_counter() - start) / 200
+        print(f"   {count} items: {timings[count] * 1e6:.0f} us per edit")
+    
+    assert timings[5000] < timings[100] * 5
+    print("✅ Edit cost independent of item count")
+
+if __name__ == "__main__":
+    test_running_totals()
+    test_markup_change_marks_dirty_rows()
+    test_display_values()
+    test_edit_cost_is_flat()
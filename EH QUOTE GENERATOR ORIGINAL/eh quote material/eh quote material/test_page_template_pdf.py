@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script for the page-template PDF exporter
+"""
+
+import os
+import re
+import tempfile
+
+from exporters import PDFExporter, PageTemplatePDFExporter
+from file_parsers import ExcelParser
+from test_streaming_excel_export import build_quote_data
+
+SAMPLE_XLSX = 'ehOnline-Shop_2061348427.xlsx'
+
+def export_pdf(exporter, quote_data):
+    """Export to a temporary file and return the PDF bytes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'quote.pdf')
+        assert exporter.export_quote(quote_data, path)
+        with open(path, 'rb') as f:
+            return f.read()
+
+def page_count(data):
+    return len(re.findall(rb'/Type /Page\b(?!s)', data))
+
+def test_header_drawn_from_one_form():
+    """Every page reuses one cached header form"""
+    print("🧪 Exporting a multi-page quote with the page template...")
+    
+    quote_data = build_quote_data(ExcelParser().parse(SAMPLE_XLSX) * 20)
+    data = export_pdf(PageTemplatePDFExporter(), quote_data)
+    
+    assert data.startswith(b'%PDF-')
+    pages = page_count(data)
+    assert pages > 1
+    assert data.count(b'/Subtype /Form') == 1
+    form = b'/FormXob.' + PageTemplatePDFExporter.HEADER_FORM.encode()
+    assert len(set(re.findall(form + rb' (\d+) 0 R', data))) == 1
+    assert data.count(form) == pages
+    print(f"✅ {pages} pages share one header form")
+
+def test_page_count_stays_close():
+    """The header band costs only a few extra pages on a large quote"""
+    print("🧪 Comparing page counts with the flowable header...")
+    
+    quote_data = build_quote_data(ExcelParser().parse(SAMPLE_XLSX) * 20)
+    flow_pages = page_count(export_pdf(PDFExporter(), quote_data))
+    template_pages = page_count(export_pdf(PageTemplatePDFExporter(), quote_data))
+    
+    assert template_pages <= flow_pages * 1.1
+    print(f"✅ {template_pages} pages vs {flow_pages} with the flowable header")
+
+if __name__ == "__main__":
+    test_header_drawn_from_one_form()
+    test_page_count_stays_close()
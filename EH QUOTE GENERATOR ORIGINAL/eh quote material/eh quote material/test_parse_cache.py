@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Test script for the on-disk parse cache
+"""
+
+import os
+import shutil
+import tempfile
+
+from parse_cache import ParseCache
+from file_parsers import get_parser, CSVParser
+from import_worker import ImportWorker
+from quote_generator import QuoteGenerator, XMLParser
+
+SAMPLE_XML = 'ehOnline-Shop_20250905-160419.xml'
+
+class CountingParser(CSVParser):
+    """CSV parser that counts how often it really parses"""
+    calls = 0
+    
+    def parse_batches(self, file_path, batch_size=100):
+        CountingParser.calls += 1
+        yield from super().parse_batches(file_path, batch_size)
+
+def write_csv(path, rows):
+    """Write a small item CSV"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("Description,Quantity,Unit Price\n")
+        for i in range(rows):
+            f.write(f"Item {i},{i + 1},{i * 2.5}\n")
+
+def test_cache_hits_by_content():
+    """Unchanged content hits, including copies; edits and version bumps miss"""
+    print("🧪 Testing parse cache keys...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(os.path.join(tmp, 'cache'))
+        path = os.path.join(tmp, 'items.csv')
+        write_csv(path, 5)
+        
+        CountingParser.calls = 0
+        first = cache.parse(path, CountingParser())
+        second = cache.parse(path, CountingParser())
+        assert first == second and first is not second
+        assert CountingParser.calls == 1
+        
+        # A renamed copy has the same content
+        copy = os.path.join(tmp, 'renamed.csv')
+        shutil.copy(path, copy)
+        assert cache.parse(copy, CountingParser()) == first
+        assert CountingParser.calls == 1
+        
+        # Different parser classes never share entries
+        assert cache.key(path, CSVParser()) != cache.key(path, CountingParser())
+        
+        write_csv(path, 6)
+        assert len(cache.parse(path, CountingParser())) == 6
+        assert CountingParser.calls == 2
+        
+        CountingParser.VERSION = CSVParser.VERSION + 1
+        try:
+            cache.parse(path, CountingParser())
+        finally:
+            del CountingParser.VERSION
+        assert CountingParser.calls == 3
+    
+    print("✅ Cache keyed by content, parser and version")
+
+def test_lru_eviction_and_bad_entries():
+    """The cache stays under max_bytes by dropping the least recently used entries"""
+    print("🧪 Testing parse cache eviction...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(tmp)
+        for name in 'abc':
+            cache.put(name, 'x' * 1000)
+            path = os.path.join(tmp, name + cache.SUFFIX)
+            os.utime(path, ns=(0, {'a': 1, 'b': 2, 'c': 3}[name] * 10**9))
+        
+        # Reading 'a' makes it the most recent entry
+        assert cache.get('a') == 'x' * 1000
+        
+        cache.max_bytes = cache.size() - 1
+        cache.evict()
+        assert cache.get('b') is None
+        assert cache.get('a') and cache.get('c')
+        
+        # Corrupt entries are misses and get removed
+        with open(os.path.join(tmp, 'c' + cache.SUFFIX), 'wb') as f:
+            f.write(b'not a pickle')
+        assert cache.get('c', 'missing') == 'missing'
+        assert not os.path.exists(os.path.join(tmp, 'c' + cache.SUFFIX))
+    
+    print("✅ Least recently used entries evicted")
+
+def test_get_parser_and_parse_file_use_cache():
+    """Imports through get_parser and QuoteGenerator.parse_file are cached"""
+    print("🧪 Testing cached imports...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(tmp)
+        path = os.path.join(tmp, 'items.csv')
+        write_csv(path, 250)
+        expected = CSVParser().parse(path)
+        
+        parser = get_parser(path, cache=cache)
+        batches = list(parser.parse_batches(path, 100))
+        assert [item for items, _, _ in batches for item in items] == expected
+        assert cache.size() > 0
+        
+        cached = list(parser.parse_batches(path, 100))
+        assert [done for _, done, _ in cached] == [100, 200, 250]
+        assert [item for items, _, _ in cached for item in items] == expected
+        assert parser.parse(path) == expected
+        assert isinstance(get_parser(path, cache=None), CSVParser)
+        
+        generator = QuoteGenerator()
+        generator.parse_cache = cache
+        first = generator.parse_file(SAMPLE_XML)
+        second = generator.parse_file(SAMPLE_XML)
+        assert first is not second
+        assert first == second == XMLParser.parse(SAMPLE_XML)
+    
+    print("✅ get_parser and parse_file served from the cache")
+
+def run_import(worker):
+    """Start an ImportWorker, wait for it and return its messages"""
+    worker.start().thread.join(timeout=60)
+    assert not worker.thread.is_alive()
+    return worker.poll()
+
+def test_import_worker_reimport_uses_cache():
+    """Re-importing an unchanged file in the desktop app skips the parser"""
+    print("🧪 Testing cached desktop re-import...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(os.path.join(tmp, 'cache'))
+        path = os.path.join(tmp, 'items.csv')
+        write_csv(path, 250)
+        
+        first = run_import(ImportWorker(path, cache=cache))
+        assert first[-1] == ('done', 250)
+        assert len(os.listdir(cache.directory)) == 1
+        
+        def fail(self, file_path, batch_size=100):
+            raise AssertionError("parser called on a cache hit")
+            yield
+        
+        parse_batches = CSVParser.parse_batches
+        CSVParser.parse_batches = fail
+        try:
+            second = run_import(ImportWorker(path, cache=cache))
+        finally:
+            CSVParser.parse_batches = parse_batches
+        assert second == first
+    
+    print("✅ Re-import served from the cache")
+
+def test_cancelled_import_not_cached():
+    """A cancelled ImportWorker leaves nothing in the cache"""
+    print("🧪 Testing cancelled import caching...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(os.path.join(tmp, 'cache'))
+        path = os.path.join(tmp, 'items.csv')
+        write_csv(path, 250)
+        
+        # Cancelled before the first batch is handed over
+        worker = ImportWorker(path, batch_size=10, cache=cache)
+        worker.cancel()
+        assert run_import(worker)[-1] == ('cancelled', 0)
+        assert not os.path.exists(cache.directory) or not os.listdir(cache.directory)
+        assert cache.get(cache.key(path, CSVParser())) is None
+        
+        # The next full import parses again and is cached
+        assert run_import(ImportWorker(path, cache=cache))[-1] == ('done', 250)
+        assert cache.get(cache.key(path, CSVParser())) == CSVParser().parse(path)
+    
+    print("✅ Cancelled import not cached")
+
+if __name__ == "__main__":
+    test_cache_hits_by_content()
+    test_lru_eviction_and_bad_entries()
+    test_get_parser_and_parse_file_use_cache()
+    test_import_worker_reimport_uses_cache()
+    test_cancelled_import_not_cached()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for the PDF description layout cache
+"""
+
+import os
+import tempfile
+
+from reportlab import rl_config
+from reportlab.platypus import Paragraph
+
+from exporters import PDFExporter, ParagraphLayoutCache, describe_item
+from file_parsers import ExcelParser
+from test_streaming_excel_export import build_quote_data
+
+SAMPLE_XLSX = 'ehOnline-Shop_2061348427.xlsx'
+
+def test_layouts_reused_per_text_style_and_width():
+    """Unchanged descriptions are sanitized, parsed and wrapped once"""
+    print("🧪 Testing description layout reuse...")
+    
+    exporter = PDFExporter()
+    cache = ParagraphLayoutCache()
+    parts = describe_item(ExcelParser().parse(SAMPLE_XLSX)[0])
+    
+    first = cache.paragraph(parts, exporter.desc_style, 300, exporter._sanitize_for_pdf)
+    first.wrap(294, 10000)
+    second = cache.paragraph(parts, PDFExporter().desc_style, 300, PDFExporter()._sanitize_for_pdf)
+    assert second.layout is first.layout and len(cache.layouts) == 1
+    
+    # The second paragraph gets the stored line breaks, same as a fresh wrap
+    second.wrap(294, 10000)
+    assert second.blPara is first.blPara
+    plain = Paragraph(first.text, exporter.desc_style)
+    assert plain.wrap(294, 10000) == (294, second.height)
+    
+    # A different width or style is laid out separately
+    cache.paragraph(parts, exporter.desc_style, 250, exporter._sanitize_for_pdf)
+    exporter.desc_style.fontSize = 9
+    cache.paragraph(parts, exporter.desc_style, 300, exporter._sanitize_for_pdf)
+    assert len(cache.layouts) == 3
+    
+    small = ParagraphLayoutCache(maxsize=1)
+    small.paragraph(parts, exporter.desc_style, 300, exporter._sanitize_for_pdf)
+    small.paragraph(parts[:1], exporter.desc_style, 300, exporter._sanitize_for_pdf)
+    assert len(small.layouts) == 1
+    print("✅ Layouts keyed by text, style and width")
+
+def test_cached_exports_are_identical():
+    """Re-exports from a warm cache render the same PDF as a cold one"""
+    print("🧪 Exporting a multi-page quote twice...")
+    
+    quote_data = build_quote_data(ExcelParser().parse(SAMPLE_XLSX) * 10)
+    invariant = rl_config.invariant
+    rl_config.invariant = 1
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            outputs = []
+            PDFExporter.layout_cache.clear()
+            for i in range(2):
+                path = PDFExporter().export_quote(quote_data, os.path.join(tmp, f'q{i}.pdf'))
+                with open(path, 'rb') as f:
+                    outputs.append(f.read())
+    finally:
+        rl_config.invariant = invariant
+    
+    assert outputs[0] == outputs[1]
+    print("✅ Warm cache output matches")
+
+if __name__ == "__main__":
+    test_layouts_reused_per_text_style_and_width()
+    test_cached_exports_are_identical()
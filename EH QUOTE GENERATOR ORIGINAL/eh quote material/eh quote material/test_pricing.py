@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script for the vectorized pricing engine
+"""
+
+import os
+import random
+import tempfile
+import time
+
+import exporters
+from pricing import price_line_items, TAX_RATE
+from test_streaming_excel_export import build_quote_data
+
+def test_single_item_price():
+    """Quoted price is unit price plus tax plus markup, rounded to the cent"""
+    print("🧪 Pricing a single item...")
+    
+    pricing = price_line_items([{'unit_price': 100.0, 'quantity': 3}], 20.0)
+    
+    assert pricing.unit_prices == [129.6]
+    assert pricing.line_totals == [388.8]
+    assert pricing.subtotal == 388.8
+    assert pricing.total == pricing.subtotal
+    print("✅ $100.00 x 3 quoted at $129.60 each, $388.80 total")
+
+def test_defaults_and_rounding():
+    """Missing fields use the exporters' defaults; prices round to the cent"""
+    print("🧪 Checking defaults and rounding...")
+    
+    pricing = price_line_items([{}, {'unit_price': '10'}, {'unit_price': 33.333, 'quantity': 3}], 0.0)
+    
+    assert pricing.unit_prices == [0.0, 10.8, 36.0]
+    assert pricing.line_totals == [0.0, 10.8, 108.0]
+    assert pricing.subtotal == 118.8
+    assert price_line_items([], 20.0).subtotal == 0.0
+    print("✅ Defaults and rounding correct")
+
+def test_views_agree_to_the_cent():
+    """Line totals add up exactly to the subtotal and match unit price x quantity"""
+    print("🧪 Checking that line totals add up to the subtotal...")
+    
+    rng = random.Random(8)
+    items = [
+        {'unit_price': round(rng.uniform(1, 20000), 2), 'quantity': rng.randint(1, 25)}
+        for _ in range(5000)
+    ]
+    pricing = price_line_items(items, 17.5)
+    
+    assert len(pricing) == len(items)
+    cents = [round(total * 100) for total in pricing.line_totals]
+    assert round(pricing.subtotal * 100) == sum(cents)
+    for item, (unit_price, line_total) in zip(items, pricing):
+        assert round(unit_price * 100) * item['quantity'] == round(line_total * 100)
+        expected = item['unit_price'] * (1 + TAX_RATE) * 1.175
+        assert abs(unit_price - expected) <= 0.005 + 1e-9
+    print(f"✅ {len(items)} items agree to the cent, subtotal ${pricing.subtotal:,.2f}")
+
+def test_large_basket_speed():
+    """Pricing a large basket happens in one vectorized step"""
+    print("🧪 Pricing a large basket...")
+    
+    items = [{'unit_price': 4250.0 + i, 'quantity': 2} for i in range(100000)]
+    start = time.perf_counter()
+    pricing = price_line_items(items, 20.0)
+    elapsed = time.perf_counter() - start
+    
+    print(f"   {len(items)} items priced in {elapsed * 1000:.0f}ms")
+    assert len(pricing.line_totals) == len(items)
+    print("✅ Large basket priced")
+
+def test_exports_price_once():
+    """Each export prices the basket once for its line items and totals"""
+    print("🧪 Counting pricing calls per export...")
+    
+    items = [{'description': f'Item {i}', 'unit_price': 99.99 + i, 'quantity': i % 4 + 1} for i in range(50)]
+    quote_data = build_quote_data(items)
+    calls = []
+    
+    def counting_price_line_items(line_items, markup_percentage=20.0, tax_rate=TAX_RATE):
+        calls.append(len(line_items))
+        return price_line_items(line_items, markup_percentage, tax_rate)
+    
+    exporters.price_line_items = counting_price_line_items
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for exporter, suffix in (
+                (exporters.ExcelExporter(), 'xlsx'),
+                (exporters.StreamingExcelExporter(), 'xlsx'),
+                (exporters.PDFExporter(), 'pdf'),
+                (exporters.PageTemplatePDFExporter(), 'pdf'),
+            ):
+                del calls[:]
+                exporter.export_quote(quote_data, os.path.join(tmp, f'quote.{suffix}'))
+                assert calls == [len(items)], (type(exporter).__name__, calls)
+    finally:
+        exporters.price_line_items = price_line_items
+    print("✅ One pricing pass per export")
+
+if __name__ == "__main__":
+    test_single_item_price()
+    test_defaults_and_rounding()
+    test_views_agree_to_the_cent()
+    test_large_basket_speed()
+    test_exports_price_once()
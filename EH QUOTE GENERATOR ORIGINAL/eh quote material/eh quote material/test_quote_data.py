@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for QuoteData dates and expiration
+"""
+
+import os
+import pickle
+import tempfile
+from datetime import date, timedelta
+
+from quote_generator import QuoteData, XMLParser, ExcelParser, parse_date, days_between
+
+SAMPLE_XML = 'ehOnline-Shop_20250905-160419.xml'
+
+def test_parse_date_formats():
+    """Quote dates parse from every supported format, once per string"""
+    print("🧪 Testing date parsing...")
+    
+    assert parse_date('09/05/2025') == date(2025, 9, 5)
+    assert parse_date('2025-09-05') == date(2025, 9, 5)
+    assert parse_date(' 2025-09-05 00:00:00 ') == date(2025, 9, 5)
+    assert parse_date('next week') is None
+    assert days_between('09/05/2025', '2025-09-30') == 25
+    assert days_between('09/05/2025', 'TBD') is None
+    
+    parse_date.cache_clear()
+    for _ in range(100):
+        parse_date('01/15/2025')
+    assert parse_date.cache_info().misses == 1
+    print("✅ Dates parsed and cached")
+
+def test_expiration_is_derived():
+    """Expiration follows the quote date and expiration days"""
+    print("🧪 Testing derived expiration...")
+    
+    data = QuoteData()
+    data.quote_date = '01/15/2025'
+    assert data.quote_dt == date(2025, 1, 15)
+    assert data.expiration == date(2025, 2, 14)
+    
+    data.quote_expiration_days = 45
+    data.calculate_expiration_date()
+    assert data.quote_expiration_date == '03/01/2025'
+    assert data.quote_expiration_dt == date(2025, 3, 1)
+    
+    data.quote_date = 'unknown'
+    assert data.expiration == date.today() + timedelta(days=45)
+    
+    assert ExcelParser._expiration_days('02/14/2025', '2025-01-15 00:00:00') == 30
+    print("✅ Expiration derived from quote date")
+
+def test_slotted_and_picklable():
+    """QuoteData has no per-instance dict and survives pickling"""
+    print("🧪 Testing slotted QuoteData...")
+    
+    data = XMLParser.parse(SAMPLE_XML)
+    assert not hasattr(data, '__dict__')
+    assert pickle.loads(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)) == data
+    assert data.to_dict()['quote_number'] == data.quote_number
+    
+    try:
+        data.notes = 'x'
+        assert False, "unknown attributes should raise"
+    except AttributeError:
+        pass
+    print("✅ QuoteData slotted")
+
+def test_xml_us_dates():
+    """XML baskets with m/d/Y dates get the right expiration days"""
+    print("🧪 Testing XML expiration with US dates...")
+    
+    with open(SAMPLE_XML, 'r', encoding='utf-8') as f:
+        content = f.read()
+    content = content.replace('2025-09-05', '09/05/2025').replace('2025-09-30', '09/30/2025')
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'us_dates.xml')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        data = XMLParser.parse(path)
+    
+    assert data.quote_expiration_days == 25
+    assert data.quote_expiration_date == '09/30/2025'
+    print("✅ US dates read from XML")
+
+if __name__ == "__main__":
+    test_parse_date_formats()
+    test_expiration_is_derived()
+    test_slotted_and_picklable()
+    test_xml_us_dates()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for the Excel line item row height estimator
+"""
+
+import os
+import tempfile
+
+import openpyxl
+
+from exporters import ExcelExporter, describe_item, text_pixel_width, wrapped_line_count
+from file_parsers import ExcelParser
+from test_streaming_excel_export import build_quote_data
+
+SAMPLE_XLSX = 'ehOnline-Shop_2061348427.xlsx'
+
+def test_text_measured_in_pixels():
+    """Arial widths are whole pixels; soft breaks take no space"""
+    print("🧪 Measuring text widths...")
+    
+    # At 9pt (12px) 'a' is 6.7px and a space 3.3px
+    assert text_pixel_width('a', 9.0) == 7
+    assert text_pixel_width(' ', 9.0) == 3
+    assert text_pixel_width('aaaa', 9.0) == 28
+    assert text_pixel_width('W', 9.0) > text_pixel_width('i', 9.0)
+    assert text_pixel_width('a-\u200bb', 9.0) == text_pixel_width('a-b', 9.0)
+    assert text_pixel_width('a', 18.0) == 13
+    print("✅ Widths measured")
+
+def test_wrapping():
+    """Lines break at spaces and soft breaks, and inside over-long words"""
+    print("🧪 Counting wrapped lines...")
+    
+    # 28px words with 3px spaces: three fit in 100px
+    assert wrapped_line_count('aaaa ' * 9, 100, 9.0) == 3
+    assert wrapped_line_count('aaaa ' * 10, 100, 9.0) == 4
+    assert wrapped_line_count('one\n\ntwo', 100, 9.0) == 3
+    assert wrapped_line_count('', 100, 9.0) == 1
+    
+    # A 210px word in a 100px cell
+    assert wrapped_line_count('a' * 30, 100, 9.0) == 3
+    assert wrapped_line_count('aaaa-\u200b' * 6, 100, 9.0) == 2
+    
+    wrapped_line_count.cache_clear()
+    for _ in range(10):
+        wrapped_line_count('aaaa ' * 10, 100, 9.0)
+    assert wrapped_line_count.cache_info().hits == 9
+    print("✅ Lines counted and memoized")
+
+def test_line_item_rows_fit_descriptions():
+    """Item rows are as tall as their wrapped description, within Excel's limit"""
+    print("🧪 Checking exported line item heights...")
+    
+    exporter = ExcelExporter()
+    font = exporter.small_text_font
+    width = exporter.DESCRIPTION_WIDTH_PX
+    assert exporter.text_row_height('Promag W 400', font, width) == exporter.MIN_ROW_HEIGHT
+    assert exporter.text_row_height('x\n' * 200, font, width) == exporter.MAX_ROW_HEIGHT
+    # Ten 16px lines plus padding
+    assert exporter.text_row_height('x\n' * 9 + 'x', font, width) == 123
+    
+    items = ExcelParser().parse(SAMPLE_XLSX)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = exporter.export_quote(build_quote_data(items), os.path.join(tmp, 'quote.xlsx'))
+        ws = openpyxl.load_workbook(path).active
+        for row, item in enumerate(items, 21):
+            description = exporter._soft_breaks("\n\n".join(describe_item(item)))
+            assert ws.row_dimensions[row].height == exporter.text_row_height(description, font, width)
+            assert ws.row_dimensions[row].height <= 409.5
+    print("✅ Line item heights follow their descriptions")
+
+if __name__ == "__main__":
+    test_text_measured_in_pixels()
+    test_wrapping()
+    test_line_item_rows_fit_descriptions()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test script for RTF line item extraction
+"""
+
+import os
+import tempfile
+
+from quote_generator import RTFParser, QuoteData
+from file_parsers import RTFParser as ImportRTFParser
+
+SAMPLE_RTF = 'ehOnline-Shop_2061348427.rtf'
+
+def test_sample_quote_items():
+    """The E+H quote yields its real items, prices and totals"""
+    print("🧪 Parsing sample RTF quote...")
+    
+    data = RTFParser.parse(SAMPLE_RTF)
+    assert data.quote_number == '2061348427'
+    assert data.quote_date == '09/05/2025'
+    assert data.customer_number == '0046207007'
+    
+    assert [item['item_number'] for item in data.line_items] == ['20', '30']
+    first = data.line_items[0]
+    assert first['description'] == 'Micropilot FMR63B'
+    assert (first['quantity'], first['unit']) == (1, 'PC')
+    assert first['material_number'] == 'FMR63B-9XA0/0'
+    assert first['order_code'] == 'FMR63B-CDBADBHJGNTA3HKB+EH'
+    assert (first['unit_price'], first['total_price']) == (4050.83, 4050.83)
+    assert first['config'].startswith('CD Approval: CSA C/US')
+    assert first['delivery_time'] == '11 wrk.day(s)'
+    
+    assert (data.subtotal, data.tax, data.total) == (6927.06, 346.35, 7273.41)
+    print(f"✅ {len(data.line_items)} items, total ${data.total:,.2f}")
+
+def test_single_line_items_without_totals():
+    """Items on one line each are read and totals are computed when missing"""
+    print("🧪 Parsing one-line items...")
+    
+    lines = [
+        'Item QTY Order code',
+        '10 3 PC Cerabar PMC51',
+        'Model no.: PMC51-AA21JA1PGBGRJA1',
+        '1,250.00',
+        '3,750.00',
+        '20 2 EA Liquiphant FTL51',
+        '410.50',
+    ]
+    data = QuoteData()
+    items = RTFParser._parse_line_items(lines, data)
+    
+    assert [(item['description'], item['quantity'], item['unit']) for item in items] == [
+        ('Cerabar PMC51', 3, 'PC'), ('Liquiphant FTL51', 2, 'EA')
+    ]
+    assert items[0]['material_number'] == 'PMC51-AA21JA1PGBGRJA1'
+    assert items[0]['total_price'] == 3750.00
+    assert items[1]['total_price'] == 821.00
+    assert data.subtotal == 0.0
+    print("✅ One-line items parsed")
+
+def test_item_line_detection():
+    """The import parser's item line check uses its compiled pattern"""
+    print("🧪 Checking item line detection...")
+    
+    parser = ImportRTFParser()
+    assert parser.is_item_line('20 1 pc Micropilot FMR63B')
+    assert parser.is_item_line('Model no.: FMR63B-9XA0/0')
+    assert not parser.is_item_line('Country of origin: US')
+    print("✅ Item lines detected")
+
+if __name__ == "__main__":
+    test_sample_quote_items()
+    test_single_line_items_without_totals()
+    test_item_line_detection()
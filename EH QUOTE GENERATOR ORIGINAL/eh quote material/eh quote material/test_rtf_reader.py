@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming RTF reader
+"""
+
+from rtf_reader import iter_rtf_lines, read_rtf_lines
+from quote_generator import RTFParser
+
+SAMPLE_RTF = 'ehOnline-Shop_2061348427.rtf'
+
+def test_sample_quote_text():
+    """The E+H quote reads as clean lines with no control codes or picture data"""
+    print("🧪 Reading sample RTF quote...")
+    
+    lines = [line.strip() for line in read_rtf_lines(SAMPLE_RTF) if line.strip()]
+    assert lines[:3] == ['ENETK LLC', '11085 32E ST SW', 'DICKINSON ND 58601-7810']
+    assert lines[lines.index('Quote no.') + 2] == '2061348427'
+    assert 'Model no.: FMR63B-9XA0/0' in lines
+    assert 'Application: Process temperature -40…150oC/ -40...302oF' in lines
+    assert not any('\\' in line or '{' in line for line in lines)
+    print(f"✅ {len(lines)} text lines")
+
+def test_escapes_and_destinations():
+    """Hex escapes, unicode with fallback text and ignorable groups are handled"""
+    print("🧪 Reading escapes and destinations...")
+    
+    document = (
+        "{\\rtf1\\ansi\\ansicpg1252{\\fonttbl{\\f0 Arial;}}{\\*\\generator Writer;}"
+        "Caf\\'e9 \\u8364?5\\par"
+        "{\\pict 89504e47}\\uc2\\u8212xxdash\\line "
+        "a\\{b\\}\\\\c\\tab d\\~e}"
+    )
+    assert list(iter_rtf_lines([document])) == ['Café €5', '—dash', 'a{b}\\c\td\u00a0e']
+    print("✅ Escapes decoded and destinations skipped")
+
+def test_chunk_size_does_not_matter():
+    """Tokens split across chunk boundaries are read the same"""
+    print("🧪 Reading sample RTF in small chunks...")
+    
+    expected = list(read_rtf_lines(SAMPLE_RTF))
+    for chunk_size in (1, 7, 100):
+        assert list(read_rtf_lines(SAMPLE_RTF, chunk_size=chunk_size)) == expected
+    print("✅ Same lines for every chunk size")
+
+def test_rtf_parser_reads_header():
+    """quote_generator.RTFParser finds header fields in the reader's lines"""
+    print("🧪 Parsing sample RTF quote header...")
+    
+    data = RTFParser.parse(SAMPLE_RTF)
+    assert data.quote_expiration_date == '09/30/2025'
+    print("✅ Header parsed")
+
+if __name__ == "__main__":
+    test_sample_quote_text()
+    test_escapes_and_destinations()
+    test_chunk_size_does_not_matter()
+    test_rtf_parser_reads_header()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for the write-only StreamingExcelExporter
+"""
+
+import os
+import tempfile
+import time
+
+import openpyxl
+
+from exporters import ExcelExporter, StreamingExcelExporter
+from file_parsers import ExcelParser
+
+SAMPLE_XLSX = 'ehOnline-Shop_2061348427.xlsx'
+STYLE_ATTRIBUTES = ['value', 'font', 'fill', 'border', 'alignment', 'number_format', 'protection']
+
+def build_quote_data(line_items):
+    """Quote data in the shape the desktop app passes to the exporters"""
+    return {
+        'quote_number': 'ENETK-TEST-005',
+        'quote_date': '2025-01-15',
+        'project_name': 'Streaming Export Test',
+        'customer_company': 'Kinder Morgan',
+        'contact_person': 'Test Contact',
+        'phone': '(713) 369-9000',
+        'email': 'test@kindermorgan.com',
+        'customer_ref': 'KM-REF-001',
+        'bill_to': '1001 Louisiana St\nHouston, TX 77002',
+        'ship_to': 'Site Warehouse\nPasadena, TX 77506',
+        'markup_percentage': 20.0,
+        'tax_percentage': 8.0,
+        'lead_time_value': 4,
+        'lead_time_unit': 'Weeks',
+        'quote_expiration_date': '02/15/2025',
+        'line_items': line_items
+    }
+
+def compare_workbooks(expected_path, actual_path):
+    """Return a list of differences between two exported quote sheets"""
+    expected = openpyxl.load_workbook(expected_path).active
+    actual = openpyxl.load_workbook(actual_path).active
+    differences = []
+
+    if expected.max_row != actual.max_row:
+        differences.append(f"max_row {expected.max_row} != {actual.max_row}")
+
+    expected_merged = sorted(str(r) for r in expected.merged_cells.ranges)
+    actual_merged = sorted(str(r) for r in actual.merged_cells.ranges)
+    if expected_merged != actual_merged:
+        differences.append("merged ranges differ")
+
+    for col in 'ABCDEF':
+        if expected.column_dimensions[col].width != actual.column_dimensions[col].width:
+            differences.append(f"column {col} width differs")
+
+    for row in range(1, expected.max_row + 1):
+        if expected.row_dimensions[row].height != actual.row_dimensions[row].height:
+            differences.append(f"row {row} height differs")
+        for col in range(1, 7):
+            for attr in STYLE_ATTRIBUTES:
+                # Style proxies only compare equal to their own targets, so compare reprs
+                if repr(getattr(expected.cell(row, col), attr)) != repr(getattr(actual.cell(row, col), attr)):
+                    differences.append(f"{expected.cell(row, col).coordinate} {attr} differs")
+
+    return differences
+
+def test_streaming_matches_regular_export():
+    """Streaming export should look the same as the regular ExcelExporter output"""
+    print("🧪 Comparing streaming and regular Excel export...")
+
+    items = ExcelParser().parse(SAMPLE_XLSX)
+    quote_data = build_quote_data(items)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        regular_path = os.path.join(tmp, 'regular.xlsx')
+        streaming_path = os.path.join(tmp, 'streaming.xlsx')
+        ExcelExporter().export_quote(quote_data, regular_path)
+        StreamingExcelExporter().export_quote(quote_data, streaming_path)
+
+        differences = compare_workbooks(regular_path, streaming_path)
+        assert not differences, differences[:10]
+    print(f"✅ {len(items)} items, every cell, merge and dimension identical")
+
+def test_streaming_large_quote():
+    """A quote with hundreds of items should stream with the same layout"""
+    print("🧪 Exporting a large quote with the streaming exporter...")
+
+    items = ExcelParser().parse(SAMPLE_XLSX) * 100
+    quote_data = build_quote_data(items)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        regular_path = os.path.join(tmp, 'regular.xlsx')
+        streaming_path = os.path.join(tmp, 'streaming.xlsx')
+
+        start = time.perf_counter()
+        ExcelExporter().export_quote(quote_data, regular_path)
+        regular_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        StreamingExcelExporter().export_quote(quote_data, streaming_path)
+        streaming_time = time.perf_counter() - start
+
+        print(f"   Regular export ({len(items)} items):   {regular_time:.2f}s")
+        print(f"   Streaming export ({len(items)} items): {streaming_time:.2f}s")
+
+        differences = compare_workbooks(regular_path, streaming_path)
+        assert not differences, differences[:10]
+    print("✅ Large quote streamed with identical layout")
+
+if __name__ == "__main__":
+    test_streaming_matches_regular_export()
+    test_streaming_large_quote()
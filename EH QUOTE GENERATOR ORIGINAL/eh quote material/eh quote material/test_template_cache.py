@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for the quote template workbook cache
+"""
+
+import os
+import shutil
+import tempfile
+
+import openpyxl
+
+from quote_generator import TemplateCache, QuoteGenerator, QuoteData
+
+TEMPLATE = 'quote_template_simple.xlsx'
+
+def test_template_cache_copies_and_invalidation():
+    """Cached copies are independent and reload when the template changes"""
+    print("🧪 Testing template cache...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        template = os.path.join(tmp, 'template.xlsx')
+        shutil.copy(TEMPLATE, template)
+        
+        cache = TemplateCache()
+        first = cache.get(template)
+        second = cache.get(template)
+        assert first is not second
+        
+        # Editing one copy must not leak into the next one
+        first.active['A1'] = 'changed in memory'
+        assert cache.get(template).active['A1'].value != 'changed in memory'
+        
+        # Rewrite the template on disk with a new mtime
+        workbook = openpyxl.load_workbook(template)
+        workbook.active['A1'] = 'changed on disk'
+        workbook.save(template)
+        stat = os.stat(template)
+        os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert cache.get(template).active['A1'].value == 'changed on disk'
+    
+    print("✅ Template cache returns fresh copies and notices template changes")
+
+def test_generate_quote_with_cached_template():
+    """Repeated generate_quote calls give the same output from the cache"""
+    print("🧪 Testing generate_quote with cached template...")
+    
+    data = QuoteData()
+    data.quote_number = "CACHE-001"
+    data.quote_date = "01/15/2025"
+    data.line_items = [{'item_number': '1', 'quantity': 1, 'unit': 'EA',
+                        'description': 'Cached Product', 'unit_price': 100.0,
+                        'total_price': 100.0}]
+    
+    generator = QuoteGenerator()
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(3):
+            output = generator.generate_quote(data, TEMPLATE, os.path.join(tmp, f'q{i}.xlsx'))
+            ws = openpyxl.load_workbook(output).active
+            assert ws['E2'].value == "CACHE-001"
+            assert ws.cell(row=10, column=4).value == 'Cached Product'
+    
+    print("✅ Cached template quotes generated correctly")
+
+if __name__ == "__main__":
+    test_template_cache_copies_and_invalidation()
+    test_generate_quote_with_cached_template()
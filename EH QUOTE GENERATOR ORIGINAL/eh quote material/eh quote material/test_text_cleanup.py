@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Test script for exporter text cleanup
+"""
+
+from exporters import ExcelExporter, PDFExporter
+
+def test_sanitize_for_pdf():
+    """Problem characters are replaced and anything else non-ASCII dropped"""
+    print("🧪 Testing PDF text sanitizing...")
+    
+    sanitize = PDFExporter()._sanitize_for_pdf
+    assert sanitize('') == '' and sanitize(None) is None
+    assert sanitize('Promag W 400') == 'Promag W 400'
+    assert sanitize('• -40…150°C') == '*  -40...150 degreesC'
+    assert sanitize('“HART”™ – ®') == '"HART" TM -  (R)'
+    assert sanitize('Grüße 中\u200bx') == 'Gre x'
+    assert sanitize('line 1\r\n\tline 2\x00\x0b\x7f') == 'line 1\r\n\tline 2'
+    print("✅ PDF text sanitized")
+
+def test_soft_breaks():
+    """A zero-width space follows each separator"""
+    print("🧪 Testing Excel soft breaks...")
+    
+    soft_breaks = ExcelExporter()._soft_breaks
+    assert soft_breaks('') == ''
+    assert soft_breaks('Promag W 400') == 'Promag W 400'
+    assert soft_breaks('5W4C1H-AA/0 (x+y=z_1:2)') == (
+        '5W4C1H-\u200bAA/\u200b0 (\u200bx+\u200by=\u200bz_\u200b1:\u200b2)\u200b'
+    )
+    print("✅ Soft breaks added")
+
+if __name__ == "__main__":
+    test_sanitize_for_pdf()
+    test_soft_breaks()
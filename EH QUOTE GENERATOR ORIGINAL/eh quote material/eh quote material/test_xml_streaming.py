@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming (iterparse) XML basket parser
+"""
+
+import os
+import tempfile
+import tracemalloc
+
+from quote_generator import XMLParser, QuoteGenerator
+
+SAMPLE_XML = 'ehOnline-Shop_20250905-160419.xml'
+
+def build_large_basket(path, copies):
+    """Write a basket with the sample items repeated `copies` times"""
+    with open(SAMPLE_XML, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    first = content.index('<bas:item ')
+    last = content.rindex('</bas:item>') + len('</bas:item>')
+    items = content[first:last]
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content[:first])
+        for _ in range(copies):
+            f.write(items)
+        f.write(content[last:])
+
+def peak_memory(func, *args):
+    """Return peak traced memory (bytes) while running func"""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def consume(iterator):
+    """Exhaust an iterator without keeping its results"""
+    for _ in iterator:
+        pass
+
+def test_streaming_matches_tree_parser():
+    """Streaming parse should produce the same QuoteData as the tree parser"""
+    print("🧪 Comparing streaming and tree XML parsing...")
+
+    expected = XMLParser.parse(SAMPLE_XML)
+    actual = XMLParser.parse_streaming(SAMPLE_XML)
+
+    assert actual == expected
+    assert len(actual.line_items) == 2
+
+    generator = QuoteGenerator()
+    generator.parse_cache = None
+    assert generator.parse_file(SAMPLE_XML, streaming=True) == expected
+
+    items = list(XMLParser.iter_line_items(SAMPLE_XML))
+    assert items == expected.line_items
+    print(f"✅ {len(items)} items, header and pricing identical")
+
+def test_streaming_memory_stays_flat():
+    """Peak memory of iter_line_items should not grow with the basket size"""
+    print("🧪 Checking streaming parser memory usage...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        small = os.path.join(tmp, 'small.xml')
+        large = os.path.join(tmp, 'large.xml')
+        build_large_basket(small, 50)
+        build_large_basket(large, 500)
+
+        small_peak = peak_memory(lambda: consume(XMLParser.iter_line_items(small)))
+        large_peak = peak_memory(lambda: consume(XMLParser.iter_line_items(large)))
+        tree_peak = peak_memory(XMLParser.parse, large)
+
+        print(f"   Streaming peak (100 items):  {small_peak / 1024:,.0f} KB")
+        print(f"   Streaming peak (1000 items): {large_peak / 1024:,.0f} KB")
+        print(f"   Tree parse peak (1000 items): {tree_peak / 1024:,.0f} KB")
+
+        assert large_peak < small_peak * 2
+        assert large_peak < tree_peak / 4
+    print("✅ Streaming memory stays flat")
+
+if __name__ == "__main__":
+    test_streaming_matches_tree_parser()
+    test_streaming_memory_stays_flat()